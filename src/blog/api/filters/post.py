@@ -1,8 +1,15 @@
+from typing import List
+
 import django_filters
-from django.db import models
-from rest_framework import filters
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import models, connections
+from django.db.models import QuerySet
+from django.db.models.functions import Cast
+
+from blog.models import Post, Subscription
 from common.api import filters as custom_filters
 
+
 class PostFilter(django_filters.FilterSet):
     only_from_me = django_filters.BooleanFilter(
         method="filter_by_only_from_me"
@@ -18,8 +25,22 @@ class PostFilter(django_filters.FilterSet):
     )
 
     def filter_by_search(self, queryset, name, value):
+        if connections[queryset.db].vendor != "postgresql":
+            return queryset.filter(
+                content__icontains=value
+            )
+
+        query = SearchQuery(
+            value,
+            config=Post.SEARCH_CONFIG,
+            search_type="websearch"
+        )
+        # `ts_rank` is a float4, the keyset cursor carries it as a float8. Cast, so the boundary rank
+        # read back from the cursor is equal to the rank of the rows.
         return queryset.filter(
-            content__icontains=value
+            search_vector=query
+        ).annotate(
+            rank=Cast(SearchRank(models.F("search_vector"), query), models.FloatField())
         )
 
 
@@ -36,16 +57,42 @@ class PostOrderingFilter(custom_filters.OrderingFilter):
     def get_default_ordering(self, view):
         return ["from_subscriptions", "-created_at"]
 
+    def get_ordering(self, request, queryset, view):
+        params = request.query_params.get(self.ordering_param)
+        if not params and "rank" in queryset.query.annotations:
+            return ["-rank"]
+        return super().get_ordering(request, queryset, view)
+
     def _get_queryset(self, request, queryset, ordering):
         if "from_subscriptions" in self._used:
             queryset = queryset.annotate(
-                from_subscriptions=models.Case(
-                    models.When(
-                        models.Q(user__subscribers__user_id=request.user.pk),
-                        then=models.Value(1)
-                    ),
-                    default=models.Value(0),
-                    output_field=models.IntegerField()
+                from_subscriptions=models.Exists(
+                    Subscription.objects.filter(
+                        user_id=request.user.pk,
+                        to_user_id=models.OuterRef("user_id")
+                    )
                 )
             )
         return queryset
+
+    @staticmethod
+    def get_querysets(queryset: QuerySet) -> List[QuerySet]:
+        """
+        Split the posts by `from_subscriptions` when the ordering starts with it.
+
+        Sorting by the `Exists` reads every post, each part is read in the order of the remaining keys
+        from the `created_at` index and stops at the page.
+        """
+        ordering = queryset.query.order_by
+        if not ordering or ordering[0].lstrip("-") != "from_subscriptions":
+            return [queryset]
+
+        values = (True, False) if ordering[0].startswith("-") else (False, True)
+        return [
+            queryset.filter(
+                from_subscriptions=value
+            ).annotate(
+                from_subscriptions=models.Value(value)
+            )
+            for value in values
+        ]
@@ -1,6 +1,8 @@
 import django_filters
 from rest_framework import filters
 
+from users.services.search import UserSearchService
+
 
 def _set_default(data, key, value):
     if data is not None:
@@ -30,8 +32,10 @@ class SubscriptionFilter(django_filters.FilterSet):
     )
 
     def filter_by_search(self, queryset, name, value):
-        return queryset.filter(
-            to_user__username=value
+        return UserSearchService.search(
+            queryset,
+            value,
+            field="to_user__username"
         )
 
 
@@ -43,6 +47,12 @@ class SubscriptionOrderingFilter(filters.OrderingFilter):
     def get_default_ordering(self, view):
         return ["-created_at"]
 
+    def get_ordering(self, request, queryset, view):
+        params = request.query_params.get(self.ordering_param)
+        if not params and "similarity" in queryset.query.annotations:
+            return ["-similarity", "-created_at"]
+        return super().get_ordering(request, queryset, view)
+
 
 class SubscriberFilter(django_filters.FilterSet):
 
@@ -64,8 +74,10 @@ class SubscriberFilter(django_filters.FilterSet):
     )
 
     def filter_by_search(self, queryset, name, value):
-        return queryset.filter(
-            user__username=value
+        return UserSearchService.search(
+            queryset,
+            value,
+            field="user__username"
         )
 
 
@@ -15,6 +15,10 @@ urlpatterns.extend([
         "post": "create"
     })),
 
+    path("posts/feed", viewsets.FeedViewSet.as_view({
+        "get": "list",
+    })),
+
     path("posts/<int:pk>", viewsets.PostViewSet.as_view({
         "get": "retrieve",
         "patch": "partial_update",
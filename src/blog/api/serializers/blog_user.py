@@ -8,14 +8,18 @@ class BlogUserSerializer(serializers.ModelSerializer):
     count_subscribers = serializers.SerializerMethodField(method_name="get_count_subscribers")
     count_subscriptions = serializers.SerializerMethodField(method_name="get_count_subscriptions")
 
+    def _get_count(self, user: User, field: str) -> int:
+        stats = getattr(user, "blog_stats", None)
+        return getattr(stats, field) if stats else 0
+
     def get_count_posts(self, user: User) -> int:
-        return user.posts.count()
+        return self._get_count(user, "posts_count")
 
     def get_count_subscribers(self, user: User) -> int:
-        return user.subscribers.count()
+        return self._get_count(user, "subscribers_count")
 
     def get_count_subscriptions(self, user: User) -> int:
-        return user.subscriptions.count()
+        return self._get_count(user, "subscriptions_count")
 
     class Meta:
         model = User
@@ -4,10 +4,7 @@ from blog.models import Post
 
 
 class PostLikesSerializerMixin(metaclass=serializers.SerializerMetaclass):
-    count_likes = serializers.SerializerMethodField(method_name="get_count_likes")
-
-    def get_count_likes(self, post: Post) -> int:
-        return post.likes.count()
+    count_likes = serializers.IntegerField(source="likes_count", read_only=True)
 
 
 class PostListSerializer(PostLikesSerializerMixin,
@@ -40,7 +37,7 @@ class PostUpdateSerializer(serializers.Serializer):
 
     def update(self, post: Post, validated_data):
         post.content = validated_data.get("content", post.content)
-        post.save()
+        post.save(update_fields=["content", "updated_at"])
         return post
 
     def to_representation(self, instance):
@@ -0,0 +1,12 @@
+from typing import Union
+
+from rest_framework import serializers
+
+from blog.api.serializers.post import PostListSerializer
+from blog.models import TimelineItem, AuthorRecentPost
+
+
+class TimelineItemSerializer(serializers.BaseSerializer):
+
+    def to_representation(self, item: Union[TimelineItem, AuthorRecentPost]):
+        return PostListSerializer(item.post, context=self.context).data
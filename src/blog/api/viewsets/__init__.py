@@ -1,4 +1,5 @@
 from .blog_user import BlogUserViewSet
+from .feed import FeedViewSet
 from .post import PostViewSet
 from .post_comment import PostCommentViewSet
 from .post_like import PostLikeViewSet
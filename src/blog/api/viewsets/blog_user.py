@@ -9,7 +9,7 @@ class BlogUserViewSet(viewsets.ModelViewSet):
         permissions.IsAuthenticated,
     ]
 
-    queryset = User.objects
+    queryset = User.objects.select_related("blog_stats")
 
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -0,0 +1,32 @@
+from rest_framework import viewsets, mixins, permissions
+
+from blog.api.serializers.timeline import TimelineItemSerializer
+from blog.models import TimelineItem
+from blog.services import TimelineService
+from common.api import pagination as custom_pagination
+
+
+class FeedPagination(custom_pagination.KeysetPagination):
+    tiebreaker = "post_id"
+
+
+class FeedViewSet(mixins.ListModelMixin,
+                  viewsets.GenericViewSet):
+    permission_classes = [
+        permissions.IsAuthenticated,
+    ]
+
+    pagination_class = FeedPagination
+
+    serializer_class = TimelineItemSerializer
+
+    queryset = TimelineItem.objects
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginator.paginate_querysets(
+            TimelineService.get_feed(request.user),
+            request,
+            view=self
+        )
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
@@ -20,7 +20,7 @@ class PostViewSet(viewsets.ModelViewSet):
         custom_permissions.PostOwnerOrReadOnly
     ]
 
-    pagination_class = custom_pagination.PageCountPagination
+    pagination_class = custom_pagination.PageCountOrKeysetPagination
 
     serializer_class = serializers.Serializer
 
@@ -44,9 +44,23 @@ class PostViewSet(viewsets.ModelViewSet):
         else:
             return self.serializer_class
 
+    def list(self, request, *args, **kwargs):
+        page = self.paginator.paginate_querysets(
+            custom_filters.PostOrderingFilter.get_querysets(self.filter_queryset(self.get_queryset())),
+            request,
+            view=self
+        )
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     def perform_create(self, serializer):
         post = PostService.create(
             user=self.request.user,
             data=serializer.validated_data
         )
         serializer.instance = post
+
+    def perform_destroy(self, instance):
+        PostService.delete(
+            post=instance
+        )
@@ -1,4 +1,4 @@
-from rest_framework import viewsets, permissions, exceptions
+from rest_framework import viewsets, permissions
 
 from blog.api.filters import post_comment as custom_filters
 from blog.api.permissions import post_comment as custom_permissions
@@ -7,32 +7,35 @@ from blog.api.serializers.post_comment import PostCommentListSerializer, PostCom
 from blog.models import Post, PostComment
 from blog.services import PostCommentService
 from common.api import pagination as custom_pagination
+from common.api.mixins import ParentObjectMixin
 
 
-class PostCommentViewSet(viewsets.ModelViewSet):
+class PostCommentViewSet(ParentObjectMixin,
+                         viewsets.ModelViewSet):
     permission_classes = [
         permissions.IsAuthenticated,
         custom_permissions.PostNoOwnerOrReadOnly,
         custom_permissions.PostCommentOwnerOrReadOnly,
     ]
 
-    pagination_class = custom_pagination.PageCountPagination
+    pagination_class = custom_pagination.PageCountOrKeysetPagination
 
     queryset = PostComment.objects
 
+    parent_queryset = Post.objects
+
+    parent_lookup_url_kwarg = "post_id"
+
     filter_backends = [
         custom_filters.PostCommentOrderingFilter
     ]
 
-    def get_post(self):
-        post = Post.objects.filter(id=self.kwargs.get("post_id")).first()
-        if not post:
-            raise exceptions.NotFound
-        return post
+    def get_post(self) -> Post:
+        return self.get_parent()
 
     def get_queryset(self):
         post = self.get_post()
-        return post.comments.all()
+        return post.comments.select_related("user")
 
     def get_serializer_class(self):
         if self.action == "list":
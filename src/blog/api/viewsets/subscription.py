@@ -18,7 +18,7 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
         permissions.IsAuthenticated,
     ]
 
-    pagination_class = custom_pagination.PageCountPagination
+    pagination_class = custom_pagination.PageCountOrKeysetPagination
 
     serializer_class = serializers.Serializer
 
@@ -60,7 +60,7 @@ class SubscriberViewSet(viewsets.ModelViewSet):
         permissions.IsAuthenticated,
     ]
 
-    pagination_class = custom_pagination.PageCountPagination
+    pagination_class = custom_pagination.PageCountOrKeysetPagination
 
     serializer_class = serializers.Serializer
 
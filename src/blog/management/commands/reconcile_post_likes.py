@@ -0,0 +1,54 @@
+from django.core.management import BaseCommand
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+
+from blog.models import Post, PostLike
+
+
+class Command(BaseCommand):
+    help = "Reconcile the denormalized likes counter of posts"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of posts checked in one transaction."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        actual = Coalesce(
+            models.Subquery(
+                PostLike.objects.filter(
+                    post_id=models.OuterRef("pk")
+                ).order_by().values("post_id").annotate(
+                    count=models.Count("id")
+                ).values("count")
+            ),
+            0
+        )
+
+        last_id = 0
+        reconciled = 0
+        while True:
+            ids = list(Post.objects.filter(
+                id__gt=last_id
+            ).order_by("id").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+
+            with transaction.atomic():
+                reconciled += Post.objects.filter(
+                    id__in=ids
+                ).alias(
+                    actual_likes_count=actual
+                ).exclude(
+                    likes_count=models.F("actual_likes_count")
+                ).update(
+                    likes_count=actual
+                )
+            last_id = ids[-1]
+
+        self.stdout.write(f"Reconciled posts: {reconciled}.")
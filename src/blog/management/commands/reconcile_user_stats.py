@@ -0,0 +1,70 @@
+from django.core.management import BaseCommand
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+
+from blog.models import Post, Subscription, UserStats
+from users.models import User
+
+
+def _count(queryset, field):
+    return Coalesce(
+        models.Subquery(
+            queryset.filter(
+                **{field: models.OuterRef("user_id")}
+            ).order_by().values(field).annotate(
+                count=models.Count("id")
+            ).values("count")
+        ),
+        0
+    )
+
+
+class Command(BaseCommand):
+    help = "Reconcile the denormalized blog counters of users"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users checked in one transaction."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        actual = {
+            "posts_count": _count(Post.objects, "user_id"),
+            "subscribers_count": _count(Subscription.objects, "to_user_id"),
+            "subscriptions_count": _count(Subscription.objects, "user_id"),
+        }
+
+        last_id = 0
+        reconciled = 0
+        while True:
+            ids = list(User.objects.filter(
+                id__gt=last_id
+            ).order_by("id").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+
+            with transaction.atomic():
+                UserStats.objects.bulk_create([
+                    UserStats(user_id=user_id)
+                    for user_id in ids
+                ], ignore_conflicts=True)
+
+                reconciled += UserStats.objects.filter(
+                    user_id__in=ids
+                ).alias(
+                    **{f"actual_{field}": value for field, value in actual.items()}
+                ).exclude(
+                    posts_count=models.F("actual_posts_count"),
+                    subscribers_count=models.F("actual_subscribers_count"),
+                    subscriptions_count=models.F("actual_subscriptions_count")
+                ).update(
+                    **actual
+                )
+            last_id = ids[-1]
+
+        self.stdout.write(f"Reconciled users: {reconciled}.")
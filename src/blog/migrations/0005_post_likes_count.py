@@ -0,0 +1,31 @@
+# Generated by Django 5.0.3 on 2026-10-18 08:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_subscription'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='likes count'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE blog_post
+                SET likes_count = likes.count
+                FROM (
+                    SELECT post_id, COUNT(*) AS count
+                    FROM blog_postlike
+                    GROUP BY post_id
+                ) AS likes
+                WHERE blog_post.id = likes.post_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
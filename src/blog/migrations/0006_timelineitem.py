@@ -0,0 +1,43 @@
+# Generated by Django 5.0.3 on 2026-10-18 08:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_likes_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimelineItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(verbose_name='post creation date')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_items', to=settings.AUTH_USER_MODEL, verbose_name='owner')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_items', to='blog.post', verbose_name='post')),
+            ],
+            options={
+                'verbose_name': 'Timeline item',
+                'verbose_name_plural': 'Timeline items',
+                'indexes': [models.Index(fields=['owner', '-created_at', '-post'], include=('id',), name='blog_timeline_owner_feed_idx')],
+                'unique_together': {('owner', 'post')},
+            },
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO blog_timelineitem (owner_id, post_id, created_at)
+                SELECT blog_post.user_id, blog_post.id, blog_post.created_at
+                FROM blog_post
+                UNION ALL
+                SELECT blog_subscription.user_id, blog_post.id, blog_post.created_at
+                FROM blog_post
+                INNER JOIN blog_subscription ON blog_subscription.to_user_id = blog_post.user_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
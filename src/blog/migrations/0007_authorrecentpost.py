@@ -0,0 +1,31 @@
+# Generated by Django 5.0.3 on 2026-10-18 08:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_timelineitem'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthorRecentPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(verbose_name='post creation date')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recent_posts', to=settings.AUTH_USER_MODEL, verbose_name='author')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='blog.post', verbose_name='post')),
+            ],
+            options={
+                'verbose_name': 'Author recent post',
+                'verbose_name_plural': 'Author recent posts',
+                'indexes': [models.Index(fields=['author', '-created_at', '-post'], include=('id',), name='blog_recent_author_feed_idx')],
+                'unique_together': {('author', 'post')},
+            },
+        ),
+    ]
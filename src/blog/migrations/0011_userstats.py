@@ -0,0 +1,41 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_list_indexes'),
+        ('users', '0003_username_trgm_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='blog_stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='user')),
+                ('posts_count', models.PositiveIntegerField(default=0, verbose_name='posts count')),
+                ('subscribers_count', models.PositiveIntegerField(default=0, verbose_name='subscribers count')),
+                ('subscriptions_count', models.PositiveIntegerField(default=0, verbose_name='subscriptions count')),
+            ],
+            options={
+                'verbose_name': 'User stats',
+                'verbose_name_plural': 'User stats',
+            },
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO blog_userstats (user_id, posts_count, subscribers_count, subscriptions_count)
+                SELECT
+                    users_user.id,
+                    (SELECT COUNT(*) FROM blog_post WHERE blog_post.user_id = users_user.id),
+                    (SELECT COUNT(*) FROM blog_subscription WHERE blog_subscription.to_user_id = users_user.id),
+                    (SELECT COUNT(*) FROM blog_subscription WHERE blog_subscription.user_id = users_user.id)
+                FROM users_user
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-18 10:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_userstats'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='subscription',
+            name='blog_subscription_user_to_idx',
+        ),
+    ]
@@ -1,4 +1,7 @@
+from .author_recent_post import AuthorRecentPost
 from .post import Post
 from .post_comment import PostComment
 from .post_like import PostLike
 from .subscription import Subscription
+from .timeline_item import TimelineItem
+from .user_stats import UserStats
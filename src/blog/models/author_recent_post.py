@@ -0,0 +1,44 @@
+from django.db import models
+
+
+class AuthorRecentPost(models.Model):
+    """
+    The most recent posts of an author whose posts are not pushed to the timelines of the subscribers,
+    they are merged into the feed at read time.
+    """
+    author = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        verbose_name="author",
+        related_name="recent_posts"
+    )
+
+    post = models.ForeignKey(
+        "blog.Post",
+        on_delete=models.CASCADE,
+        verbose_name="post",
+        related_name="+"
+    )
+
+    created_at = models.DateTimeField(
+        verbose_name="post creation date",
+    )
+
+    class Meta:
+        verbose_name = "Author recent post"
+        verbose_name_plural = "Author recent posts"
+
+        unique_together = (
+            (
+                "author",
+                "post"
+            )
+        )
+
+        indexes = [
+            models.Index(
+                fields=["author", "-created_at", "-post"],
+                include=["id"],
+                name="blog_recent_author_feed_idx"
+            ),
+        ]
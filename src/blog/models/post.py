@@ -1,19 +1,37 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 
 
 class Post(models.Model):
+    # Text search configuration of `search_vector`, it is frozen in the migrations,
+    # so changing it requires a migration that regenerates the column.
+    SEARCH_CONFIG = "english"
 
     user = models.ForeignKey(
         "users.User",
         on_delete=models.PROTECT,
         verbose_name="user",
-        related_name="posts"
+        related_name="posts",
+        db_index=False
     )
 
     content = models.CharField(
         max_length=500
     )
 
+    search_vector = models.GeneratedField(
+        expression=SearchVector("content", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        verbose_name="search vector"
+    )
+
+    likes_count = models.PositiveIntegerField(
+        verbose_name="likes count",
+        default=0
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
@@ -25,3 +43,18 @@ class Post(models.Model):
     class Meta:
         verbose_name = "Post"
         verbose_name_plural = "Posts"
+
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="blog_post_user_created_idx"
+            ),
+            models.Index(
+                fields=["-created_at"],
+                name="blog_post_created_at_idx"
+            ),
+            GinIndex(
+                fields=["search_vector"],
+                name="blog_post_search_vector_idx"
+            ),
+        ]
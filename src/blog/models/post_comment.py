@@ -13,7 +13,8 @@ class PostComment(models.Model):
         "blog.Post",
         on_delete=models.CASCADE,
         verbose_name="post",
-        related_name="comments"
+        related_name="comments",
+        db_index=False
     )
 
     comment = models.TextField(
@@ -31,3 +32,10 @@ class PostComment(models.Model):
     class Meta:
         verbose_name = "Post comment"
         verbose_name_plural = "Post comments"
+
+        indexes = [
+            models.Index(
+                fields=["post", "-created_at", "-id"],
+                name="blog_comment_post_created_idx"
+            ),
+        ]
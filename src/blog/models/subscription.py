@@ -6,14 +6,16 @@ class Subscription(models.Model):
         "users.User",
         on_delete=models.CASCADE,
         verbose_name="user",
-        related_name="subscribers"
+        related_name="subscribers",
+        db_index=False
     )
 
     user = models.ForeignKey(
         "users.User",
         on_delete=models.CASCADE,
         verbose_name="user",
-        related_name="subscriptions"
+        related_name="subscriptions",
+        db_index=False
     )
 
     created_at = models.DateTimeField(
@@ -30,3 +32,14 @@ class Subscription(models.Model):
                 "user"
             )
         )
+
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="blog_subscription_user_idx"
+            ),
+            models.Index(
+                fields=["to_user", "-created_at", "-id"],
+                name="blog_subscription_to_user_idx"
+            ),
+        ]
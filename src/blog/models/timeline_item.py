@@ -0,0 +1,43 @@
+from django.db import models
+
+
+class TimelineItem(models.Model):
+    """
+    Materialized home timeline entry, the `post` is shown in the feed of the `owner`.
+    """
+    owner = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        verbose_name="owner",
+        related_name="timeline_items"
+    )
+
+    post = models.ForeignKey(
+        "blog.Post",
+        on_delete=models.CASCADE,
+        verbose_name="post",
+        related_name="timeline_items"
+    )
+
+    created_at = models.DateTimeField(
+        verbose_name="post creation date",
+    )
+
+    class Meta:
+        verbose_name = "Timeline item"
+        verbose_name_plural = "Timeline items"
+
+        unique_together = (
+            (
+                "owner",
+                "post"
+            )
+        )
+
+        indexes = [
+            models.Index(
+                fields=["owner", "-created_at", "-post"],
+                include=["id"],
+                name="blog_timeline_owner_feed_idx"
+            ),
+        ]
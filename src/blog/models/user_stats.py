@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class UserStats(models.Model):
+    """
+    Denormalized blog counters of the user, kept up to date by the blog services.
+    The row is created on the first change, a missing row means zero counters.
+    """
+    user = models.OneToOneField(
+        "users.User",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        verbose_name="user",
+        related_name="blog_stats"
+    )
+
+    posts_count = models.PositiveIntegerField(
+        verbose_name="posts count",
+        default=0
+    )
+
+    subscribers_count = models.PositiveIntegerField(
+        verbose_name="subscribers count",
+        default=0
+    )
+
+    subscriptions_count = models.PositiveIntegerField(
+        verbose_name="subscriptions count",
+        default=0
+    )
+
+    class Meta:
+        verbose_name = "User stats"
+        verbose_name_plural = "User stats"
@@ -1,3 +1,5 @@
 from .post import PostService
 from .post_comment import PostCommentService
 from .subscription import SubscriptionService
+from .timeline import TimelineService
+from .user_stats import UserStatsService
@@ -1,4 +1,8 @@
+from django.db import transaction
+
 from blog.models import Post
+from blog.services.timeline import TimelineService
+from blog.services.user_stats import UserStatsService
 from notifications import Handler as NotificationsHandler
 from users.models import User
 
@@ -8,25 +12,37 @@ class PostService:
     @staticmethod
     def create(user: User,
                data: dict) -> Post:
-        post = Post.objects.create(
-            user_id=user.pk,
-            content=data["content"]
-        )
+        with transaction.atomic():
+            post = Post.objects.create(
+                user_id=user.pk,
+                content=data["content"]
+            )
+            TimelineService.push(post)
+            UserStatsService.update({
+                user.pk: {"posts_count": 1}
+            })
 
-        subscriber_user_ids = list(user.subscribers.order_by("user_id").values_list("user_id", flat=True))
-        if len(subscriber_user_ids):
-            NotificationsHandler.accept(
-                action="BLOG_POSTS_NEW",
-                data={
-                    "post": {
-                        "id": post.pk,
-                        "user": {
-                            "id": user.pk,
-                            "username": user.username
+            # The job is written in the transaction of the post, so the fan-out is not lost on a crash.
+            if user.subscribers.exists():
+                NotificationsHandler.accept(
+                    action="BLOG_POSTS_NEW",
+                    data={
+                        "post": {
+                            "id": post.pk,
+                            "user": {
+                                "id": user.pk,
+                                "username": user.username
+                            }
                         }
-                    },
-                    "to_user_ids": subscriber_user_ids
-                }
-            )
+                    }
+                )
 
         return post
+
+    @staticmethod
+    def delete(post: Post) -> None:
+        with transaction.atomic():
+            post.delete()
+            UserStatsService.update({
+                post.user_id: {"posts_count": -1}
+            })
@@ -1,3 +1,5 @@
+from django.db import transaction
+
 from blog.models import PostComment, Post
 from notifications import Handler as NotificationsHandler
 from users.models import User
@@ -9,24 +11,26 @@ class PostCommentService:
     def create(post: Post,
                user: User,
                data: dict) -> PostComment:
-        post_comment = PostComment.objects.create(
-            post_id=post.pk,
-            user_id=user.pk,
-            comment=data["comment"]
-        )
+        with transaction.atomic():
+            post_comment = PostComment.objects.create(
+                post=post,
+                user=user,
+                comment=data["comment"]
+            )
 
-        NotificationsHandler.accept(
-            action="BLOG_POSTS_NEW_COMMENT",
-            data={
-                "post": {
-                    "id": post.pk,
-                    "user_id": post.user_id
-                },
-                "from_user": {
-                    "id": user.pk
+            NotificationsHandler.accept(
+                action="BLOG_POSTS_NEW_COMMENT",
+                data={
+                    "post": {
+                        "id": post.pk,
+                        "user_id": post.user_id
+                    },
+                    "from_user": {
+                        "id": user.pk
+                    }
                 }
-            }
-        )
+            )
+
         return post_comment
 
     @staticmethod
@@ -1,3 +1,4 @@
+from django.db import models, transaction
 from rest_framework import exceptions
 
 from blog.models import Post, PostLike
@@ -13,44 +14,52 @@ class PostLikeService:
         if post.likes.filter(user_id=user.pk).exists():
             raise exceptions.PermissionDenied
 
-        PostLike.objects.create(
-            user_id=user.pk,
-            post_id=post.pk
-        )
-
-        NotificationsHandler.accept(
-            action="BLOG_POSTS_LIKE",
-            data={
-                "post": {
-                    "id": post.pk,
-                    "user_id": post.user_id
-                },
-                "from_user": {
-                    "id": user.pk
+        with transaction.atomic():
+            PostLike.objects.create(
+                user_id=user.pk,
+                post_id=post.pk
+            )
+            Post.objects.filter(id=post.pk).update(
+                likes_count=models.F("likes_count") + 1
+            )
+
+            NotificationsHandler.accept(
+                action="BLOG_POSTS_LIKE",
+                data={
+                    "post": {
+                        "id": post.pk,
+                        "user_id": post.user_id
+                    },
+                    "from_user": {
+                        "id": user.pk
+                    }
                 }
-            }
-        )
+            )
 
     @staticmethod
     def remove_like(post: Post,
                     user: User):
-        if not post.likes.filter(user_id=user.pk).exists():
-            raise exceptions.NotFound
-
-        PostLike.objects.filter(
-            user_id=user.pk,
-            post_id=post.pk
-        ).delete()
-
-        NotificationsHandler.accept(
-            action="BLOG_POSTS_LIKE_REMOVE",
-            data={
-                "post": {
-                    "id": post.pk,
-                    "user_id": post.user_id
-                },
-                "from_user": {
-                    "id": user.pk
+        with transaction.atomic():
+            deleted, _ = PostLike.objects.filter(
+                user_id=user.pk,
+                post_id=post.pk
+            ).delete()
+            if not deleted:
+                raise exceptions.NotFound
+
+            Post.objects.filter(id=post.pk).update(
+                likes_count=models.F("likes_count") - deleted
+            )
+
+            NotificationsHandler.accept(
+                action="BLOG_POSTS_LIKE_REMOVE",
+                data={
+                    "post": {
+                        "id": post.pk,
+                        "user_id": post.user_id
+                    },
+                    "from_user": {
+                        "id": user.pk
+                    }
                 }
-            }
-        )
+            )
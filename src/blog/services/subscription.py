@@ -1,6 +1,9 @@
+from django.db import transaction
 from rest_framework import exceptions
 
 from blog.models import Subscription
+from blog.services.timeline import TimelineService
+from blog.services.user_stats import UserStatsService
 from notifications import Handler as NotificationsHandler
 from users.models import User
 
@@ -20,23 +23,29 @@ class SubscriptionService:
         if Subscription.objects.filter(to_user_id=to_user.pk, user_id=user.pk).exists():
             raise exceptions.PermissionDenied(detail="You have already subscribed.")
 
-        subscription = Subscription.objects.create(
-            to_user_id=to_user.pk,
-            user_id=user.pk
-        )
-
-        NotificationsHandler.accept(
-            action="BLOG_SUBSCRIPTIONS_NEW",
-            data={
-                "to_user": {
-                    "id": to_user.pk,
-                },
-                "from_user": {
-                    "id": user.pk,
-                    "username": user.username
+        with transaction.atomic():
+            subscription = Subscription.objects.create(
+                to_user_id=to_user.pk,
+                user_id=user.pk
+            )
+            TimelineService.backfill(user, to_user)
+            UserStatsService.update({
+                user.pk: {"subscriptions_count": 1},
+                to_user.pk: {"subscribers_count": 1}
+            })
+
+            NotificationsHandler.accept(
+                action="BLOG_SUBSCRIPTIONS_NEW",
+                data={
+                    "to_user": {
+                        "id": to_user.pk,
+                    },
+                    "from_user": {
+                        "id": user.pk,
+                        "username": user.username
+                    }
                 }
-            }
-        )
+            )
 
         return subscription
 
@@ -46,4 +55,10 @@ class SubscriptionService:
         if subscription.user_id != user.pk:
             raise exceptions.PermissionDenied
 
-        subscription.delete()
+        with transaction.atomic():
+            TimelineService.prune(user, subscription.to_user_id)
+            subscription.delete()
+            UserStatsService.update({
+                user.pk: {"subscriptions_count": -1},
+                subscription.to_user_id: {"subscribers_count": -1}
+            })
@@ -0,0 +1,150 @@
+from typing import List
+
+from django.conf import settings
+from django.db import models
+
+from blog.models import AuthorRecentPost, Post, Subscription, TimelineItem
+from common.utils import chunked
+from users.models import User
+
+
+class TimelineService:
+    """
+    Hybrid feed.
+
+    Posts are pushed to the timelines of the subscribers at creation time, unless the author
+    has at least `BLOG_TIMELINE_PUSH_THRESHOLD` subscribers. Posts of such authors are kept
+    in the author's recent posts and pulled into the feed at read time.
+    """
+
+    @staticmethod
+    def _check_pulled(user_id: int) -> bool:
+        """
+        Once an author is pulled, they stay pulled: their new posts are not in the timelines.
+        When the threshold is reached, the recent posts of the author are copied to `AuthorRecentPost`.
+        """
+        if AuthorRecentPost.objects.filter(author_id=user_id).exists():
+            return True
+
+        threshold = settings.BLOG_TIMELINE_PUSH_THRESHOLD
+        if Subscription.objects.filter(to_user_id=user_id)[:threshold].count() < threshold:
+            return False
+
+        posts = Post.objects.filter(
+            user_id=user_id
+        ).order_by("-created_at").values_list("id", "created_at")[:settings.BLOG_TIMELINE_RECENT_POSTS_SIZE]
+
+        AuthorRecentPost.objects.bulk_create([
+            AuthorRecentPost(
+                author_id=user_id,
+                post_id=post_id,
+                created_at=created_at
+            )
+            for post_id, created_at in posts
+        ], ignore_conflicts=True)
+        return True
+
+    @staticmethod
+    def push(post: Post) -> None:
+        TimelineItem.objects.create(
+            owner_id=post.user_id,
+            post_id=post.pk,
+            created_at=post.created_at
+        )
+
+        if TimelineService._check_pulled(post.user_id):
+            TimelineService._push_recent(post)
+        else:
+            TimelineService._fan_out(post)
+
+    @staticmethod
+    def _fan_out(post: Post) -> None:
+        batch_size = settings.BLOG_TIMELINE_BATCH_SIZE
+        subscriber_user_ids = Subscription.objects.filter(
+            to_user_id=post.user_id
+        ).order_by("user_id").values_list("user_id", flat=True).iterator(chunk_size=batch_size)
+
+        for user_ids in chunked(subscriber_user_ids, batch_size):
+            TimelineItem.objects.bulk_create([
+                TimelineItem(
+                    owner_id=user_id,
+                    post_id=post.pk,
+                    created_at=post.created_at
+                )
+                for user_id in user_ids
+            ], ignore_conflicts=True)
+
+    @staticmethod
+    def _push_recent(post: Post) -> None:
+        # The post is already there if the author has just been seeded by `_check_pulled`.
+        AuthorRecentPost.objects.bulk_create([
+            AuthorRecentPost(
+                author_id=post.user_id,
+                post_id=post.pk,
+                created_at=post.created_at
+            )
+        ], ignore_conflicts=True)
+
+        AuthorRecentPost.objects.filter(
+            id__in=AuthorRecentPost.objects.filter(
+                author_id=post.user_id
+            ).order_by(
+                "-created_at",
+                "-post_id"
+            ).values("id")[settings.BLOG_TIMELINE_RECENT_POSTS_SIZE:]
+        ).delete()
+
+    @staticmethod
+    def backfill(user: User,
+                 to_user: User) -> None:
+        if TimelineService._check_pulled(to_user.pk):
+            return
+
+        posts = Post.objects.filter(
+            user_id=to_user.pk
+        ).order_by("-created_at").values_list("id", "created_at")[:settings.BLOG_TIMELINE_BACKFILL_SIZE]
+
+        TimelineItem.objects.bulk_create([
+            TimelineItem(
+                owner_id=user.pk,
+                post_id=post_id,
+                created_at=created_at
+            )
+            for post_id, created_at in posts
+        ], ignore_conflicts=True)
+
+    @staticmethod
+    def prune(user: User,
+              to_user_id: int) -> None:
+        TimelineItem.objects.filter(
+            owner_id=user.pk,
+            post__user_id=to_user_id
+        ).delete()
+
+    @staticmethod
+    def get_feed(user: User) -> List[models.QuerySet]:
+        """
+        Sources of the feed, to be merged by `created_at`.
+        Only the columns of the covering indexes are read, posts are fetched by primary key.
+        """
+        pushed = TimelineItem.objects.filter(
+            owner_id=user.pk
+        )
+        pulled = AuthorRecentPost.objects.filter(
+            author_id__in=Subscription.objects.filter(
+                user_id=user.pk
+            ).values("to_user_id")
+        )
+        return [
+            queryset.only(
+                "id",
+                "created_at",
+                "post_id"
+            ).prefetch_related(
+                "post"
+            ).order_by(
+                "-created_at",
+                "-post_id"
+            )
+            for queryset in (pushed, pulled)
+        ]
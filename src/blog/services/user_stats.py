@@ -0,0 +1,27 @@
+from typing import Dict
+
+from django.db import models
+from django.db.models.functions import Greatest
+
+from blog.models import UserStats
+
+
+class UserStatsService:
+
+    @staticmethod
+    def update(deltas: Dict[int, Dict[str, int]]) -> None:
+        """
+        Apply the counter deltas by user id, must be called in the transaction of the change.
+        Rows are locked in the order of user ids, so concurrent changes do not deadlock.
+        """
+        user_ids = sorted(deltas)
+        UserStats.objects.bulk_create([
+            UserStats(user_id=user_id)
+            for user_id in user_ids
+        ], ignore_conflicts=True)
+
+        for user_id in user_ids:
+            UserStats.objects.filter(user_id=user_id).update(**{
+                field: Greatest(models.F(field) + delta, 0)
+                for field, delta in deltas[user_id].items()
+            })
@@ -1,12 +1,18 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from blog.models import Post, Subscription
+from blog.models import Post, Subscription, UserStats
+from blog.services import PostService, SubscriptionService
+from common.tests.mixins import MockTestCaseMixin
 from users.models import User
 
 
-class _BaseTestCase(APITestCase):
+class _BaseTestCase(APITestCase,
+                    MockTestCaseMixin):
 
     @classmethod
     def setUpTestData(cls):
@@ -38,9 +44,13 @@ class _BaseTestCase(APITestCase):
 
         Subscription.objects.create(to_user_id=cls.user_3.pk, user_id=cls.user_1.pk)
 
+        call_command("reconcile_user_stats", stdout=StringIO())
+
     def setUp(self) -> None:
         super().setUp()
 
+        self._mock("notifications.entrypoint.Handler.accept")
+
         self.client.force_authenticate(user=self.user_3, token=str(RefreshToken.for_user(self.user_3).access_token))
 
         self.url = f"/api/v1/blog/users/{self.user_1.pk}"
@@ -76,51 +86,90 @@ class BlogUserRetrieveAPITestCase(_BaseTestCase):
         self.assertEqual(resp.status_code, 401)
         self.assertEqual(str(resp.data["detail"]), "Authentication credentials were not provided.")
 
+    def test_num_queries(self):
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+    def test_without_stats(self):
+        user_4 = User.objects.create_user(email="test-4@gmail.com", username="test-4")
+
+        resp = self.client.get(f"/api/v1/blog/users/{user_4.pk}")
+        self.assertEqual(resp.data["count_posts"], 0)
+        self.assertEqual(resp.data["count_subscribers"], 0)
+        self.assertEqual(resp.data["count_subscriptions"], 0)
+
     def test_count_posts(self):
-        Post.objects.create(user_id=self.user_3.pk, content=f"sample-post-1")
+        PostService.create(user=self.user_3, data={"content": "sample-post-1"})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_posts"], 5)
 
-        Post.objects.create(user_id=self.user_1.pk, content=f"sample-post-1")
+        post = PostService.create(user=self.user_1, data={"content": "sample-post-1"})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_posts"], 6)
 
+        PostService.delete(post=post)
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data["count_posts"], 5)
+
     def test_count_subscribers(self):
         user_4 = User.objects.create_user(email="test-4@gmail.com", username="test-4")
         user_5 = User.objects.create_user(email="test-5@gmail.com", username="test-5")
 
-        Subscription.objects.create(to_user_id=user_4.pk, user_id=user_5.pk)
+        SubscriptionService.create(user=user_5, data={"to_user_id": user_4.pk})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_subscribers"], 2)
 
-        Subscription.objects.create(to_user_id=user_5.pk, user_id=self.user_1.pk)
+        SubscriptionService.create(user=self.user_1, data={"to_user_id": user_5.pk})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_subscribers"], 2)
 
-        Subscription.objects.create(to_user_id=self.user_1.pk, user_id=user_5.pk)
+        subscription = SubscriptionService.create(user=user_5, data={"to_user_id": self.user_1.pk})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_subscribers"], 3)
 
+        SubscriptionService.delete(user=user_5, subscription=subscription)
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data["count_subscribers"], 2)
+
     def test_count_subscriptions(self):
         user_4 = User.objects.create_user(email="test-4@gmail.com", username="test-4")
         user_5 = User.objects.create_user(email="test-5@gmail.com", username="test-5")
 
-        Subscription.objects.create(to_user_id=user_4.pk, user_id=user_5.pk)
+        SubscriptionService.create(user=user_5, data={"to_user_id": user_4.pk})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_subscriptions"], 1)
 
-        Subscription.objects.create(to_user_id=self.user_1.pk, user_id=user_5.pk)
+        SubscriptionService.create(user=user_5, data={"to_user_id": self.user_1.pk})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_subscriptions"], 1)
 
-        Subscription.objects.create(to_user_id=user_5.pk, user_id=self.user_1.pk)
+        subscription = SubscriptionService.create(user=self.user_1, data={"to_user_id": user_5.pk})
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["count_subscriptions"], 2)
+
+        SubscriptionService.delete(user=self.user_1, subscription=subscription)
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data["count_subscriptions"], 1)
+
+    def test_reconcile(self):
+        UserStats.objects.filter(user_id=self.user_1.pk).update(posts_count=100, subscribers_count=0)
+
+        out = StringIO()
+        call_command("reconcile_user_stats", stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Reconciled users: 1.")
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data["count_posts"], 5)
+        self.assertEqual(resp.data["count_subscribers"], 2)
@@ -0,0 +1,184 @@
+from django.test import tag, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from blog.models import AuthorRecentPost, Post, Subscription, TimelineItem
+from blog.services import PostService, SubscriptionService
+from common.tests.mixins import MockTestCaseMixin
+from users.models import User
+
+
+class _BaseTestCase(APITestCase,
+                    MockTestCaseMixin):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user_1 = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+        cls.user_2 = User.objects.create_user(email="test-2@gmail.com", username="test-2")
+        cls.user_3 = User.objects.create_user(email="test-3@gmail.com", username="test-3")
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.notifications_accept_mock = self._mock(
+            "notifications.entrypoint.Handler.accept"
+        )
+
+        SubscriptionService.create(user=self.user_1, data={"to_user_id": self.user_2.pk})
+        for user in [self.user_1, self.user_2, self.user_3]:
+            for i in range(0, 5):
+                PostService.create(user=user, data={"content": f"sample-{i}-{user.pk}"})
+
+        self.client.force_authenticate(user=self.user_1, token=str(RefreshToken.for_user(self.user_1).access_token))
+
+        self.url = "/api/v1/posts/feed"
+
+    def _walk(self):
+        ids = []
+        resp = self.client.get(self.url)
+        while True:
+            self.assertEqual(resp.status_code, 200)
+            ids.extend(item["id"] for item in resp.data["results"])
+            if resp.data["next"] is None:
+                break
+            resp = self.client.get(self.url, data={"cursor": resp.data["next"]})
+        return ids
+
+
+@tag("api-tests", "blog", "feed")
+class FeedListAPITestCase(_BaseTestCase):
+
+    def test_status_code(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+    def test_response_data(self):
+        resp = self.client.get(self.url)
+        self.assertIsInstance(resp.data, dict)
+        data: dict = resp.data
+        self.assertEqual(data["next"], None)
+        self.assertEqual(data["previous"], None)
+        self.assertEqual(len(data["results"]), 10)
+
+        posts = Post.objects.filter(user_id__in=[self.user_1.pk, self.user_2.pk]).order_by("-created_at", "-id")
+        for item, post in zip(data["results"], posts):
+            self.assertEqual(item.pop("id"), post.pk)
+            self.assertEqual(item.pop("content"), post.content)
+            self.assertEqual(item.pop("count_likes"), post.likes_count)
+            self.assertIsNotNone(item.pop("created_at"))
+            self.assertIsNotNone(item.pop("updated_at"))
+            self.assertEqual(item, {})
+
+    def test_walk(self):
+        self.assertEqual(self._walk(), list(Post.objects.filter(
+            user_id__in=[self.user_1.pk, self.user_2.pk]
+        ).order_by("-created_at", "-id").values_list("id", flat=True)))
+
+    def test_not_authenticated(self):
+        self.client = self.client_class()
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "Authentication credentials were not provided.")
+
+    def test_subscribe(self):
+        SubscriptionService.create(user=self.user_1, data={"to_user_id": self.user_3.pk})
+
+        resp = self.client.get(self.url)
+        self.assertIsNotNone(resp.data["next"])
+
+        self.assertEqual(self._walk(), list(Post.objects.order_by("-created_at", "-id").values_list("id", flat=True)))
+
+    def test_unsubscribe(self):
+        SubscriptionService.delete(
+            user=self.user_1,
+            subscription=Subscription.objects.get(user_id=self.user_1.pk, to_user_id=self.user_2.pk)
+        )
+
+        self.assertEqual(self._walk(), list(Post.objects.filter(
+            user_id=self.user_1.pk
+        ).order_by("-created_at", "-id").values_list("id", flat=True)))
+
+    def test_post_deleted(self):
+        post = Post.objects.filter(user_id=self.user_2.pk).order_by("-created_at").first()
+        post.delete()
+
+        self.assertNotIn(post.pk, self._walk())
+        self.assertFalse(TimelineItem.objects.filter(post_id=post.pk).exists())
+
+
+@tag("api-tests", "blog", "feed")
+@override_settings(BLOG_TIMELINE_PUSH_THRESHOLD=2)
+class FeedListPulledAuthorAPITestCase(_BaseTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        SubscriptionService.create(user=self.user_2, data={"to_user_id": self.user_3.pk})
+        SubscriptionService.create(user=self.user_1, data={"to_user_id": self.user_3.pk})
+
+        self.pulled_posts = [
+            PostService.create(user=self.user_3, data={"content": f"pulled-{i}"})
+            for i in range(0, 3)
+        ]
+
+    def test_not_pushed(self):
+        self.assertFalse(TimelineItem.objects.filter(
+            post_id__in=[post.pk for post in self.pulled_posts]
+        ).exclude(
+            owner_id=self.user_3.pk
+        ).exists())
+        self.assertEqual(
+            AuthorRecentPost.objects.filter(author_id=self.user_3.pk).count(),
+            Post.objects.filter(user_id=self.user_3.pk).count()
+        )
+
+    def test_walk(self):
+        self.assertEqual(self._walk(), list(Post.objects.order_by("-created_at", "-id").values_list("id", flat=True)))
+
+    def test_previous(self):
+        first = self.client.get(self.url)
+        second = self.client.get(self.url, data={"cursor": first.data["next"]})
+
+        resp = self.client.get(self.url, data={"cursor": second.data["previous"]})
+        self.assertEqual(
+            [item["id"] for item in resp.data["results"]],
+            [item["id"] for item in first.data["results"]]
+        )
+
+    def test_not_subscribed(self):
+        self.client.force_authenticate(user=self.user_2, token=str(RefreshToken.for_user(self.user_2).access_token))
+        SubscriptionService.delete(
+            user=self.user_2,
+            subscription=Subscription.objects.get(user_id=self.user_2.pk, to_user_id=self.user_3.pk)
+        )
+
+        self.assertEqual(self._walk(), list(Post.objects.filter(
+            user_id=self.user_2.pk
+        ).order_by("-created_at", "-id").values_list("id", flat=True)))
+
+    @override_settings(BLOG_TIMELINE_RECENT_POSTS_SIZE=2)
+    def test_recent_posts_size(self):
+        post = PostService.create(user=self.user_3, data={"content": "pulled"})
+
+        self.assertEqual(
+            list(AuthorRecentPost.objects.filter(
+                author_id=self.user_3.pk
+            ).order_by("created_at").values_list("post_id", flat=True)),
+            [self.pulled_posts[-1].pk, post.pk]
+        )
+
+    def test_threshold_reached_without_subscribing(self):
+        user_4 = User.objects.create_user(email="test-4@gmail.com", username="test-4")
+        Subscription.objects.bulk_create([
+            Subscription(user_id=user.pk, to_user_id=user_4.pk)
+            for user in [self.user_1, self.user_2]
+        ])
+
+        post = PostService.create(user=user_4, data={"content": "pulled"})
+
+        self.assertEqual(
+            list(AuthorRecentPost.objects.filter(author_id=user_4.pk).values_list("post_id", flat=True)),
+            [post.pk]
+        )
@@ -1,3 +1,4 @@
+from django.db import DatabaseError
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -70,6 +71,12 @@ class PostCommentCreateAPITestCase(_BaseTestCase):
         self.assertEqual(post_comment.post_id, self.post.pk)
         self.assertEqual(post_comment.comment, self.data["comment"])
 
+    def test_num_queries(self):
+        # The post and the insert in a transaction (a savepoint in the test).
+        with self.assertNumQueries(4):
+            resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 201)
+
     def test_not_found_by_id(self):
         resp = self.client.delete("/api/v1/posts/123123/comments")
         self.assertEqual(resp.status_code, 404)
@@ -110,3 +117,10 @@ class PostCommentCreateAPITestCase(_BaseTestCase):
                 }
             }
         )
+
+    def test_enqueue_in_transaction(self):
+        self.notifications_accept_mock.side_effect = DatabaseError("sample error")
+
+        with self.assertRaises(DatabaseError):
+            self.client.post(self.url, data=self.data)
+        self.assertFalse(PostComment.objects.exists())
@@ -64,6 +64,27 @@ class PostCommentListAPITestCase(_BaseTestCase):
             self.assertEqual(item.pop("comment"), comment.comment)
             self.assertEqual(item, {})
 
+    def test_num_queries(self):
+        # The post, the count and the page of comments with their users.
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+        users = User.objects.bulk_create([
+            User(email=f"test-{i}@example.com", username=f"test-comment-{i}")
+            for i in range(0, 10)
+        ])
+        PostComment.objects.bulk_create([
+            PostComment(user_id=user.pk, post_id=self.post.pk, comment="sample-comment")
+            for user in users
+        ])
+
+        with self.assertNumQueries(3):
+            resp = self.client.get(self.url)
+        self.assertEqual(len(resp.data["results"]), 10)
+
+        with self.assertNumQueries(2):
+            self.client.get(self.url, data={"cursor": ""})
+
     def test_not_authenticated(self):
         self.client = self.client_class()
         resp = self.client.get(self.url)
@@ -62,6 +62,12 @@ class PostCommentUpdateAPITestCase(_BaseTestCase):
 
         self.assertEqual(data, {})
 
+    def test_num_queries(self):
+        # The post, the comment with its user and the update.
+        with self.assertNumQueries(3):
+            resp = self.client.patch(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 200)
+
     def test_entity(self):
         resp = self.client.patch(self.url, data=self.data)
         self.assertEqual(resp.status_code, 200)
@@ -1,3 +1,4 @@
+from django.db import DatabaseError
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -50,6 +51,8 @@ class PostLikeCreateAPITestCase(_BaseTestCase):
         self.assertEqual(resp.status_code, 201)
 
         self.assertEqual(self.post.likes.count(), 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
 
         self.assertEqual(PostLike.objects.count(), 1)
         post_like = PostLike.objects.get()
@@ -97,3 +100,11 @@ class PostLikeCreateAPITestCase(_BaseTestCase):
                 }
             }
         )
+
+    def test_enqueue_in_transaction(self):
+        self.notifications_accept_mock.side_effect = DatabaseError("sample error")
+
+        with self.assertRaises(DatabaseError):
+            self.client.post(self.url)
+        self.assertFalse(PostLike.objects.exists())
+        self.assertEqual(Post.objects.get(pk=self.post.pk).likes_count, 0)
@@ -1,3 +1,4 @@
+from django.db import DatabaseError
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -55,6 +56,8 @@ class PostLikeDestroyAPITestCase(_BaseTestCase):
         self.assertEqual(resp.status_code, 204)
 
         self.assertEqual(PostLike.objects.count(), 0)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 0)
 
     def test_not_found_by_id(self):
         resp = self.client.delete("/api/v1/posts/123123/like")
@@ -109,3 +112,11 @@ class PostLikeDestroyAPITestCase(_BaseTestCase):
                 }
             }
         )
+
+    def test_enqueue_in_transaction(self):
+        self.notifications_accept_mock.side_effect = DatabaseError("sample error")
+
+        with self.assertRaises(DatabaseError):
+            self.client.delete(self.url)
+        self.assertTrue(PostLike.objects.exists())
+        self.assertEqual(Post.objects.get(pk=self.post.pk).likes_count, 1)
@@ -1,3 +1,4 @@
+from django.db import DatabaseError
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -94,8 +95,7 @@ class PostCreateAPITestCase(_BaseTestCase):
                         "id": self.user.pk,
                         "username": self.user.username
                     }
-                },
-                "to_user_ids": [user_2.pk, user_3.pk]
+                }
             }
         )
 
@@ -120,11 +120,19 @@ class PostCreateAPITestCase(_BaseTestCase):
                         "id": self.user.pk,
                         "username": self.user.username
                     }
-                },
-                "to_user_ids": [user_3.pk, user_4.pk]
+                }
             }
         )
 
+    def test_enqueue_in_post_transaction(self):
+        user_2 = User.objects.create_user(email="test-2@gmail.com", username="test-2")
+        Subscription.objects.create(to_user_id=self.user.pk, user_id=user_2.pk)
+        self.notifications_accept_mock.side_effect = DatabaseError("sample error")
+
+        with self.assertRaises(DatabaseError):
+            self.client.post(self.url, data=self.data)
+        self.assertFalse(Post.objects.exists())
+
 
 @tag("api-tests", "blog", "posts")
 class PostCreateValidationAPITestCase(_BaseTestCase):
@@ -1,3 +1,6 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -65,6 +68,7 @@ class PostListAPITestCase(_BaseTestCase):
             for post in Post.objects.all()
             if user.pk != post.user_id
         ])
+        call_command("reconcile_post_likes", stdout=StringIO())
 
         resp = self.client.get(self.url + "?count=100")
         for item, post in zip(resp.data["results"], Post.objects.order_by("-created_at")):
@@ -86,13 +90,79 @@ class PostListFilterAPITestCase(_BaseTestCase):
             self.assertEqual(item["id"], post.pk)
 
     def test_by_search(self):
-        resp = self.client.get(self.url, data={"search": f"SAMPLE-{self.user_1.pk}"})
-        self.assertEqual(resp.data["count"], Post.objects.filter(content__icontains=f"sample-{self.user_1.pk}").count())
+        resp = self.client.get(self.url, data={"search": "SAMPLE"})
+        self.assertEqual(resp.data["count"], Post.objects.count())
 
-        for item, post in zip(resp.data["results"], Post.objects.filter(
-                content__icontains=f"sample-{self.user_1.pk}"
-        ).order_by("-created_at")):
-            self.assertEqual(item["id"], post.pk)
+        resp = self.client.get(self.url, data={"search": "missing"})
+        self.assertEqual(resp.data["count"], 0)
+
+    def test_by_search_stemming(self):
+        post = Post.objects.create(user_id=self.user_2.pk, content="Running through the mountains")
+
+        resp = self.client.get(self.url, data={"search": "runs mountain"})
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(resp.data["results"][0]["id"], post.pk)
+
+    def test_by_search_ranked(self):
+        post_1 = Post.objects.create(user_id=self.user_2.pk, content="Coffee notes")
+        post_2 = Post.objects.create(user_id=self.user_2.pk, content="Coffee, coffee and more coffee")
+        post_3 = Post.objects.create(user_id=self.user_3.pk, content="Coffee and coffee")
+
+        resp = self.client.get(self.url, data={"search": "coffee"})
+        self.assertEqual([item["id"] for item in resp.data["results"]], [post_2.pk, post_3.pk, post_1.pk])
+
+    def test_by_search_websearch_syntax(self):
+        post = Post.objects.create(user_id=self.user_2.pk, content="Green tea")
+        Post.objects.create(user_id=self.user_2.pk, content="Black tea")
+
+        resp = self.client.get(self.url, data={"search": "tea -black"})
+        self.assertEqual([item["id"] for item in resp.data["results"]], [post.pk])
+
+    def test_by_search_keyset(self):
+        Post.objects.bulk_create([
+            Post(user_id=self.user_2.pk, content=" ".join(["coffee"] * (i % 3 + 1)))
+            for i in range(0, 15)
+        ])
+
+        ids = []
+        resp = self.client.get(self.url, data={"search": "coffee", "cursor": ""})
+        while True:
+            ids.extend(item["id"] for item in resp.data["results"])
+            if resp.data["next"] is None:
+                break
+            resp = self.client.get(self.url, data={"search": "coffee", "cursor": resp.data["next"]})
+
+        self.assertEqual(len(ids), 15)
+        self.assertEqual(len(set(ids)), 15)
+
+    def test_by_search_keyset_same_rank(self):
+        # Groups of equal ranks span the page boundaries, the boundary rank must match itself exactly.
+        posts = Post.objects.bulk_create([
+            Post(user_id=self.user_2.pk, content=" ".join(["coffee"] * (i % 3 + 1)) + f" note {i}")
+            for i in range(0, 24)
+        ])
+
+        ids = []
+        resp = self.client.get(self.url, data={"search": "coffee", "cursor": ""})
+        while True:
+            ids.extend(item["id"] for item in resp.data["results"])
+            if resp.data["next"] is None:
+                break
+            resp = self.client.get(self.url, data={"search": "coffee", "cursor": resp.data["next"]})
+
+        # Three ranks, ties are ordered by the id.
+        expected = sorted(posts, key=lambda post: (-post.content.count("coffee"), -post.pk))
+        self.assertEqual(ids, [post.pk for post in expected])
+
+        previous = []
+        resp = self.client.get(self.url, data={"search": "coffee", "cursor": resp.data["previous"]})
+        while True:
+            previous[:0] = [item["id"] for item in resp.data["results"]]
+            if resp.data["previous"] is None:
+                break
+            resp = self.client.get(self.url, data={"search": "coffee", "cursor": resp.data["previous"]})
+        self.assertEqual(previous, ids[:len(previous)])
+        self.assertEqual(len(previous) + 4, len(ids))
 
 
 @tag("api-tests", "blog", "posts")
@@ -206,3 +276,96 @@ class PostListOrderingFilterAPITestCase(_BaseTestCase):
                 id__in=posts_from_user_2.values_list("id", flat=True)
         ).order_by("-created_at")):
             self.assertEqual(item["id"], post.pk)
+
+    def test_by_from_subscriptions_pages(self):
+        Subscription.objects.create(to_user_id=self.user_2.pk, user_id=self.user_1.pk)
+        posts_from_user_2 = list(
+            Post.objects.filter(user_id=self.user_2.pk).order_by("-created_at").values_list("id", flat=True)
+        )
+        other_posts = list(
+            Post.objects.exclude(user_id=self.user_2.pk).order_by("-created_at").values_list("id", flat=True)
+        )
+
+        for ordering, expected in [
+            ("-from_subscriptions", posts_from_user_2 + other_posts),
+            ("from_subscriptions", other_posts + posts_from_user_2),
+        ]:
+            ids = []
+            for page in [1, 2]:
+                resp = self.client.get(self.url, data={"ordering": ordering, "page": page})
+                self.assertEqual(resp.status_code, 200)
+                self.assertEqual(resp.data["count"], 15)
+                ids.extend(item["id"] for item in resp.data["results"])
+            self.assertEqual(ids, expected)
+
+
+@tag("api-tests", "blog", "posts")
+class PostListKeysetPaginationAPITestCase(_BaseTestCase):
+
+    def _walk(self, client, data: dict):
+        ids = []
+        resp = client.get(self.url, data={**data, "cursor": ""})
+        while True:
+            self.assertEqual(resp.status_code, 200)
+            self.assertNotIn("count", resp.data)
+            ids.extend(item["id"] for item in resp.data["results"])
+            if resp.data["next"] is None:
+                break
+            resp = client.get(self.url, data={**data, "cursor": resp.data["next"]})
+        return ids
+
+    def test_response_data(self):
+        resp = self.client.get(self.url, data={"cursor": ""})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(list(resp.data.keys()), ["next", "previous", "results"])
+        self.assertIsNotNone(resp.data["next"])
+        self.assertIsNone(resp.data["previous"])
+        self.assertEqual(len(resp.data["results"]), 10)
+
+        resp = self.client.get(self.url, data={"cursor": resp.data["next"]})
+        self.assertEqual(resp.status_code, 200)
+        self.assertIsNone(resp.data["next"])
+        self.assertIsNotNone(resp.data["previous"])
+        self.assertEqual(len(resp.data["results"]), 5)
+
+    def test_walk_by_created_at_desc(self):
+        ids = self._walk(self.client, {"ordering": "-created_at"})
+        self.assertEqual(ids, list(Post.objects.order_by("-created_at", "-id").values_list("id", flat=True)))
+
+    def test_walk_by_created_at_asc(self):
+        ids = self._walk(self.client, {"ordering": "created_at"})
+        self.assertEqual(ids, list(Post.objects.order_by("created_at", "id").values_list("id", flat=True)))
+
+    def test_walk_by_from_subscriptions(self):
+        Subscription.objects.create(to_user_id=self.user_3.pk, user_id=self.user_1.pk)
+
+        ids = self._walk(self.client, {"ordering": "-from_subscriptions"})
+        posts_from_user_3 = Post.objects.filter(user_id=self.user_3.pk).order_by("-created_at", "-id")
+        self.assertEqual(ids, [
+            *posts_from_user_3.values_list("id", flat=True),
+            *Post.objects.exclude(user_id=self.user_3.pk).order_by("-created_at", "-id").values_list("id", flat=True)
+        ])
+
+    def test_same_created_at(self):
+        Post.objects.update(created_at=Post.objects.order_by("created_at").first().created_at)
+
+        ids = self._walk(self.client, {"ordering": "-created_at"})
+        self.assertEqual(ids, list(Post.objects.order_by("-id").values_list("id", flat=True)))
+
+    def test_previous(self):
+        first = self.client.get(self.url, data={"cursor": ""})
+        second = self.client.get(self.url, data={"cursor": first.data["next"]})
+
+        resp = self.client.get(self.url, data={"cursor": second.data["previous"]})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            [item["id"] for item in resp.data["results"]],
+            [item["id"] for item in first.data["results"]]
+        )
+        self.assertIsNone(resp.data["previous"])
+        self.assertIsNotNone(resp.data["next"])
+
+    def test_invalid_cursor(self):
+        resp = self.client.get(self.url, data={"cursor": "invalid"})
+        self.assertEqual(resp.status_code, 404)
+        self.assertEqual(str(resp.data["detail"]), "Invalid cursor.")
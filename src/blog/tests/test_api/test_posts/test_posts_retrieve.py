@@ -1,3 +1,6 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -61,6 +64,7 @@ class PostRetrieveAPITestCase(_BaseTestCase):
             )
             for user in [user_2, user_3]
         ])
+        call_command("reconcile_post_likes", stdout=StringIO())
 
         resp = self.client.get(self.url)
         self.assertEqual(resp.data["id"], self.post.pk)
@@ -74,10 +74,11 @@ class SubscriberListFilterAPITestCase(_BaseTestCase):
 
     def test_by_search(self):
         resp = self.client.get(self.url, data={"search": self.user_2.username})
-        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(resp.data["count"], 2)
+        self.assertEqual(resp.data["results"][0]["from_user"]["id"], self.user_2.pk)
 
-        user_4 = User.objects.create_user(email="test-4@gmail.com", username="test-4")
-        user_5 = User.objects.create_user(email="test-5@gmail.com", username="test-5")
+        user_4 = User.objects.create_user(email="test-4@gmail.com", username="mallory")
+        user_5 = User.objects.create_user(email="test-5@gmail.com", username="trent")
 
         Subscription.objects.create(to_user_id=user_4.pk, user_id=user_5.pk)
 
@@ -104,3 +105,17 @@ class SubscriberListOrderingFilterAPITestCase(_BaseTestCase):
 
         for item, subscriber in zip(resp.data["results"], self.user_1.subscribers.order_by("-created_at")):
             self.assertEqual(item["id"], subscriber.pk)
+
+
+@tag("api-tests", "blog", "blog-subscribers")
+class SubscriberListKeysetPaginationAPITestCase(_BaseTestCase):
+
+    def test_response_data(self):
+        resp = self.client.get(self.url, data={"cursor": ""})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["next"], None)
+        self.assertEqual(resp.data["previous"], None)
+        self.assertEqual(
+            [item["id"] for item in resp.data["results"]],
+            list(self.user_1.subscribers.order_by("-created_at", "-id").values_list("id", flat=True))
+        )
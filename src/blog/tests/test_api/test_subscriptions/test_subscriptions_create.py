@@ -1,3 +1,4 @@
+from django.db import DatabaseError
 from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -99,6 +100,14 @@ class SubscriptionCreateAPITestCase(_BaseTestCase):
             }
         )
 
+    def test_enqueue_in_transaction(self):
+        self.notifications_accept_mock.side_effect = DatabaseError("sample error")
+
+        with self.assertRaises(DatabaseError):
+            self.client.post(self.url, data=self.data)
+        self.assertFalse(Subscription.objects.exists())
+
+
 
 @tag("api-tests", "blog", "blog-subscriptions")
 class SubscriptionCreateValidationAPITestCase(_BaseTestCase):
@@ -73,10 +73,11 @@ class SubscriptionListFilterAPITestCase(_BaseTestCase):
 
     def test_by_search(self):
         resp = self.client.get(self.url, data={"search": self.user_1.username})
-        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(resp.data["count"], 2)
+        self.assertEqual(resp.data["results"][0]["to_user"]["id"], self.user_1.pk)
 
-        user_4 = User.objects.create_user(email="test-4@gmail.com", username="test-4")
-        user_5 = User.objects.create_user(email="test-5@gmail.com", username="test-5")
+        user_4 = User.objects.create_user(email="test-4@gmail.com", username="mallory")
+        user_5 = User.objects.create_user(email="test-5@gmail.com", username="trent")
 
         Subscription.objects.create(to_user_id=user_4.pk, user_id=user_5.pk)
 
@@ -0,0 +1,65 @@
+from django.test import tag, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from blog.models import AuthorRecentPost, Post, Subscription, TimelineItem
+from blog.services import PostService, SubscriptionService
+from common.tests.mixins import MockTestCaseMixin, QueryPlanTestCaseMixin
+from users.models import User
+
+
+@tag("query-plan-tests", "blog", "posts")
+@override_settings(BLOG_TIMELINE_PUSH_THRESHOLD=10)
+class FeedListQueryPlanTestCase(APITestCase, MockTestCaseMixin, QueryPlanTestCaseMixin):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.users = User.objects.bulk_create([
+            User(email=f"test-{i}@gmail.com", username=f"test-{i}")
+            for i in range(0, 30)
+        ])
+        # The first author is followed by everyone, so their posts are pulled at read time.
+        Subscription.objects.bulk_create([
+            Subscription(user_id=user.pk, to_user_id=cls.users[0].pk)
+            for user in cls.users[1:]
+        ])
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._mock("notifications.entrypoint.Handler.accept")
+
+        self.user = self.users[-1]
+        for to_user in self.users[1:6]:
+            SubscriptionService.create(user=self.user, data={"to_user_id": to_user.pk})
+        for user in self.users:
+            for i in range(0, 10):
+                PostService.create(user=user, data={"content": f"sample-{i}-{user.pk}"})
+
+        self.client.force_authenticate(user=self.user, token=str(RefreshToken.for_user(self.user).access_token))
+
+        self.url = "/api/v1/posts/feed"
+
+    def _get(self, table, **data):
+        plans = self._get_plans(lambda: self.assertEqual(self.client.get(self.url, data=data).status_code, 200),
+                                table=table)
+        self.assertTrue(plans)
+        return plans
+
+    def test_pushed(self):
+        self.assertTrue(TimelineItem.objects.filter(owner_id=self.user.pk).exists())
+        for plan in self._get(TimelineItem._meta.db_table):
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "blog_timeline_owner_feed_idx")
+
+    def test_pulled(self):
+        self.assertTrue(AuthorRecentPost.objects.filter(author_id=self.users[0].pk).exists())
+        for plan in self._get(AuthorRecentPost._meta.db_table):
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "blog_recent_author_feed_idx")
+
+    def test_posts(self):
+        for plan in self._get(Post._meta.db_table):
+            self.assertNoSeqScan(plan)
@@ -0,0 +1,55 @@
+from django.test import tag
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from blog.models import Post, PostComment
+from common.tests.mixins import QueryPlanTestCaseMixin
+from users.models import User
+
+
+@tag("query-plan-tests", "blog", "post-comments")
+class PostCommentListQueryPlanTestCase(APITestCase, QueryPlanTestCaseMixin):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        users = User.objects.bulk_create([
+            User(email=f"test-{i}@gmail.com", username=f"test-{i}")
+            for i in range(0, 20)
+        ])
+        posts = Post.objects.bulk_create([
+            Post(user_id=user.pk, content=f"sample-{i}-{user.pk}")
+            for user in users
+            for i in range(0, 5)
+        ])
+        PostComment.objects.bulk_create([
+            PostComment(user_id=user.pk, post_id=post.pk, comment=f"sample-comment-{post.pk}")
+            for post in posts
+            for user in users[:10]
+        ])
+        cls.user = users[0]
+        cls.post = posts[0]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user, token=str(RefreshToken.for_user(self.user).access_token))
+
+        self.url = f"/api/v1/posts/{self.post.pk}/comments"
+
+    def _get(self, **data):
+        plans = self._get_plans(lambda: self.assertEqual(self.client.get(self.url, data=data).status_code, 200),
+                                table=PostComment._meta.db_table)
+        self.assertTrue(plans)
+        return plans
+
+    def test_default_ordering(self):
+        for plan in self._get():
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "blog_comment_post_created_idx")
+
+    def test_keyset(self):
+        for plan in self._get(cursor=""):
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "blog_comment_post_created_idx")
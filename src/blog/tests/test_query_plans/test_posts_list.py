@@ -0,0 +1,89 @@
+from django.test import tag
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from blog.models import Post, Subscription
+from common.tests.mixins import QueryPlanTestCaseMixin
+from users.models import User
+
+
+@tag("query-plan-tests", "blog", "posts")
+class PostListQueryPlanTestCase(APITestCase, QueryPlanTestCaseMixin):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        users = User.objects.bulk_create([
+            User(email=f"test-{i}@gmail.com", username=f"test-{i}")
+            for i in range(0, 50)
+        ])
+        Post.objects.bulk_create([
+            Post(user_id=user.pk, content=f"sample-{i}-{user.pk}")
+            for user in users
+            for i in range(0, 20)
+        ])
+        Subscription.objects.bulk_create([
+            Subscription(user_id=user.pk, to_user_id=to_user.pk)
+            for user in users
+            for to_user in users[:10]
+            if user.pk != to_user.pk
+        ])
+        cls.user = users[-1]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user, token=str(RefreshToken.for_user(self.user).access_token))
+
+        self.url = "/api/v1/posts"
+
+    def _get(self, **data):
+        plans = self._get_plans(lambda: self.assertEqual(self.client.get(self.url, data=data).status_code, 200),
+                                table=Post._meta.db_table)
+        self.assertTrue(plans)
+        return plans
+
+    def test_default_ordering(self):
+        plans = self._get()
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+        self.assertIndexUsed(plans[-1], "blog_post_created_at_idx")
+
+    def test_by_from_subscriptions(self):
+        plans = self._get(ordering="from_subscriptions")
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+        self.assertIndexUsed(plans[-1], "blog_post_created_at_idx")
+
+    def test_by_from_subscriptions_desc_keyset(self):
+        plans = self._get(ordering="-from_subscriptions", cursor="")
+        # Posts from subscriptions and the other posts.
+        self.assertEqual(len(plans), 2)
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "blog_post_created_at_idx")
+
+    def test_by_created_at_desc(self):
+        plans = self._get(ordering="-created_at")
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+        self.assertIndexUsed(plans[-1], "blog_post_created_at_idx")
+
+    def test_by_created_at_desc_keyset(self):
+        plans = self._get(ordering="-created_at", cursor="")
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+        self.assertIndexUsed(plans[-1], "blog_post_created_at_idx")
+
+    def test_only_from_me(self):
+        plans = self._get(only_from_me=True, ordering="-created_at")
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "blog_post_user_created_idx")
+
+    def test_by_search(self):
+        plans = self._get(search="sample")
+        for plan in plans:
+            self.assertNoSeqScan(plan, table=Post._meta.db_table)
+            self.assertIndexUsed(plan, "blog_post_search_vector_idx")
@@ -0,0 +1,63 @@
+from django.test import tag
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from blog.models import Subscription
+from common.tests.mixins import QueryPlanTestCaseMixin
+from users.models import User
+
+
+class _BaseTestCase(QueryPlanTestCaseMixin):
+    url = None
+
+    index = None
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        users = User.objects.bulk_create([
+            User(email=f"test-{i}@gmail.com", username=f"test-{i}")
+            for i in range(0, 100)
+        ])
+        Subscription.objects.bulk_create([
+            Subscription(user_id=user.pk, to_user_id=to_user.pk)
+            for i, user in enumerate(users)
+            for to_user in users[i + 1:i + 21]
+        ])
+        cls.user = users[50]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user, token=str(RefreshToken.for_user(self.user).access_token))
+
+    def _get(self, **data):
+        plans = self._get_plans(lambda: self.assertEqual(self.client.get(self.url, data=data).status_code, 200),
+                                table=Subscription._meta.db_table)
+        self.assertTrue(plans)
+        return plans
+
+    def test_default_ordering(self):
+        for plan in self._get():
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, self.index)
+
+    def test_keyset(self):
+        for plan in self._get(cursor=""):
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, self.index)
+
+
+@tag("query-plan-tests", "blog", "blog-subscriptions")
+class SubscriptionListQueryPlanTestCase(_BaseTestCase, APITestCase):
+    url = "/api/v1/blog/subscriptions"
+
+    index = "blog_subscription_user_idx"
+
+
+@tag("query-plan-tests", "blog", "blog-subscribers")
+class SubscriberListQueryPlanTestCase(_BaseTestCase, APITestCase):
+    url = "/api/v1/blog/subscribers"
+
+    index = "blog_subscription_to_user_idx"
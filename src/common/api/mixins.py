@@ -0,0 +1,96 @@
+import dataclasses
+import functools
+import logging
+import time
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, models
+from django.http import JsonResponse
+from rest_framework import exceptions, status
+
+from common.utils import BoundedExecutor, ExecutorBusy
+
+logger = logging.getLogger(__name__)
+
+
+class ParentObjectMixin:
+    """
+    Resolves the parent object of a nested route from the URL kwargs.
+
+    A view instance serves a single request, so the parent is looked up once
+    and shared by the permission checks, the queryset, the serializer context and the services.
+    """
+    parent_queryset: models.QuerySet = None
+
+    parent_lookup_url_kwarg: str = None
+
+    def get_parent_queryset(self) -> models.QuerySet:
+        assert self.parent_queryset is not None
+        return self.parent_queryset.all()
+
+    def get_parent(self):
+        if not hasattr(self, "_parent"):
+            parent = self.get_parent_queryset().filter(
+                pk=self.kwargs.get(self.parent_lookup_url_kwarg)
+            ).first()
+            if not parent:
+                raise exceptions.NotFound
+            self._parent = parent
+        return self._parent
+
+
+class ExecutorViewMixin:
+    """
+    Serves the view as a coroutine, the view runs in the executor returned by `get_executor`.
+    Slow views, e.g. password hashing, then wait for the threads of their own executor
+    and do not take the capacity of the other views.
+    Without an executor the view runs like a sync view.
+
+    Rejected requests are logged with the stats of the executor, at most once per `executor_busy_log_interval`.
+    """
+    executor_busy_message = "Service is busy, try again later."
+    executor_busy_log_interval = 60  # Seconds.
+    _executor_busy_logged_at: Optional[float] = None
+
+    @classmethod
+    def get_executor(cls) -> Optional[BoundedExecutor]:
+        raise NotImplementedError
+
+    @classmethod
+    def as_view(cls, *args, **kwargs):
+        view = super().as_view(*args, **kwargs)
+
+        def run(request, *args, **kwargs):
+            # Executor threads are not managed by the request signals, so the connections are handled here.
+            close_old_connections()
+            try:
+                return view(request, *args, **kwargs)
+            finally:
+                close_old_connections()
+
+        async def executor_view(request, *args, **kwargs):
+            executor = cls.get_executor()
+            if executor is None:
+                return await sync_to_async(view)(request, *args, **kwargs)
+
+            try:
+                return await sync_to_async(run, thread_sensitive=False, executor=executor)(request, *args, **kwargs)
+            except ExecutorBusy:
+                cls._log_executor_busy(executor)
+                return JsonResponse({"detail": cls.executor_busy_message}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return functools.update_wrapper(executor_view, view)
+
+    @classmethod
+    def _log_executor_busy(cls, executor: BoundedExecutor):
+        now = time.monotonic()
+        logged_at = cls._executor_busy_logged_at
+        if logged_at is not None and now - logged_at < cls.executor_busy_log_interval:
+            return
+        cls._executor_busy_logged_at = now
+        logger.warning(
+            "%s: executor is busy, %s",
+            cls.__name__,
+            ", ".join(f"{name}: {value}" for name, value in dataclasses.asdict(executor.stats).items())
+        )
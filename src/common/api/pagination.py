@@ -1,8 +1,58 @@
-from rest_framework import pagination
+import base64
+import binascii
+import datetime
+import decimal
+import functools
+import heapq
+import json
+import uuid
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from rest_framework import pagination, exceptions
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+class _ChainedQuerySets:
+    """
+    Querysets read one after another as a single ordered list.
+    """
+    ordered = True
+
+    def __init__(self, querysets):
+        self.querysets = querysets
+
+    @functools.cached_property
+    def _counts(self):
+        return [queryset.count() for queryset in self.querysets]
+
+    def count(self):
+        return sum(self._counts)
+
+    def __getitem__(self, index):
+        assert isinstance(index, slice) and index.step is None, "Only slices are supported."
+
+        start, stop = index.start or 0, index.stop
+        results = []
+        for queryset, count in zip(self.querysets, self._counts):
+            if start < count and stop > 0:
+                results.extend(queryset[start:min(stop, count)])
+            start, stop = max(start - count, 0), stop - count
+        return results
 
 
 class PageCountPagination(pagination.PageNumberPagination):
 
+    def paginate_querysets(self, querysets, request, view=None):
+        """
+        Paginate querysets read one after another.
+        """
+        if len(querysets) == 1:
+            return self.paginate_queryset(querysets[0], request, view=view)
+        return self.paginate_queryset(_ChainedQuerySets(querysets), request, view=view)
+
     def get_next_link(self):
         if not self.page.has_next():
             return None
@@ -16,3 +66,203 @@ class PageCountPagination(pagination.PageNumberPagination):
         if page_number == 1:
             return None
         return page_number
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Keyset (cursor) pagination.
+
+    The ordering is taken from the queryset after the filter backends are applied,
+    so fields mapped by `common.api.filters.OrderingFilter` and annotations are supported.
+    `id` is appended as a tiebreaker, so every row has a unique position.
+    The cursor is an opaque token with the ordering values of the boundary row.
+    """
+    page_size = api_settings.PAGE_SIZE
+
+    cursor_query_param = "cursor"
+
+    tiebreaker = "id"
+
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_querysets([queryset], request, view=view)
+
+    def paginate_querysets(self, querysets, request, view=None):
+        """
+        Paginate a stream merged from several querysets with the same ordering.
+        Rows at the same position are treated as one row and returned once.
+        """
+        self.request = request
+        self.ordering = self._get_ordering(querysets[0])
+        self.fields = [self._get_field(querysets[0], name.lstrip("-")) for name in self.ordering]
+        self.attnames = [self._get_attname(querysets[0], name.lstrip("-")) for name in self.ordering]
+
+        values, reverse = self._decode_cursor(request)
+
+        ordering = [self._invert(name) for name in self.ordering] if reverse else self.ordering
+        pages = []
+        for queryset in querysets:
+            assert self._get_ordering(queryset) == self.ordering, (
+                "Merged querysets must have the same ordering."
+            )
+            queryset = queryset.order_by(*ordering)
+            if values is not None:
+                queryset = queryset.filter(self._get_keyset_filter(values, reverse))
+            pages.append(list(queryset[:self.page_size + 1]))
+
+        results = self._merge(pages, ordering) if len(pages) > 1 else pages[0]
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = values is not None
+
+        self.page = results
+        return self.page
+
+    def _merge(self, pages, ordering):
+        def compare(a, b):
+            for name, attname in zip(ordering, self.attnames):
+                value_a, value_b = getattr(a, attname), getattr(b, attname)
+                if value_a != value_b:
+                    result = -1 if value_a < value_b else 1
+                    return -result if name.startswith("-") else result
+            return 0
+
+        results = []
+        for item in heapq.merge(*pages, key=functools.cmp_to_key(compare)):
+            if results and compare(results[-1], item) == 0:
+                continue
+            results.append(item)
+            if len(results) > self.page_size:
+                break
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ("next", self.get_next_link()),
+            ("previous", self.get_previous_link()),
+            ("results", data)
+        ]))
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self._encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self._encode_cursor(self.page[0], reverse=True)
+
+    def _get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        for name in ordering:
+            assert isinstance(name, str) and name != "?", (
+                f"`{self.__class__.__name__}` supports ordering by field names only, got {name!r}."
+            )
+
+        names = {name.lstrip("-") for name in ordering}
+        if not names & {self.tiebreaker, "pk"}:
+            desc = ordering[-1].startswith("-") if ordering else True
+            ordering.append(f"-{self.tiebreaker}" if desc else self.tiebreaker)
+        return ordering
+
+    def _get_field(self, queryset, name):
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        if name == "pk":
+            return queryset.model._meta.pk
+        return queryset.model._meta.get_field(name)
+
+    def _get_attname(self, queryset, name):
+        if name in queryset.query.annotations or name == "pk":
+            return name
+        return queryset.model._meta.get_field(name).attname
+
+    def _invert(self, name):
+        return name[1:] if name.startswith("-") else f"-{name}"
+
+    def _get_keyset_filter(self, values, reverse):
+        condition = models.Q()
+        equal = models.Q()
+        for name, value in zip(self.ordering, values):
+            desc = name.startswith("-") != reverse
+            field = name.lstrip("-")
+            condition |= equal & models.Q(**{f"{field}__{'lt' if desc else 'gt'}": value})
+            equal &= models.Q(**{field: value})
+        return condition
+
+    def _get_values(self, item):
+        return [getattr(item, attname) for attname in self.attnames]
+
+    def _to_primitive(self, value):
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, (decimal.Decimal, uuid.UUID)):
+            return str(value)
+        return value
+
+    def _encode_cursor(self, item, reverse: bool):
+        data = {
+            "v": [self._to_primitive(value) for value in self._get_values(item)],
+            "r": int(reverse)
+        }
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def _decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            data = json.loads(raw)
+            values = data["v"]
+            reverse = bool(data["r"])
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError
+            values = [field.to_python(value) for field, value in zip(self.fields, values)]
+        except (TypeError, ValueError, KeyError, binascii.Error, DjangoValidationError) as ex:
+            raise exceptions.NotFound(self.invalid_cursor_message) from ex
+
+        return values, reverse
+
+
+class PageCountOrKeysetPagination(pagination.BasePagination):
+    """
+    Page number pagination by default.
+
+    The client opts into keyset pagination by sending the `cursor` query parameter,
+    an empty value requests the first page.
+    """
+    page_pagination_class = PageCountPagination
+
+    keyset_pagination_class = KeysetPagination
+
+    def _get_paginator(self, request):
+        if self.keyset_pagination_class.cursor_query_param in request.query_params:
+            return self.keyset_pagination_class()
+        return self.page_pagination_class()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = self._get_paginator(request)
+        return self.paginator.paginate_queryset(queryset, request, view=view)
+
+    def paginate_querysets(self, querysets, request, view=None):
+        """
+        Querysets are read one after another by the page number pagination and merged by the keyset one,
+        so their orderings must not overlap.
+        """
+        self.paginator = self._get_paginator(request)
+        return self.paginator.paginate_querysets(querysets, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
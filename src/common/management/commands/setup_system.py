@@ -1,11 +1,15 @@
+from django.conf import settings
 from django.core.management import BaseCommand, call_command
 
+from notifications.services import SystemNotificationPartitionService
+
 
 class Command(BaseCommand):
     help = "Setup system"
 
     def handle(self, *args, **options):
         self._load_fixtures()
+        self._create_partitions()
 
     def _load_fixtures(self):
         call_command(
@@ -15,3 +19,8 @@ class Command(BaseCommand):
                 "notifications/fixtures/systemnotificationtype.json",
             ]
         )
+
+    def _create_partitions(self):
+        # Notifications can not be inserted without the partition of the month,
+        # so the partitions are not left to the maintenance command only.
+        SystemNotificationPartitionService.create_ahead(months_ahead=settings.NOTIFICATIONS_PARTITIONS_AHEAD)
@@ -1,5 +1,13 @@
+import re
+from typing import Callable, List, Optional, Set
 from unittest.mock import patch
 
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .smtp import DebuggingSMTPServer
+
 
 class MockTestCaseMixin:
 
@@ -9,3 +17,80 @@ class MockTestCaseMixin:
         mock = patcher.start()
         self.addCleanup(patcher.stop)
         return mock
+
+
+class SMTPServerTestCaseMixin:
+    """
+    Sends the emails of the test to a local `DebuggingSMTPServer` through the SMTP backend.
+    """
+
+    def _start_smtp_server(self) -> DebuggingSMTPServer:
+        server = DebuggingSMTPServer()
+        server.start()
+        self.addCleanup(server.stop)
+
+        settings_override = override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST=server.server_address[0],
+            EMAIL_PORT=server.port,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+            EMAIL_USE_TLS=False,
+            EMAIL_USE_SSL=False,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        return server
+
+
+class QueryPlanTestCaseMixin:
+    """
+    Checks the query plans of the queries executed by a call.
+
+    Sequential scans are disabled for the transaction of the test:
+    seeded tables are small and cheap to scan, so a sequential scan left in the plan
+    means that no index can serve the query.
+    """
+
+    def _get_plans(self,
+                   call: Callable,
+                   table: str) -> List[dict]:
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        with CaptureQueriesContext(connection) as context:
+            call()
+
+        plans = []
+        with connection.cursor() as cursor:
+            for query in context.captured_queries:
+                sql = query["sql"].strip()
+                if not sql.startswith(("SELECT", "UPDATE", "DELETE", "WITH")) or not re.search(rf"\b{table}\b", sql):
+                    continue
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+                plans.append(cursor.fetchone()[0][0]["Plan"])
+        return plans
+
+    def _get_nodes(self, plan: dict) -> List[dict]:
+        nodes = [plan]
+        for child in plan.get("Plans", []):
+            nodes.extend(self._get_nodes(child))
+        return nodes
+
+    def assertNoSeqScan(self, plan: dict, table: Optional[str] = None):
+        for node in self._get_nodes(plan):
+            if node["Node Type"] == "Seq Scan" and table in (None, node["Relation Name"]):
+                self.fail(f"Sequential scan on \"{node['Relation Name']}\".")
+
+    def _get_index_names(self, index: str) -> Set[str]:
+        """
+        The index and the indexes of its partitions.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relid::regclass::text FROM pg_partition_tree(%s::regclass)", [index])
+            return {index} | {name for name, in cursor.fetchall()}
+
+    def assertIndexUsed(self, plan: dict, index: str):
+        indexes = {node.get("Index Name") for node in self._get_nodes(plan)}
+        self.assertTrue(indexes & self._get_index_names(index), f"Index \"{index}\" is not used: {indexes}.")
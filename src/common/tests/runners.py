@@ -1,5 +1,11 @@
+from django.conf import settings
 from xmlrunner.extra.djangotestrunner import XMLTestRunner
 
 
 class TestRunner(XMLTestRunner):
-    pass
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        # Executor and background threads use their own database connections, which do not see the data of a test transaction.
+        settings.USERS_AUTH_EXECUTOR_WORKERS = 0
+        settings.USERS_REVOCATION_FILTER_BACKGROUND = False
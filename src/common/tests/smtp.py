@@ -0,0 +1,87 @@
+import email
+import socketserver
+import threading
+import time
+from email.message import Message
+from typing import List
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+
+    def _reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server: "DebuggingSMTPServer" = self.server
+        server.connections += 1
+        self._reply("220 localhost ESMTP")
+
+        recipients = []
+        while line := self.rfile.readline():
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 localhost")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command.split(":", 1)[1].strip(" <>"))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                self._handle_data(server, recipients)
+            elif verb in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _handle_data(self, server: "DebuggingSMTPServer", recipients: List[str]):
+        lines = []
+        while (line := self.rfile.readline()) not in (b".\r\n", b""):
+            lines.append(line[1:] if line.startswith(b"..") else line)
+
+        time.sleep(server.delay)
+        with server.lock:
+            if server.fail_next:
+                server.fail_next -= 1
+                self._reply("451 Temporary failure")
+                return
+            message = email.message_from_bytes(b"".join(lines))
+            message["X-Recipients"] = ", ".join(recipients)
+            server.messages.append(message)
+        self._reply("250 OK")
+
+
+class DebuggingSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    Local stand-in for an SMTP relay.
+
+    Keeps the received messages and the number of accepted connections.
+    `fail_next` messages are rejected with a temporary failure, every message is accepted after `delay` seconds.
+    """
+    daemon_threads = True
+
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _SMTPHandler)
+        self.messages: List[Message] = []
+        self.connections = 0
+        self.fail_next = 0
+        self.delay = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
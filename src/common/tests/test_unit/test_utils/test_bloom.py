@@ -0,0 +1,27 @@
+from django.test import SimpleTestCase
+
+from common.utils import BloomFilter
+
+
+class BloomFilterUnitTestCase(SimpleTestCase):
+
+    def test_no_false_negatives(self):
+        bloom_filter = BloomFilter(capacity=1000)
+        items = [f"item-{i}" for i in range(0, 1000)]
+        for item in items:
+            bloom_filter.add(item)
+
+        for item in items:
+            self.assertIn(item, bloom_filter)
+
+    def test_error_rate(self):
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(0, 1000):
+            bloom_filter.add(f"item-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom_filter for i in range(0, 10000))
+        self.assertLess(false_positives, 300)
+
+    def test_empty(self):
+        bloom_filter = BloomFilter(capacity=0)
+        self.assertNotIn("item", bloom_filter)
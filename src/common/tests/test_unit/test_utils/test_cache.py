@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from common.utils import LRUCache
+
+
+class LRUCacheUnitTestCase(SimpleTestCase):
+
+    def test_get_set(self):
+        cache = LRUCache(max_size=2, ttl=10)
+        self.assertIsNone(cache.get("a"))
+
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        cache.set("a", 2)
+        self.assertEqual(cache.get("a"), 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_evict_least_recently_used(self):
+        cache = LRUCache(max_size=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_ttl(self):
+        cache = LRUCache(max_size=2, ttl=10)
+        with patch("common.utils.cache.time.monotonic", return_value=100):
+            cache.set("a", 1)
+        with patch("common.utils.cache.time.monotonic", return_value=109):
+            self.assertEqual(cache.get("a"), 1)
+        with patch("common.utils.cache.time.monotonic", return_value=110):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_delete(self):
+        cache = LRUCache(max_size=2, ttl=10)
+        cache.set("a", 1)
+        cache.delete("a")
+        cache.delete("b")
+        self.assertIsNone(cache.get("a"))
@@ -0,0 +1,70 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from common.utils import bulk_copy
+from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from users.models import User
+
+
+class BulkCopyUnitTestCase(TestCase):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+
+    def _call(self, rows):
+        return bulk_copy(
+            SystemNotification,
+            fields=["user", "type", "event", "message", "is_read", "payload", "created_at", "updated_at"],
+            rows=rows
+        )
+
+    def _get_row(self, message: str, payload, created_at: datetime.datetime):
+        return (
+            self.user.pk,
+            SystemNotificationType.Handbook.BLOG_POSTS.value,
+            NotificationEvent.Handbook.BLOG_POSTS_NEW.value,
+            message,
+            False,
+            payload,
+            created_at,
+            created_at
+        )
+
+    def test_insert(self):
+        created_at = timezone.now()
+        count = self._call([
+            self._get_row("first", {"id": 1}, created_at),
+            self._get_row("second", [1, "two"], created_at),
+        ])
+        self.assertEqual(count, 2)
+
+        first, second = SystemNotification.objects.order_by("id")
+        self.assertEqual(first.user_id, self.user.pk)
+        self.assertEqual(first.message, "first")
+        self.assertEqual(first.payload, {"id": 1})
+        self.assertEqual(first.created_at, created_at)
+        self.assertFalse(first.is_read)
+        self.assertEqual(second.payload, [1, "two"])
+
+    def test_escaping(self):
+        message = "tab\tnew line\nback\\slash\r"
+        payload = {"text": "quote \" tab\t"}
+        self._call([self._get_row(message, payload, timezone.now())])
+
+        notification: SystemNotification = SystemNotification.objects.get()
+        self.assertEqual(notification.message, message)
+        self.assertEqual(notification.payload, payload)
+
+    def test_empty(self):
+        self.assertEqual(self._call([]), 0)
+        self.assertEqual(self._call(row for row in []), 0)
+        self.assertFalse(SystemNotification.objects.exists())
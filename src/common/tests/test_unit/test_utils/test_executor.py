@@ -0,0 +1,50 @@
+import threading
+
+from django.test import SimpleTestCase
+
+from common.utils import BoundedExecutor, ExecutorBusy
+
+
+class BoundedExecutorUnitTestCase(SimpleTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.executor = BoundedExecutor(max_workers=1, max_queue_size=1)
+        self.addCleanup(self.executor.shutdown)
+
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def test_submit(self):
+        self.assertEqual(self.executor.submit(sum, [1, 2]).result(), 3)
+
+        stats = self.executor.stats
+        self.assertEqual(stats.submitted, 1)
+        self.assertEqual(stats.completed, 1)
+        self.assertEqual(stats.queued, 0)
+        self.assertEqual(stats.running, 0)
+        self.assertEqual(stats.max_queued, 1)
+
+    def test_busy(self):
+        running = self.executor.submit(self.release.wait)
+        queued = self.executor.submit(self.release.wait)
+
+        self.assertRaises(ExecutorBusy, self.executor.submit, self.release.wait)
+
+        stats = self.executor.stats
+        self.assertEqual(stats.submitted, 2)
+        self.assertEqual(stats.rejected, 1)
+        self.assertEqual(stats.queued + stats.running, 2)
+
+        self.release.set()
+        running.result()
+        queued.result()
+        self.assertEqual(self.executor.submit(sum, [1]).result(), 1)
+        self.assertEqual(self.executor.stats.completed, 3)
+
+    def test_error(self):
+        future = self.executor.submit(int, "invalid")
+        self.assertRaises(ValueError, future.result)
+        self.assertEqual(self.executor.stats.completed, 1)
+        self.assertEqual(self.executor.stats.running, 0)
@@ -1 +1,6 @@
+from .bloom import BloomFilter
+from .cache import LRUCache
+from .db import bulk_copy
+from .executor import BoundedExecutor, ExecutorBusy
+from .iterables import chunked
 from .json import JsonFile
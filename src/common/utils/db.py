@@ -0,0 +1,67 @@
+import datetime
+import decimal
+import io
+import json
+import uuid
+from typing import Iterable, List, Sequence, Type
+
+from django.db import connections, models
+
+
+def _to_copy_text(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        value = value.isoformat()
+    elif not isinstance(value, (str, int, float, decimal.Decimal, uuid.UUID)):
+        raise TypeError(f"Unsupported value for COPY: {value!r}.")
+    return str(value).replace(
+        "\\", "\\\\"
+    ).replace(
+        "\t", "\\t"
+    ).replace(
+        "\n", "\\n"
+    ).replace(
+        "\r", "\\r"
+    )
+
+
+def bulk_copy(model: Type[models.Model],
+              fields: List[str],
+              rows: Iterable[Sequence],
+              using: str = "default") -> int:
+    """
+    Insert rows with `COPY ... FROM STDIN`, `bulk_create` is used on other backends.
+
+    Field defaults and `auto_now` are not applied by COPY, every column without
+    a database default must be listed in `fields`.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        attnames = [model._meta.get_field(name).attname for name in fields]
+        objs = [model(**dict(zip(attnames, row))) for row in rows]
+        model.objects.using(using).bulk_create(objs)
+        return len(objs)
+
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        buffer.write("\t".join(_to_copy_text(value) for value in row))
+        buffer.write("\n")
+        count += 1
+    if not count:
+        return 0
+    buffer.seek(0)
+
+    qn = connection.ops.quote_name
+    columns = ", ".join(qn(model._meta.get_field(name).column) for name in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {qn(model._meta.db_table)} ({columns}) FROM STDIN",
+            buffer
+        )
+    return count
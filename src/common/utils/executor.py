@@ -0,0 +1,61 @@
+import dataclasses
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class ExecutorBusy(Exception):
+    pass
+
+
+@dataclasses.dataclass(slots=True)
+class ExecutorStats:
+    submitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    queued: int = 0
+    running: int = 0
+    max_queued: int = 0
+
+
+class BoundedExecutor(ThreadPoolExecutor):
+    """
+    Thread pool that keeps up to `max_queue_size` calls waiting for a free thread,
+    further calls are rejected with `ExecutorBusy` instead of growing the queue.
+    """
+
+    def __init__(self,
+                 max_workers: int,
+                 max_queue_size: int,
+                 thread_name_prefix: str = ""):
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_queue_size = max_queue_size
+        self.stats = ExecutorStats()
+        self._stats_lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        stats = self.stats
+        with self._stats_lock:
+            if stats.queued + stats.running >= self._max_workers + self.max_queue_size:
+                stats.rejected += 1
+                raise ExecutorBusy
+            stats.submitted += 1
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+
+        def run():
+            with self._stats_lock:
+                stats.queued -= 1
+                stats.running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    stats.running -= 1
+                    stats.completed += 1
+
+        try:
+            return super().submit(run)
+        except Exception:
+            with self._stats_lock:
+                stats.queued -= 1
+            raise
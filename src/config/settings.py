@@ -19,6 +19,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # extensions
     "rest_framework",
@@ -104,7 +105,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'common.api.pagination.PageCountPagination',
     'PAGE_SIZE': 10,
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.CachedUserJWTAuthentication",
     ],
 
     "TEST_REQUEST_DEFAULT_FORMAT": "json"
@@ -143,6 +144,46 @@ SIMPLE_JWT = {
 PASSWORD_RESET_TIMEOUT = int(os.getenv("PASSWORD_RESET_TIMEOUT", 60 * 60 * 24 * 3))  # Default: 3 days.
 CONFIRM_EMAIL_TIMEOUT = int(os.getenv("CONFIRM_EMAIL_TIMEOUT", 60 * 60 * 24 * 10))  # Default 10 days.
 
+# Users
+USERS_AUTOCOMPLETE_LIMIT = 10
+USERS_AUTH_CACHE_SIZE = 10000  # Users kept in the authentication cache of a process.
+USERS_AUTH_CACHE_TTL = 60  # Seconds.
+USERS_TOKEN_PURGE_BATCH_SIZE = 10000
+USERS_IMPORT_BATCH_SIZE = 5000  # Rows loaded by one COPY in the import_users command.
+# Threads of a process hashing passwords in the auth and password views, 0 runs the views as sync views.
+USERS_AUTH_EXECUTOR_WORKERS = int(os.getenv("USERS_AUTH_EXECUTOR_WORKERS", 4))
+USERS_AUTH_EXECUTOR_QUEUE_SIZE = 100  # Requests waiting for a thread, further requests get 503.
+USERS_REVOCATION_FILTER_TTL = 60  # Seconds between the rebuilds of the blacklisted tokens filter.
+USERS_REVOCATION_FILTER_BACKGROUND = True  # Rebuild the filter in a background thread, not in the request.
+USERS_REVOCATION_FILTER_MIN_CAPACITY = 100000
+USERS_REVOCATION_FILTER_ERROR_RATE = 0.001
+
+# Blog
+BLOG_TIMELINE_BATCH_SIZE = 1000
+BLOG_TIMELINE_BACKFILL_SIZE = 100
+BLOG_TIMELINE_PUSH_THRESHOLD = 10000
+BLOG_TIMELINE_RECENT_POSTS_SIZE = 200
+
+# Notifications
+NOTIFICATIONS_JOB_MAX_ATTEMPTS = 5
+NOTIFICATIONS_JOB_RETRY_DELAY = 10  # Seconds, doubled on every attempt.
+NOTIFICATIONS_JOB_MAX_RETRY_DELAY = 60 * 60
+NOTIFICATIONS_FAN_OUT_BATCH_SIZE = 1000
+NOTIFICATIONS_COALESCE = True  # Collapse unread likes and comments of a post into one row.
+NOTIFICATIONS_COALESCE_ACTORS = 10  # Most recent actor ids kept in a coalesced row.
+NOTIFICATIONS_PARTITIONS_AHEAD = 3  # Months.
+NOTIFICATIONS_PARTITIONS_CHECK_INTERVAL = 60 * 60  # Seconds between the partition checks of the workers.
+NOTIFICATIONS_RETENTION_MONTHS = 12
+NOTIFICATIONS_RETENTION_BATCH_SIZE = 10000  # Users whose counters are decreased by a dropped partition per transaction.
+NOTIFICATIONS_INBOX_CAP = 5000  # Newest notifications kept per user.
+NOTIFICATIONS_TRIM_BATCH_SIZE = 1000
+NOTIFICATIONS_EMAIL_BATCH_SIZE = 100  # Messages sent over one SMTP connection.
+NOTIFICATIONS_EMAIL_MAX_ATTEMPTS = 5
+NOTIFICATIONS_EMAIL_RETRY_DELAY = 30  # Seconds, doubled on every attempt.
+NOTIFICATIONS_EMAIL_MAX_RETRY_DELAY = 60 * 60
+NOTIFICATIONS_EMAIL_LEASE = 10 * 60  # Seconds a claimed batch is skipped by other workers, renewed while it is sent.
+NOTIFICATIONS_STATS_INTERVAL = 5 * 60  # Seconds between the stats reports of the workers.
+
 # Hosts
 HOST = "http://web:8000"
 PUBLIC_HOST = os.getenv("PUBLIC_HOST", "REPLACE_ME").rstrip("/")
@@ -170,7 +211,7 @@ EMAIL_USE_TLS = bool(int(os.getenv("EMAIL_USE_TLS", 0)))
 EMAIL_USE_SSL = bool(int(os.getenv("EMAIL_USE_SSL", 0)))
 EMAIL_SSL_CERTFILE = None
 EMAIL_SSL_KEYFILE = None
-EMAIL_TIMEOUT = None
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", 10))  # Seconds, for every operation on the SMTP connection.
 
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "REPLACE_ME")
 
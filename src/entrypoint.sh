@@ -4,4 +4,4 @@ python manage.py migrate
 python manage.py collectstatic --noinput
 python manage.py setup_system
 
-gunicorn --reload config.wsgi:application --bind 0.0.0.0:8000 --log-level info
\ No newline at end of file
+gunicorn --reload config.asgi:application --worker-class uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000 --log-level info
\ No newline at end of file
@@ -1,4 +1,5 @@
 import django_filters
+from django.db import models
 from rest_framework import filters
 
 
@@ -12,6 +13,14 @@ class SystemNotificationFilter(django_filters.FilterSet):
             type_id=value
         )
 
+    is_read = django_filters.BooleanFilter(
+        method="filter_by_is_read"
+    )
+
+    def filter_by_is_read(self, queryset, name, value):
+        unread = models.Q(is_read=False, id__gt=models.F("last_read_notification_id"))
+        return queryset.exclude(unread) if value else queryset.filter(unread)
+
 
 class SystemNotificationOrderingFilter(filters.OrderingFilter):
     ordering_fields = [
@@ -14,6 +14,10 @@ urlpatterns.extend([
         "get": "list",
     })),
 
+    path("notifications/unread-count", viewsets.SystemNotificationViewSet.as_view({
+        "get": "unread_count",
+    })),
+
     path("notifications/read", viewsets.SystemNotificationViewSet.as_view({
         "post": "read",
     })),
@@ -4,10 +4,20 @@ from notifications.models import SystemNotification
 
 
 class SystemNotificationSerializer(serializers.ModelSerializer):
+    is_read = serializers.SerializerMethodField(method_name="get_is_read")
+
     payload = serializers.SerializerMethodField(method_name="get_payload")
 
+    def get_is_read(self, notification: SystemNotification) -> bool:
+        return notification.is_read or notification.id <= getattr(notification, "last_read_notification_id", 0)
+
     def get_payload(self, notification: SystemNotification) -> dict:
-        return notification.payload
+        payload = dict(notification.payload)
+        if notification.post_id is not None:
+            payload["post_id"] = notification.post_id
+        if notification.from_user_id is not None:
+            payload["from_user_id"] = notification.from_user_id
+        return payload
 
     class Meta:
         model = SystemNotification
@@ -29,3 +39,7 @@ class SystemNotificationReadSerializer(serializers.Serializer):
         required=True,
         allow_empty=False
     )
+
+
+class SystemNotificationUnreadCountSerializer(serializers.Serializer):
+    unread_count = serializers.IntegerField()
@@ -6,10 +6,11 @@ from common.api import pagination as custom_pagination
 from notifications.api.filters import system_notification as custom_filters
 from notifications.api.serializers.system_notification import (
     SystemNotificationSerializer,
-    SystemNotificationReadSerializer
+    SystemNotificationReadSerializer,
+    SystemNotificationUnreadCountSerializer
 )
 from notifications.models import SystemNotification
-from notifications.services import SystemNotificationService
+from notifications.services import SystemNotificationService, SystemNotificationInboxService
 
 
 class SystemNotificationViewSet(mixins.ListModelMixin,
@@ -18,7 +19,7 @@ class SystemNotificationViewSet(mixins.ListModelMixin,
         permissions.IsAuthenticated,
     ]
 
-    pagination_class = custom_pagination.PageCountPagination
+    pagination_class = custom_pagination.PageCountOrKeysetPagination
 
     serializer_class = SystemNotificationSerializer
 
@@ -30,14 +31,29 @@ class SystemNotificationViewSet(mixins.ListModelMixin,
         custom_filters.SystemNotificationOrderingFilter
     ]
 
+    def get_queryset(self):
+        return self.queryset.filter(
+            user_id=self.request.user.pk
+        ).annotate(
+            last_read_notification_id=SystemNotificationInboxService.last_read_notification_id(self.request.user.pk)
+        )
+
     def get_serializer_class(self):
         if self.action == "list":
             return SystemNotificationSerializer
         elif self.action == "read":
             return SystemNotificationReadSerializer
+        elif self.action == "unread_count":
+            return SystemNotificationUnreadCountSerializer
         else:
             raise NotImplementedError
 
+    def unread_count(self, request, *args, **kwargs):
+        serializer = self.get_serializer({
+            "unread_count": SystemNotificationInboxService.get_unread_count(user=request.user)
+        })
+        return Response(serializer.data)
+
     def read(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
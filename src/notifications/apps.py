@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class NotificationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'notifications'
+
+    def ready(self):
+        from notifications.bus import bus
+        from notifications.entrypoints import (
+            UserEntrypoint,
+            BlogPostsEntrypoint,
+            BlogSubscriptionsEntrypoint
+        )
+
+        for entrypoint in [UserEntrypoint(), BlogPostsEntrypoint(), BlogSubscriptionsEntrypoint()]:
+            entrypoint.subscribe(bus)
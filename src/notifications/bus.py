@@ -0,0 +1,57 @@
+import dataclasses
+import time
+from typing import Callable, Dict, List, Type
+
+from notifications.events import Event
+
+
+@dataclasses.dataclass(slots=True)
+class EventStats:
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+
+
+class EventBus:
+    """
+    Routes the events to the subscribed handlers.
+
+    Handlers are subscribed once on the app ready, so the dispatch is a dict lookup.
+    Every event may have several subscribers, they are called in the subscription order.
+    The calls, errors and time spent in the handlers are counted per action.
+    """
+
+    def __init__(self):
+        self.events: Dict[str, Type[Event]] = {}
+        self.subscribers: Dict[Type[Event], List[Callable[[Event], None]]] = {}
+        self.stats: Dict[str, EventStats] = {}
+
+    def subscribe(self,
+                  event_class: Type[Event],
+                  handler: Callable[[Event], None]):
+        self.events[event_class.action] = event_class
+        self.subscribers.setdefault(event_class, []).append(handler)
+        self.stats.setdefault(event_class.action, EventStats())
+
+    def get_event(self, action: str, **kwargs) -> Event:
+        try:
+            event_class = self.events[action]
+        except KeyError:
+            raise NotImplementedError(action)
+        return event_class(**kwargs)
+
+    def publish(self, event: Event):
+        stats = self.stats[event.action]
+        for handler in self.subscribers[type(event)]:
+            started_at = time.perf_counter()
+            stats.calls += 1
+            try:
+                handler(event)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.total_time += time.perf_counter() - started_at
+
+
+bus = EventBus()
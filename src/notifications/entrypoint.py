@@ -1,23 +1,32 @@
+from typing import List
+
+from notifications.bus import bus
+
+
 class Handler:
 
     @classmethod
-    def _get_entrypoint(cls, action: str):
-        from notifications.entrypoints import (
-            UserEntrypoint,
-            BlogPostsEntrypoint,
-            BlogSubscriptionsEntrypoint
-        )
-
-        if action.startswith("USER_"):
-            return UserEntrypoint()
-        elif action.startswith("BLOG_POSTS"):
-            return BlogPostsEntrypoint()
-        elif action.startswith("BLOG_SUBSCRIPTIONS"):
-            return BlogSubscriptionsEntrypoint()
-        else:
-            raise NotImplementedError
+    def accept(cls, action: str, **kwargs):
+        """
+        Enqueue the action, it is dispatched by the `run_notification_workers` command.
+        The job is written in the transaction of the caller, so workers see it once the caller commits.
+        """
+        from notifications.services import NotificationJobService
+
+        bus.get_event(action, **kwargs)
+        NotificationJobService.enqueue(action, kwargs)
 
     @classmethod
-    def accept(cls, action: str, **kwargs):
-        entrypoint = cls._get_entrypoint(action)
-        entrypoint.accept(action, **kwargs)
+    def accept_many(cls, action: str, kwargs_list: List[dict]):
+        """
+        Enqueue the action for every kwargs of `kwargs_list` with one INSERT, like `accept`.
+        """
+        from notifications.services import NotificationJobService
+
+        for kwargs in kwargs_list:
+            bus.get_event(action, **kwargs)
+        NotificationJobService.enqueue_many(action, kwargs_list)
+
+    @classmethod
+    def dispatch(cls, action: str, **kwargs):
+        bus.publish(bus.get_event(action, **kwargs))
@@ -0,0 +1,24 @@
+from typing import Dict, Type
+
+from notifications.bus import EventBus, bus
+from notifications.events import Event
+
+
+class Entrypoint:
+    """
+    `handlers` maps the event classes to the names of the methods handling the event data.
+    """
+    handlers: Dict[Type[Event], str] = {}
+
+    def subscribe(self, event_bus: EventBus):
+        for event_class in self.handlers:
+            event_bus.subscribe(event_class, self.handle)
+
+    def handle(self, event: Event):
+        return getattr(self, self.handlers[type(event)])(data=event.data)
+
+    def accept(self, action: str, **kwargs):
+        event = bus.get_event(action, **kwargs)
+        if type(event) not in self.handlers:
+            raise NotImplementedError(action)
+        return self.handle(event)
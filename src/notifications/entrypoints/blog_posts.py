@@ -1,70 +1,168 @@
+from typing import List
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from blog.models import Subscription
+from common.utils import bulk_copy, chunked
+from notifications import events
+from notifications.entrypoint import Handler
 from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from notifications.services import SystemNotificationService, SystemNotificationInboxService
 
+from .base import Entrypoint
 
-class BlogPostsEntrypoint:
 
-    def accept(self, action: str, **kwargs):
-        if action == "BLOG_POSTS_LIKE":
-            return self._blog_posts_like(**kwargs)
-        elif action == "BLOG_POSTS_LIKE_REMOVE":
-            return self._blog_posts_like_remove(**kwargs)
-        elif action == "BLOG_POSTS_NEW_COMMENT":
-            return self._blog_posts_new_comment(**kwargs)
-        elif action == "BLOG_POSTS_NEW":
-            return self._blog_posts_new(**kwargs)
-        else:
-            raise NotImplementedError
+class BlogPostsEntrypoint(Entrypoint):
+    handlers = {
+        events.BlogPostsLike: "_blog_posts_like",
+        events.BlogPostsLikeRemove: "_blog_posts_like_remove",
+        events.BlogPostsNewComment: "_blog_posts_new_comment",
+        events.BlogPostsNew: "_blog_posts_new",
+    }
 
     def _blog_posts_like(self,
                          data: dict):
-        SystemNotification.objects.create(
-            user_id=data["post"]["user_id"],
+        self._notify_post_user(
+            data=data,
             type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
             event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
-            message=f'New like on your post.',
-            payload={
-                "post_id": data["post"]["id"],
-                "from_user_id": data["from_user"]["id"],
-            },
+            message="New like on your post.",
+            plural_message="%s new likes on your post."
         )
 
     def _blog_posts_like_remove(self,
                                 data: dict):
-        SystemNotification.objects.filter(
+        if settings.NOTIFICATIONS_COALESCE:
+            SystemNotificationService.uncoalesce(
+                user_id=data["post"]["user_id"],
+                event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+                group_key=self._get_group_key(data),
+                from_user_id=data["from_user"]["id"],
+                message="New like on your post.",
+                plural_message="%s new likes on your post."
+            )
+            return
+
+        SystemNotificationService.delete_unread(
             user_id=data["post"]["user_id"],
             event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
-            payload__post_id=data["post"]["id"],
-            is_read=False
-        ).delete()
+            post_id=data["post"]["id"],
+            from_user_id=data["from_user"]["id"]
+        )
 
     def _blog_posts_new_comment(self,
                                 data: dict):
-        SystemNotification.objects.create(
-            user_id=data["post"]["user_id"],
+        self._notify_post_user(
+            data=data,
             type_id=SystemNotificationType.Handbook.BLOG_POSTS_COMMENTS.value,
             event_id=NotificationEvent.Handbook.BLOG_POSTS_NEW_COMMENT.value,
-            message=f'New comment on your post.',
-            payload={
-                "post_id": data["post"]["id"],
-                "from_user_id": data["from_user"]["id"],
-            },
+            message="New comment on your post.",
+            plural_message="%s new comments on your post."
+        )
+
+    def _get_group_key(self,
+                       data: dict) -> str:
+        return f'post:{data["post"]["id"]}'
+
+    def _notify_post_user(self,
+                          data: dict,
+                          type_id: int,
+                          event_id: int,
+                          message: str,
+                          plural_message: str):
+        """
+        With `NOTIFICATIONS_COALESCE` the unread notifications of a post are collapsed into one counted row.
+        """
+        if settings.NOTIFICATIONS_COALESCE:
+            SystemNotificationService.coalesce(
+                user_id=data["post"]["user_id"],
+                type_id=type_id,
+                event_id=event_id,
+                group_key=self._get_group_key(data),
+                post_id=data["post"]["id"],
+                from_user_id=data["from_user"]["id"],
+                message=message,
+                plural_message=plural_message
+            )
+            return
+
+        SystemNotificationService.create(
+            user_id=data["post"]["user_id"],
+            type_id=type_id,
+            event_id=event_id,
+            post_id=data["post"]["id"],
+            from_user_id=data["from_user"]["id"],
+            message=message,
         )
 
     def _blog_posts_new(self,
                         data: dict):
-        SystemNotification.objects.bulk_create([
-            SystemNotification(
-                user_id=user_id,
-                type_id=SystemNotificationType.Handbook.BLOG_POSTS.value,
-                event_id=NotificationEvent.Handbook.BLOG_POSTS_NEW.value,
-                message=f'New post from {data["post"]["user"]["username"]}.',
-                payload={
-                    "post_id": data["post"]["id"],
-                    "from_user": {
-                        "id": data["post"]["user"]["id"],
-                        "username": data["post"]["user"]["username"]
-                    }
-                },
+        """
+        Notify the subscribers of the author, one batch per call.
+
+        The next batch is enqueued in the transaction of the current one, so every batch
+        commits independently and the fan-out resumes after the last committed batch.
+        Explicit `to_user_ids` are notified in a single call.
+        """
+        batch_size = settings.NOTIFICATIONS_FAN_OUT_BATCH_SIZE
+
+        if "to_user_ids" in data:
+            for user_ids in chunked(data["to_user_ids"], batch_size):
+                self._create_blog_posts_new(data, user_ids)
+            return
+
+        user_ids = list(Subscription.objects.filter(
+            to_user_id=data["post"]["user"]["id"],
+            user_id__gt=data.get("after_user_id", 0)
+        ).order_by(
+            "user_id"
+        ).values_list(
+            "user_id",
+            flat=True
+        )[:batch_size])
+        self._create_blog_posts_new(data, user_ids)
+
+        if len(user_ids) == batch_size:
+            Handler.accept(
+                action="BLOG_POSTS_NEW",
+                data={
+                    "post": data["post"],
+                    "after_user_id": user_ids[-1]
+                }
+            )
+
+    def _create_blog_posts_new(self,
+                               data: dict,
+                               user_ids: List[int]):
+        now = timezone.now()
+        with transaction.atomic():
+            SystemNotificationInboxService.lock(user_ids)
+            bulk_copy(
+                SystemNotification,
+                fields=["user", "type", "event", "post", "message", "is_read", "payload", "created_at", "updated_at"],
+                rows=(
+                    (
+                        user_id,
+                        SystemNotificationType.Handbook.BLOG_POSTS.value,
+                        NotificationEvent.Handbook.BLOG_POSTS_NEW.value,
+                        data["post"]["id"],
+                        f'New post from {data["post"]["user"]["username"]}.',
+                        False,
+                        {
+                            "from_user": {
+                                "id": data["post"]["user"]["id"],
+                                "username": data["post"]["user"]["username"]
+                            }
+                        },
+                        now,
+                        now
+                    )
+                    for user_id in user_ids
+                )
             )
-            for user_id in data["to_user_ids"]
-        ])
+            SystemNotificationInboxService.update({
+                user_id: {"unread_count": 1, "notifications_count": 1}
+                for user_id in user_ids
+            })
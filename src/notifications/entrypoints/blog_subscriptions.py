@@ -1,17 +1,18 @@
-from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from notifications import events
+from notifications.models import SystemNotificationType, NotificationEvent
+from notifications.services import SystemNotificationService
 
+from .base import Entrypoint
 
-class BlogSubscriptionsEntrypoint:
 
-    def accept(self, action: str, **kwargs):
-        if action == "BLOG_SUBSCRIPTIONS_NEW":
-            return self._blog_subscriptions_new(**kwargs)
-        else:
-            raise NotImplementedError
+class BlogSubscriptionsEntrypoint(Entrypoint):
+    handlers = {
+        events.BlogSubscriptionsNew: "_blog_subscriptions_new",
+    }
 
     def _blog_subscriptions_new(self,
                                 data: dict):
-        SystemNotification.objects.create(
+        SystemNotificationService.create(
             user_id=data["to_user"]["id"],
             type_id=SystemNotificationType.Handbook.BLOG_SUBSCRIPTIONS.value,
             event_id=NotificationEvent.Handbook.BLOG_SUBSCRIPTIONS_NEW.value,
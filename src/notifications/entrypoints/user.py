@@ -1,15 +1,14 @@
+from notifications import events
 from notifications.senders import EmailSender
 
+from .base import Entrypoint
 
-class UserEntrypoint:
 
-    def accept(self, action: str, **kwargs):
-        if action == "USER_CONFIRM_EMAIL":
-            return self._user_confirm_email(**kwargs)
-        elif action == "USER_FORGOT_PASSWORD":
-            return self._user_forgot_password(**kwargs)
-        else:
-            raise NotImplementedError
+class UserEntrypoint(Entrypoint):
+    handlers = {
+        events.UserConfirmEmail: "_user_confirm_email",
+        events.UserForgotPassword: "_user_forgot_password",
+    }
 
     def _user_confirm_email(self, data: dict):
         EmailSender(
@@ -0,0 +1,67 @@
+import dataclasses
+from typing import ClassVar
+
+# Replaces the credentials kept in the dead jobs and emails.
+REDACTED = "[redacted]"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Event:
+    """
+    Base of the notification events.
+
+    `action` is the name the event is queued under, `data` is the payload of the action.
+    `secret_fields` are the keys of `data` holding credentials (e.g. links with tokens),
+    they are not kept in the queued jobs once the jobs are dead.
+    """
+    action: ClassVar[str]
+
+    secret_fields: ClassVar[tuple] = ()
+
+    data: dict
+
+    @classmethod
+    def redact(cls, data: dict) -> dict:
+        return {
+            key: REDACTED if key in cls.secret_fields else value
+            for key, value in data.items()
+        }
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class UserConfirmEmail(Event):
+    action: ClassVar[str] = "USER_CONFIRM_EMAIL"
+
+    secret_fields: ClassVar[tuple] = ("link",)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class UserForgotPassword(Event):
+    action: ClassVar[str] = "USER_FORGOT_PASSWORD"
+
+    secret_fields: ClassVar[tuple] = ("link",)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogPostsLike(Event):
+    action: ClassVar[str] = "BLOG_POSTS_LIKE"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogPostsLikeRemove(Event):
+    action: ClassVar[str] = "BLOG_POSTS_LIKE_REMOVE"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogPostsNewComment(Event):
+    action: ClassVar[str] = "BLOG_POSTS_NEW_COMMENT"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogPostsNew(Event):
+    action: ClassVar[str] = "BLOG_POSTS_NEW"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BlogSubscriptionsNew(Event):
+    action: ClassVar[str] = "BLOG_SUBSCRIPTIONS_NEW"
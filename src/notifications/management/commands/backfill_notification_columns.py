@@ -0,0 +1,45 @@
+from django.core.management import BaseCommand
+from django.db import connection, models, transaction
+
+from notifications.models import SystemNotification
+
+
+class Command(BaseCommand):
+    help = "Move post_id and from_user_id of notifications from the payload into columns"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Range of notification ids updated in one transaction."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        max_id = SystemNotification.objects.aggregate(max_id=models.Max("id"))["max_id"] or 0
+
+        backfilled = 0
+        for start_id in range(0, max_id, batch_size):
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    UPDATE {SystemNotification._meta.db_table}
+                    SET
+                        post_id = COALESCE(post_id, (payload ->> 'post_id')::bigint),
+                        from_user_id = COALESCE(
+                            from_user_id,
+                            CASE
+                                WHEN jsonb_typeof(payload -> 'from_user_id') = 'number'
+                                THEN (payload ->> 'from_user_id')::bigint
+                            END
+                        ),
+                        payload = payload - 'post_id' - 'from_user_id'
+                    WHERE id > %s AND id <= %s AND (payload ? 'post_id' OR payload ? 'from_user_id')
+                    """,
+                    [start_id, start_id + batch_size]
+                )
+                backfilled += cursor.rowcount
+
+        self.stdout.write(f"Backfilled notifications: {backfilled}.")
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from notifications.services import SystemNotificationPartitionService
+
+
+class Command(BaseCommand):
+    help = "Create the monthly notification partitions ahead and drop the partitions past the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.NOTIFICATIONS_PARTITIONS_AHEAD,
+            help="Number of months after the current one to create partitions for."
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.NOTIFICATIONS_RETENTION_MONTHS,
+            help="Number of full months before the current one to keep."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATIONS_RETENTION_BATCH_SIZE,
+            help="Number of users whose counters are decreased by a dropped partition in one transaction."
+        )
+
+    def handle(self, *args, **options):
+        created = SystemNotificationPartitionService.create_ahead(months_ahead=options["months_ahead"])
+        dropped = SystemNotificationPartitionService.drop_expired(
+            retention_months=options["retention_months"],
+            batch_size=options["batch_size"]
+        )
+
+        self.stdout.write(f"Created partitions: {len(created)}. Dropped partitions: {len(dropped)}.")
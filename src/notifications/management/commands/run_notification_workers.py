@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+import signal
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import connections, DatabaseError
+
+from notifications.bus import bus
+from notifications.services import NotificationJobService, OutboundEmailService, SystemNotificationPartitionService
+
+
+def _format_job_stats() -> str:
+    return "\n".join(
+        f"Event {action}: calls: {stats.calls}. Errors: {stats.errors}. Time: {stats.total_time:.3f}s."
+        for action, stats in bus.stats.items()
+        if stats.calls
+    )
+
+
+def _format_email_stats() -> str:
+    stats = OutboundEmailService.stats
+    return f"Sent emails: {stats.sent}. Failed emails: {stats.failed}. Throughput: {stats.throughput:.2f}/s."
+
+
+def _work(stop, run_batch, batch_size: int, poll_interval: float, report):
+    # The parent process sets `stop` on SIGINT and SIGTERM.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    _loop(stop, run_batch, batch_size, poll_interval, report)
+    connections.close_all()
+
+
+def _loop(stop, run_batch, batch_size: int, poll_interval: float, report):
+    # The stats are counted per process, every worker reports its own ones periodically and on exit.
+    next_report = time.monotonic() + settings.NOTIFICATIONS_STATS_INTERVAL
+    while not stop.is_set():
+        try:
+            claimed = run_batch(batch_size)
+        except DatabaseError:
+            connections.close_all()
+            claimed = 0
+        if not claimed:
+            stop.wait(poll_interval)
+        if time.monotonic() >= next_report:
+            report()
+            next_report = time.monotonic() + settings.NOTIFICATIONS_STATS_INTERVAL
+
+    report()
+
+
+class Command(BaseCommand):
+    help = "Run notification workers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=2,
+            help="Number of worker processes."
+        )
+        parser.add_argument(
+            "--email-workers",
+            type=int,
+            default=1,
+            help="Number of email worker processes, every one sends over one SMTP connection at a time."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of jobs claimed in one transaction."
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when there are no due jobs."
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the due jobs and send the due emails in the current process and exit."
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            self._run_once(options["batch_size"])
+        else:
+            self._run_workers(
+                options["workers"],
+                options["email_workers"],
+                options["batch_size"],
+                options["poll_interval"]
+            )
+
+    def _run_once(self, batch_size: int):
+        claimed = 0
+        while count := NotificationJobService.run_batch(batch_size):
+            claimed += count
+
+        stats = OutboundEmailService.stats
+        sent, failed = stats.sent, stats.failed
+        while OutboundEmailService.send_batch(settings.NOTIFICATIONS_EMAIL_BATCH_SIZE):
+            pass
+        self.stdout.write(
+            f"Claimed jobs: {claimed}. "
+            f"Sent emails: {stats.sent - sent}. "
+            f"Failed emails: {stats.failed - failed}."
+        )
+
+    def _run_workers(self, workers: int, email_workers: int, batch_size: int, poll_interval: float):
+        context = multiprocessing.get_context("fork")
+        stop = context.Event()
+
+        self._create_partitions()
+
+        # Connections must not be shared with the forked workers.
+        connections.close_all()
+        processes = [
+            context.Process(
+                target=_work,
+                args=(stop, NotificationJobService.run_batch, batch_size, poll_interval, self._report_job_stats)
+            )
+            for _ in range(0, workers)
+        ] + [
+            context.Process(
+                target=_work,
+                args=(
+                    stop,
+                    OutboundEmailService.send_batch,
+                    settings.NOTIFICATIONS_EMAIL_BATCH_SIZE,
+                    poll_interval,
+                    self._report_email_stats
+                )
+            )
+            for _ in range(0, email_workers)
+        ]
+        for process in processes:
+            process.start()
+
+        def _stop(signum, frame):
+            stop.set()
+
+        signal.signal(signal.SIGINT, _stop)
+        signal.signal(signal.SIGTERM, _stop)
+
+        self.stdout.write(f"Started workers: {workers}. Started email workers: {email_workers}.")
+
+        # The parent process keeps the partitions of the coming months,
+        # inserts of the workers fail without the partition of the current month.
+        # The loop sleeps instead of waiting on `stop`: the handlers set it in this thread,
+        # and `Event.set` deadlocks on the lock held by an interrupted `Event.wait`.
+        next_check = time.monotonic() + settings.NOTIFICATIONS_PARTITIONS_CHECK_INTERVAL
+        while not stop.is_set() and any(process.is_alive() for process in processes):
+            time.sleep(poll_interval)
+            if time.monotonic() >= next_check:
+                self._create_partitions()
+                next_check = time.monotonic() + settings.NOTIFICATIONS_PARTITIONS_CHECK_INTERVAL
+
+        for process in processes:
+            process.join()
+
+    def _report_job_stats(self):
+        if stats := _format_job_stats():
+            self.stdout.write("\n".join(f"Worker {os.getpid()}: {line}" for line in stats.splitlines()))
+
+    def _report_email_stats(self):
+        self.stdout.write(f"Email worker {os.getpid()}: {_format_email_stats()}")
+
+    def _create_partitions(self):
+        try:
+            SystemNotificationPartitionService.create_ahead(months_ahead=settings.NOTIFICATIONS_PARTITIONS_AHEAD)
+        except DatabaseError as ex:
+            self.stderr.write(f"Partitions are not created: {ex}")
+        finally:
+            connections.close_all()
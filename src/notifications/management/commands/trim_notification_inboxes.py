@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from notifications.models import SystemNotificationInbox
+from notifications.services import SystemNotificationService
+
+
+class Command(BaseCommand):
+    help = "Delete the oldest notifications of the users beyond the inbox cap"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--cap",
+            type=int,
+            default=settings.NOTIFICATIONS_INBOX_CAP,
+            help="Number of the newest notifications kept per user."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATIONS_TRIM_BATCH_SIZE,
+            help="Number of notifications deleted in one transaction."
+        )
+
+    def handle(self, *args, **options):
+        cap = options["cap"]
+        batch_size = options["batch_size"]
+
+        last_user_id = 0
+        trimmed = 0
+        while True:
+            user_ids = list(SystemNotificationInbox.objects.filter(
+                user_id__gt=last_user_id,
+                notifications_count__gt=cap
+            ).order_by("user_id").values_list("user_id", flat=True)[:100])
+            if not user_ids:
+                break
+
+            for user_id in user_ids:
+                while True:
+                    deleted = SystemNotificationService.trim(user_id=user_id, cap=cap, batch_size=batch_size)
+                    trimmed += deleted
+                    if deleted < batch_size:
+                        break
+            last_user_id = user_ids[-1]
+
+        self.stdout.write(f"Trimmed notifications: {trimmed}.")
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='systemnotification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='notifications_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemnotification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['user', '-created_at', '-id'], name='notifications_user_unread_idx'),
+        ),
+        migrations.AlterField(
+            model_name='systemnotification',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='system_notifications', to=settings.AUTH_USER_MODEL, verbose_name='user'),
+        ),
+    ]
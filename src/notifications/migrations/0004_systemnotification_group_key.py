@@ -0,0 +1,24 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notificationjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemnotification',
+            name='group_key',
+            field=models.CharField(blank=True, help_text='Unread notifications with the same user, event and group key are coalesced into one row.', max_length=100, null=True, verbose_name='group key'),
+        ),
+        migrations.AddConstraint(
+            model_name='systemnotification',
+            constraint=models.UniqueConstraint(condition=models.Q(('group_key__isnull', False), ('is_read', False)), fields=('user', 'event', 'group_key'), name='notifications_unread_group_uniq'),
+        ),
+    ]
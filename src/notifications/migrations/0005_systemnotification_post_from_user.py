@@ -0,0 +1,31 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_userstats'),
+        ('notifications', '0004_systemnotification_group_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemnotification',
+            name='from_user',
+            field=models.ForeignKey(blank=True, db_constraint=False, db_index=False, help_text='Actor of like and comment notifications.', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='from user'),
+        ),
+        migrations.AddField(
+            model_name='systemnotification',
+            name='post',
+            field=models.ForeignKey(blank=True, db_constraint=False, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='blog.post', verbose_name='post'),
+        ),
+        migrations.AddIndex(
+            model_name='systemnotification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['post', 'from_user'], name='notifications_unread_post_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_systemnotification_post_from_user'),
+        ('users', '0003_username_trgm_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SystemNotificationInbox',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_inbox', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='user')),
+                ('unread_count', models.PositiveIntegerField(default=0, verbose_name='unread notifications count')),
+            ],
+            options={
+                'verbose_name': 'System notification inbox',
+                'verbose_name_plural': 'System notification inboxes',
+            },
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO notifications_systemnotificationinbox (user_id, unread_count)
+                SELECT user_id, COUNT(*)
+                FROM notifications_systemnotification
+                WHERE NOT is_read
+                GROUP BY user_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0006_systemnotificationinbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemnotificationinbox',
+            name='last_read_notification_id',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='last read notification id'),
+        ),
+    ]
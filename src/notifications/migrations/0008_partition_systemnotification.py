@@ -0,0 +1,119 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+# The table is rebuilt as a partitioned table with the indexes and constraints of the model.
+# A partitioned table can not have an identity column, `id` is served by a sequence,
+# and the primary key has to include the partition key, so it does not enforce a unique `id`:
+# ids are unique as long as they are assigned by the sequence only (see `SystemNotification.save`).
+# Partitions cover the existing rows and three months ahead,
+# afterwards they are maintained by the `maintain_notification_partitions` command.
+PARTITION_SQL = """
+ALTER TABLE notifications_systemnotification ALTER COLUMN id DROP IDENTITY;
+ALTER TABLE notifications_systemnotification RENAME TO notifications_systemnotification_old;
+
+CREATE SEQUENCE notifications_systemnotification_id_seq;
+
+CREATE TABLE notifications_systemnotification (
+    id bigint NOT NULL DEFAULT nextval('notifications_systemnotification_id_seq'),
+    message text NOT NULL,
+    is_read boolean NOT NULL,
+    payload jsonb NOT NULL,
+    created_at timestamp with time zone NOT NULL,
+    updated_at timestamp with time zone NOT NULL,
+    event_id bigint NOT NULL,
+    user_id bigint NOT NULL,
+    type_id bigint NOT NULL,
+    group_key varchar(100) NULL,
+    from_user_id bigint NULL,
+    post_id bigint NULL
+) PARTITION BY RANGE (created_at);
+
+ALTER SEQUENCE notifications_systemnotification_id_seq OWNED BY notifications_systemnotification.id;
+
+DO $$
+DECLARE
+    month timestamp with time zone;
+BEGIN
+    SELECT date_trunc('month', COALESCE(MIN(created_at), now()), 'UTC')
+    INTO month
+    FROM notifications_systemnotification_old;
+
+    WHILE month < date_trunc('month', now(), 'UTC') + interval '4 months' LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF notifications_systemnotification FOR VALUES FROM (%L) TO (%L)',
+            'notifications_systemnotification_p' || to_char(month AT TIME ZONE 'UTC', 'YYYYMM'),
+            month,
+            month + interval '1 month'
+        );
+        month := month + interval '1 month';
+    END LOOP;
+END
+$$;
+
+INSERT INTO notifications_systemnotification (
+    id, message, is_read, payload, created_at, updated_at, event_id, user_id, type_id, group_key, from_user_id, post_id
+)
+SELECT
+    id, message, is_read, payload, created_at, updated_at, event_id, user_id, type_id, group_key, from_user_id, post_id
+FROM notifications_systemnotification_old;
+
+SELECT setval('notifications_systemnotification_id_seq', COALESCE(MAX(id), 1), MAX(id) IS NOT NULL)
+FROM notifications_systemnotification;
+
+DROP TABLE notifications_systemnotification_old;
+
+ALTER TABLE notifications_systemnotification
+    ADD CONSTRAINT notifications_systemnotification_pkey PRIMARY KEY (id, created_at);
+
+ALTER TABLE notifications_systemnotification
+    ADD CONSTRAINT notifications_system_event_id_a2e47870_fk_notificat
+    FOREIGN KEY (event_id) REFERENCES notifications_notificationevent (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE notifications_systemnotification
+    ADD CONSTRAINT notifications_system_type_id_b0fce564_fk_notificat
+    FOREIGN KEY (type_id) REFERENCES notifications_systemnotificationtype (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE notifications_systemnotification
+    ADD CONSTRAINT notifications_system_user_id_60506bed_fk_users_use
+    FOREIGN KEY (user_id) REFERENCES users_user (id) DEFERRABLE INITIALLY DEFERRED;
+
+CREATE INDEX notifications_systemnotification_event_id_a2e47870
+    ON notifications_systemnotification (event_id);
+CREATE INDEX notifications_systemnotification_type_id_b0fce564
+    ON notifications_systemnotification (type_id);
+CREATE INDEX notifications_user_idx
+    ON notifications_systemnotification (user_id, created_at DESC, id DESC);
+CREATE INDEX notifications_user_unread_idx
+    ON notifications_systemnotification (user_id, created_at DESC, id DESC) WHERE NOT is_read;
+CREATE INDEX notifications_unread_group_idx
+    ON notifications_systemnotification (user_id, event_id, group_key) WHERE group_key IS NOT NULL AND NOT is_read;
+CREATE INDEX notifications_unread_post_idx
+    ON notifications_systemnotification (post_id, from_user_id) WHERE NOT is_read;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_userstats'),
+        ('notifications', '0007_systemnotificationinbox_last_read'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(PARTITION_SQL),
+            ],
+            state_operations=[
+                migrations.RemoveConstraint(
+                    model_name='systemnotification',
+                    name='notifications_unread_group_uniq',
+                ),
+                migrations.AddIndex(
+                    model_name='systemnotification',
+                    index=models.Index(condition=models.Q(('group_key__isnull', False), ('is_read', False)), fields=['user', 'event', 'group_key'], name='notifications_unread_group_idx'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0008_partition_systemnotification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemnotificationinbox',
+            name='notifications_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='notifications count'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO notifications_systemnotificationinbox
+                    (user_id, unread_count, notifications_count, last_read_notification_id)
+                SELECT user_id, 0, COUNT(*), 0
+                FROM notifications_systemnotification
+                GROUP BY user_id
+                ON CONFLICT (user_id) DO UPDATE SET notifications_count = EXCLUDED.notifications_count
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,3 +1,6 @@
 from .notification_event import NotificationEvent
+from .notification_job import NotificationJob
+from .outbound_email import OutboundEmail
 from .system_notification import SystemNotification
+from .system_notification_inbox import SystemNotificationInbox
 from .system_notification_type import SystemNotificationType
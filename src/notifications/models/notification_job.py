@@ -0,0 +1,65 @@
+from django.db import models
+from django.utils import timezone
+
+
+class NotificationJob(models.Model):
+    """
+    Queued call of `notifications.Handler`, processed by the `run_notification_workers` command.
+    Done jobs are deleted, jobs that failed `NOTIFICATIONS_JOB_MAX_ATTEMPTS` times are kept as dead.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DEAD = "dead", "Dead"
+
+    action = models.CharField(
+        verbose_name="action",
+        max_length=100
+    )
+
+    kwargs = models.JSONField(
+        verbose_name="handler arguments",
+        default=dict
+    )
+
+    status = models.CharField(
+        verbose_name="status",
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+
+    attempts = models.PositiveSmallIntegerField(
+        verbose_name="attempts",
+        default=0
+    )
+
+    run_at = models.DateTimeField(
+        verbose_name="run not earlier than",
+        default=timezone.now
+    )
+
+    last_error = models.TextField(
+        verbose_name="last error",
+        null=True
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True
+    )
+
+    class Meta:
+        verbose_name = "Notification job"
+        verbose_name_plural = "Notification jobs"
+
+        indexes = [
+            models.Index(
+                fields=["run_at", "id"],
+                condition=models.Q(status="pending"),
+                name="notifications_job_pending_idx"
+            ),
+        ]
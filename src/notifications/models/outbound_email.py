@@ -0,0 +1,76 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OutboundEmail(models.Model):
+    """
+    Queued email, sent by the `run_notification_workers` command.
+    Sent emails are deleted, emails that failed `NOTIFICATIONS_EMAIL_MAX_ATTEMPTS` times are kept as dead,
+    with the body redacted.
+    Failures to connect to the relay are not counted as attempts.
+    `run_at` of a claimed email is moved by the lease of the claiming worker.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DEAD = "dead", "Dead"
+
+    subject = models.TextField(
+        verbose_name="subject"
+    )
+
+    body = models.TextField(
+        verbose_name="body"
+    )
+
+    from_email = models.CharField(
+        verbose_name="from email",
+        max_length=254
+    )
+
+    to = models.JSONField(
+        verbose_name="recipients",
+        default=list
+    )
+
+    status = models.CharField(
+        verbose_name="status",
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+
+    attempts = models.PositiveSmallIntegerField(
+        verbose_name="attempts",
+        default=0
+    )
+
+    run_at = models.DateTimeField(
+        verbose_name="send not earlier than",
+        default=timezone.now
+    )
+
+    last_error = models.TextField(
+        verbose_name="last error",
+        null=True
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True
+    )
+
+    class Meta:
+        verbose_name = "Outbound email"
+        verbose_name_plural = "Outbound emails"
+
+        indexes = [
+            models.Index(
+                fields=["run_at", "id"],
+                condition=models.Q(status="pending"),
+                name="notifications_mail_pending_idx"
+            ),
+        ]
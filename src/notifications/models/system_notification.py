@@ -2,11 +2,20 @@ from django.db import models
 
 
 class SystemNotification(models.Model):
+    """
+    Stored in monthly range partitions on `created_at`, the primary key of the table is `(id, created_at)`.
+    Partitions are created ahead and dropped after the retention period
+    by the `maintain_notification_partitions` command.
+
+    The primary key does not enforce a unique `id`, while the rows are addressed by `id` (always with `user_id`).
+    `id` is unique as long as it is assigned by the table sequence only, so explicit ids are rejected on insert.
+    """
     user = models.ForeignKey(
         "users.User",
         on_delete=models.PROTECT,
         verbose_name="user",
-        related_name="system_notifications"
+        related_name="system_notifications",
+        db_index=False
     )
 
     type = models.ForeignKey(
@@ -37,6 +46,37 @@ class SystemNotification(models.Model):
         default=dict
     )
 
+    post = models.ForeignKey(
+        "blog.Post",
+        on_delete=models.DO_NOTHING,
+        verbose_name="post",
+        related_name="+",
+        null=True,
+        blank=True,
+        db_index=False,
+        db_constraint=False
+    )
+
+    from_user = models.ForeignKey(
+        "users.User",
+        on_delete=models.DO_NOTHING,
+        verbose_name="from user",
+        related_name="+",
+        null=True,
+        blank=True,
+        db_index=False,
+        db_constraint=False,
+        help_text="Actor of like and comment notifications."
+    )
+
+    group_key = models.CharField(
+        verbose_name="group key",
+        max_length=100,
+        null=True,
+        blank=True,
+        help_text="Unread notifications with the same user, event and group key are coalesced into one row."
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
@@ -44,3 +84,31 @@ class SystemNotification(models.Model):
     updated_at = models.DateTimeField(
         auto_now=True
     )
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.id is not None:
+            raise ValueError("`id` of a notification is assigned by the sequence of the table.")
+        super().save(*args, **kwargs)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notifications_user_idx"
+            ),
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                condition=models.Q(is_read=False),
+                name="notifications_user_unread_idx"
+            ),
+            models.Index(
+                fields=["user", "event", "group_key"],
+                condition=models.Q(is_read=False, group_key__isnull=False),
+                name="notifications_unread_group_idx"
+            ),
+            models.Index(
+                fields=["post", "from_user"],
+                condition=models.Q(is_read=False),
+                name="notifications_unread_post_idx"
+            ),
+        ]
@@ -0,0 +1,37 @@
+from django.db import models
+
+
+class SystemNotificationInbox(models.Model):
+    """
+    Denormalized notification counters of the user, kept up to date by `SystemNotificationInboxService`.
+    The row is created on the first change, a missing row means zero counters.
+
+    Notifications up to `last_read_notification_id` are read regardless of their `is_read`,
+    so reading all notifications moves the watermark instead of updating every row.
+    """
+    user = models.OneToOneField(
+        "users.User",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        verbose_name="user",
+        related_name="notification_inbox"
+    )
+
+    unread_count = models.PositiveIntegerField(
+        verbose_name="unread notifications count",
+        default=0
+    )
+
+    notifications_count = models.PositiveIntegerField(
+        verbose_name="notifications count",
+        default=0
+    )
+
+    last_read_notification_id = models.PositiveBigIntegerField(
+        verbose_name="last read notification id",
+        default=0
+    )
+
+    class Meta:
+        verbose_name = "System notification inbox"
+        verbose_name_plural = "System notification inboxes"
@@ -1,4 +1,5 @@
 from .mail import (
     EmailSenderInterface,
+    QueuedEmailSender,
     EmailSender
 )
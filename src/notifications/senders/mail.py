@@ -3,6 +3,8 @@ from typing import List
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 
+from notifications.services import OutboundEmailService
+
 
 class EmailSenderInterface:
 
@@ -38,5 +40,20 @@ class AbstractEmailSender(EmailSenderInterface):
         return self._send(msg)
 
 
-class EmailSender(AbstractEmailSender):
+class QueuedEmailSender(AbstractEmailSender):
+    """
+    Queues the message, it is sent by the `run_notification_workers` command.
+    """
+
+    def _send(self, msg):
+        OutboundEmailService.enqueue(
+            subject=msg.subject,
+            body=msg.body,
+            from_email=msg.from_email,
+            to=msg.to
+        )
+        return True
+
+
+class EmailSender(QueuedEmailSender):
     pass
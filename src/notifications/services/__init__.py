@@ -1 +1,5 @@
+from .notification_job import NotificationJobService
+from .outbound_email import OutboundEmailService
 from .system_notification import SystemNotificationService
+from .system_notification_inbox import SystemNotificationInboxService
+from .system_notification_partition import SystemNotificationPartitionService
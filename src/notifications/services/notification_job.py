@@ -0,0 +1,96 @@
+import datetime
+import traceback
+from typing import List
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from notifications.bus import bus
+from notifications.models import NotificationJob
+
+
+class NotificationJobService:
+
+    @staticmethod
+    def enqueue(action: str,
+                kwargs: dict) -> NotificationJob:
+        return NotificationJob.objects.create(
+            action=action,
+            kwargs=kwargs
+        )
+
+    @staticmethod
+    def enqueue_many(action: str,
+                     kwargs_list: List[dict]) -> List[NotificationJob]:
+        return NotificationJob.objects.bulk_create([
+            NotificationJob(action=action, kwargs=kwargs)
+            for kwargs in kwargs_list
+        ])
+
+    @staticmethod
+    def run_batch(batch_size: int) -> int:
+        """
+        Claim and run up to `batch_size` due jobs, returns the number of claimed jobs.
+        Done jobs are deleted, so the payloads with credentials are not kept after the success.
+
+        Jobs stay locked until the batch is committed, so concurrent workers skip them,
+        and the jobs of a worker that dies are claimed again.
+        Each job runs in a savepoint: the changes of a failed job are rolled back.
+        Constraints are checked immediately, so a deferred violation fails its job instead of the batch.
+        """
+        from notifications.entrypoint import Handler
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+            jobs = list(
+                NotificationJob.objects.select_for_update(
+                    skip_locked=True
+                ).filter(
+                    status=NotificationJob.Status.PENDING,
+                    run_at__lte=timezone.now()
+                ).order_by(
+                    "run_at",
+                    "id"
+                )[:batch_size]
+            )
+
+            for job in jobs:
+                try:
+                    with transaction.atomic():
+                        Handler.dispatch(job.action, **job.kwargs)
+                except Exception:
+                    NotificationJobService._fail(job, traceback.format_exc())
+                else:
+                    job.delete()
+
+        return len(jobs)
+
+    @staticmethod
+    def _fail(job: NotificationJob,
+              error: str) -> None:
+        job.attempts += 1
+        job.last_error = error
+        if job.attempts >= settings.NOTIFICATIONS_JOB_MAX_ATTEMPTS:
+            job.status = NotificationJob.Status.DEAD
+            job.kwargs = NotificationJobService._redact(job.action, job.kwargs)
+        else:
+            delay = min(
+                settings.NOTIFICATIONS_JOB_RETRY_DELAY * 2 ** (job.attempts - 1),
+                settings.NOTIFICATIONS_JOB_MAX_RETRY_DELAY
+            )
+            job.run_at = timezone.now() + datetime.timedelta(seconds=delay)
+        job.save(update_fields=["attempts", "last_error", "status", "run_at", "kwargs", "updated_at"])
+
+    @staticmethod
+    def _redact(action: str,
+                kwargs: dict) -> dict:
+        """
+        Dead jobs are kept for inspection, the credentials of their payload are not.
+        """
+        event_class = bus.events.get(action)
+        if event_class is None or not isinstance(kwargs.get("data"), dict):
+            return kwargs
+        return {**kwargs, "data": event_class.redact(kwargs["data"])}
@@ -0,0 +1,186 @@
+import contextlib
+import dataclasses
+import datetime
+import smtplib
+import time
+import traceback
+from typing import List
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from notifications.events import REDACTED
+from notifications.models import OutboundEmail
+
+
+class _RelayUnavailable(Exception):
+    """
+    The connection to the relay failed, the email itself was not rejected.
+    """
+
+
+@dataclasses.dataclass(slots=True)
+class OutboundEmailStats:
+    sent: int = 0
+    failed: int = 0
+    total_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Sent emails per second of the time spent on sending.
+        """
+        return self.sent / self.total_time if self.total_time else 0.0
+
+
+class OutboundEmailService:
+    stats = OutboundEmailStats()
+
+    @staticmethod
+    def enqueue(subject: str,
+                body: str,
+                from_email: str,
+                to: List[str]) -> OutboundEmail:
+        return OutboundEmail.objects.create(
+            subject=subject,
+            body=body,
+            from_email=from_email,
+            to=to
+        )
+
+    @staticmethod
+    def send_batch(batch_size: int) -> int:
+        """
+        Claim and send up to `batch_size` due emails over one connection, returns the number of claimed emails.
+
+        The batch is claimed in a transaction of its own (see `_claim`), the emails are sent outside of it
+        and every sent email is deleted right away, so a crash re-sends at most the email in flight.
+        Every operation on the connection is limited by `EMAIL_TIMEOUT`.
+        An email rejected by the relay is retried with a backoff and counted as an attempt.
+        When the relay is unavailable, the rest of the batch is postponed without counting an attempt,
+        so an outage does not make the emails dead.
+        """
+        stats = OutboundEmailService.stats
+
+        emails = OutboundEmailService._claim(batch_size)
+        if not emails:
+            return 0
+
+        leased_until = time.monotonic() + settings.NOTIFICATIONS_EMAIL_LEASE
+        connection = get_connection(timeout=settings.EMAIL_TIMEOUT)
+        try:
+            for index, email in enumerate(emails):
+                # A slow relay can take the whole lease, the rest of the batch is leased again
+                # before other workers could claim the emails and send them twice.
+                if leased_until - time.monotonic() < settings.NOTIFICATIONS_EMAIL_LEASE / 2:
+                    OutboundEmailService._lease(emails[index:])
+                    leased_until = time.monotonic() + settings.NOTIFICATIONS_EMAIL_LEASE
+
+                started_at = time.perf_counter()
+                try:
+                    OutboundEmailService._send(email, connection)
+                except Exception as ex:
+                    with contextlib.suppress(Exception):
+                        connection.close()
+                    stats.failed += 1
+                    if isinstance(ex, _RelayUnavailable):
+                        OutboundEmailService._postpone(emails[index:], traceback.format_exc())
+                        break
+                    OutboundEmailService._fail(email, traceback.format_exc())
+                else:
+                    OutboundEmail.objects.filter(id=email.pk).delete()
+                    stats.sent += 1
+                finally:
+                    stats.total_time += time.perf_counter() - started_at
+        finally:
+            with contextlib.suppress(Exception):
+                connection.close()
+
+        return len(emails)
+
+    @staticmethod
+    def _claim(batch_size: int) -> List[OutboundEmail]:
+        """
+        Lease up to `batch_size` due emails for `NOTIFICATIONS_EMAIL_LEASE` seconds,
+        concurrent workers skip them, and the emails of a worker that dies are due again after the lease.
+        `send_batch` renews the lease of the unsent emails when half of it has passed.
+        """
+        with transaction.atomic():
+            emails = list(
+                OutboundEmail.objects.select_for_update(
+                    skip_locked=True
+                ).filter(
+                    status=OutboundEmail.Status.PENDING,
+                    run_at__lte=timezone.now()
+                ).order_by(
+                    "run_at",
+                    "id"
+                )[:batch_size]
+            )
+            if emails:
+                OutboundEmailService._lease(emails)
+        return emails
+
+    @staticmethod
+    def _lease(emails: List[OutboundEmail]) -> None:
+        OutboundEmail.objects.filter(
+            id__in=[email.pk for email in emails]
+        ).update(
+            run_at=timezone.now() + datetime.timedelta(seconds=settings.NOTIFICATIONS_EMAIL_LEASE),
+            updated_at=timezone.now()
+        )
+
+    @staticmethod
+    def _send(email: OutboundEmail,
+              connection) -> None:
+        try:
+            # Opened explicitly, so `send_messages` keeps the connection open.
+            connection.open()
+        except Exception as ex:
+            raise _RelayUnavailable() from ex
+
+        try:
+            connection.send_messages([OutboundEmailService._get_message(email, connection)])
+        except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError) as ex:
+            raise _RelayUnavailable() from ex
+
+    @staticmethod
+    def _get_message(email: OutboundEmail,
+                     connection) -> EmailMultiAlternatives:
+        return EmailMultiAlternatives(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email,
+            to=email.to,
+            connection=connection
+        )
+
+    @staticmethod
+    def _postpone(emails: List[OutboundEmail],
+                  error: str) -> None:
+        OutboundEmail.objects.filter(
+            id__in=[email.pk for email in emails]
+        ).update(
+            run_at=timezone.now() + datetime.timedelta(seconds=settings.NOTIFICATIONS_EMAIL_RETRY_DELAY),
+            last_error=error,
+            updated_at=timezone.now()
+        )
+
+    @staticmethod
+    def _fail(email: OutboundEmail,
+              error: str) -> None:
+        email.attempts += 1
+        email.last_error = error
+        if email.attempts >= settings.NOTIFICATIONS_EMAIL_MAX_ATTEMPTS:
+            email.status = OutboundEmail.Status.DEAD
+            # Dead emails are kept for inspection, their bodies may hold confirmation and reset links.
+            email.body = REDACTED
+        else:
+            delay = min(
+                settings.NOTIFICATIONS_EMAIL_RETRY_DELAY * 2 ** (email.attempts - 1),
+                settings.NOTIFICATIONS_EMAIL_MAX_RETRY_DELAY
+            )
+            email.run_at = timezone.now() + datetime.timedelta(seconds=delay)
+        email.save(update_fields=["attempts", "last_error", "status", "run_at", "body", "updated_at"])
@@ -1,25 +1,241 @@
 from typing import List
 
-from notifications.models import SystemNotification
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from notifications.models import SystemNotification, SystemNotificationInbox
+from notifications.services.system_notification_inbox import SystemNotificationInboxService
 from users.models import User
 
 
 class SystemNotificationService:
 
+    @staticmethod
+    def unread(user_id: int) -> models.Q:
+        """
+        Condition of unread notifications of the user: not read explicitly and above the read watermark.
+        """
+        return models.Q(
+            user_id=user_id,
+            is_read=False,
+            id__gt=SystemNotificationInboxService.last_read_notification_id(user_id)
+        )
+
+    @staticmethod
+    def create(**fields) -> SystemNotification:
+        with transaction.atomic():
+            SystemNotificationInboxService.lock([fields["user_id"]])
+            notification = SystemNotification.objects.create(**fields)
+            if not notification.is_read:
+                SystemNotificationInboxService.update({
+                    notification.user_id: {"unread_count": 1, "notifications_count": 1}
+                })
+            else:
+                SystemNotificationInboxService.update({
+                    notification.user_id: {"notifications_count": 1}
+                })
+        return notification
+
+    @staticmethod
+    def delete_unread(user_id: int,
+                      **filters):
+        with transaction.atomic():
+            deleted, _ = SystemNotification.objects.filter(
+                SystemNotificationService.unread(user_id),
+                **filters
+            ).delete()
+            SystemNotificationInboxService.update({
+                user_id: {"unread_count": -deleted, "notifications_count": -deleted}
+            })
+
+    @staticmethod
+    def trim(user_id: int,
+             cap: int,
+             batch_size: int) -> int:
+        """
+        Delete up to `batch_size` of the oldest notifications of the user beyond the newest `cap`,
+        returns the number of deleted notifications.
+        """
+        table = SystemNotification._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                DELETE FROM {table} AS n
+                USING (
+                    SELECT id, created_at
+                    FROM {table}
+                    WHERE user_id = %(user_id)s
+                    ORDER BY created_at DESC, id DESC
+                    OFFSET %(cap)s
+                    LIMIT %(batch_size)s
+                ) AS overflow
+                WHERE n.id = overflow.id AND n.created_at = overflow.created_at
+                RETURNING NOT n.is_read AND n.id > COALESCE((
+                    SELECT last_read_notification_id FROM {SystemNotificationInbox._meta.db_table}
+                    WHERE user_id = %(user_id)s
+                ), 0)
+                """,
+                {
+                    "user_id": user_id,
+                    "cap": cap,
+                    "batch_size": batch_size,
+                }
+            )
+            unread = [is_unread for is_unread, in cursor.fetchall()]
+            SystemNotificationInboxService.update({
+                user_id: {"unread_count": -sum(unread), "notifications_count": -len(unread)}
+            })
+        return len(unread)
+
     @staticmethod
     def read_by_ids(user: User,
                     ids: List[int]):
-        SystemNotification.objects.filter(
-            user_id=user.pk,
-            id__in=ids
-        ).update(
-            is_read=True
-        )
+        with transaction.atomic():
+            updated = SystemNotification.objects.filter(
+                SystemNotificationService.unread(user.pk),
+                id__in=ids
+            ).update(
+                is_read=True
+            )
+            SystemNotificationInboxService.update({
+                user.pk: {"unread_count": -updated}
+            })
 
     @staticmethod
     def read_all(user: User):
-        SystemNotification.objects.filter(
-            user_id=user.pk,
-        ).update(
-            is_read=True
-        )
+        """
+        Move the read watermark to the last notification of the user, the rows are not updated.
+        """
+        with transaction.atomic():
+            SystemNotificationInboxService.read_all(user_id=user.pk)
+
+    @staticmethod
+    def coalesce(user_id: int,
+                 type_id: int,
+                 event_id: int,
+                 group_key: str,
+                 post_id: int,
+                 from_user_id: int,
+                 message: str,
+                 plural_message: str):
+        """
+        Insert an unread notification or add the actor to the unread one of the same group.
+
+        The payload keeps the number of events in `count` and the most recent actors in `from_user_ids`,
+        `from_user_id` is the last actor.
+        `plural_message` is a format string for the count, e.g. `%s new likes on your post.`.
+        The row is moved to the top of the list on every event.
+        A row below the read watermark is marked read first, so the event starts a new row.
+
+        Events of a group are serialized by a transaction-level advisory lock,
+        a unique index can not enforce one unread row per group on the partitioned table.
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                [f"notifications:{user_id}:{event_id}:{group_key}"]
+            )
+            cursor.execute(
+                f"""
+                UPDATE {SystemNotification._meta.db_table}
+                SET is_read = true
+                WHERE user_id = %(user_id)s AND event_id = %(event_id)s AND group_key = %(group_key)s
+                    AND NOT is_read
+                    AND id <= (
+                        SELECT last_read_notification_id FROM {SystemNotificationInbox._meta.db_table}
+                        WHERE user_id = %(user_id)s
+                    )
+                """,
+                {
+                    "user_id": user_id,
+                    "event_id": event_id,
+                    "group_key": group_key,
+                }
+            )
+            cursor.execute(
+                f"""
+                UPDATE {SystemNotification._meta.db_table} AS n
+                SET
+                    payload = n.payload || jsonb_build_object(
+                        'count', COALESCE((n.payload ->> 'count')::int, 1) + 1,
+                        'from_user_ids', jsonb_path_query_array(
+                            jsonb_build_array(%(from_user_id)s) || COALESCE(n.payload -> 'from_user_ids', '[]'),
+                            '$[0 to $last]',
+                            jsonb_build_object('last', %(actors)s - 1)
+                        )
+                    ),
+                    from_user_id = %(from_user_id)s,
+                    message = format(%(plural_message)s, COALESCE((n.payload ->> 'count')::int, 1) + 1),
+                    created_at = %(now)s,
+                    updated_at = %(now)s
+                WHERE user_id = %(user_id)s AND event_id = %(event_id)s AND group_key = %(group_key)s
+                    AND NOT is_read
+                """,
+                {
+                    "user_id": user_id,
+                    "event_id": event_id,
+                    "group_key": group_key,
+                    "from_user_id": from_user_id,
+                    "now": timezone.now(),
+                    "actors": settings.NOTIFICATIONS_COALESCE_ACTORS,
+                    "plural_message": plural_message,
+                }
+            )
+            if cursor.rowcount:
+                return
+
+            SystemNotificationService.create(
+                user_id=user_id,
+                type_id=type_id,
+                event_id=event_id,
+                group_key=group_key,
+                post_id=post_id,
+                from_user_id=from_user_id,
+                message=message,
+                payload={
+                    "from_user_ids": [from_user_id],
+                    "count": 1
+                }
+            )
+
+    @staticmethod
+    def uncoalesce(user_id: int,
+                   event_id: int,
+                   group_key: str,
+                   from_user_id: int,
+                   message: str,
+                   plural_message: str):
+        """
+        Remove one event of the actor from the unread notification of the group,
+        the notification is deleted with its last event.
+
+        Nothing is changed unless the actor is in `from_user_ids`: the event was counted in a row
+        that is read already, or the actor is older than the `NOTIFICATIONS_COALESCE_ACTORS` kept ones.
+        """
+        with transaction.atomic():
+            notification = SystemNotification.objects.select_for_update().filter(
+                SystemNotificationService.unread(user_id),
+                event_id=event_id,
+                group_key=group_key
+            ).first()
+            if notification is None or from_user_id not in notification.payload.get("from_user_ids", []):
+                return
+
+            count = notification.payload.get("count", 1) - 1
+            if count <= 0:
+                notification.delete()
+                SystemNotificationInboxService.update({
+                    user_id: {"unread_count": -1, "notifications_count": -1}
+                })
+                return
+
+            # One entry per event, an actor repeated by several events keeps the entries of the others.
+            from_user_ids = list(notification.payload.get("from_user_ids", []))
+            from_user_ids.remove(from_user_id)
+            notification.payload["count"] = count
+            notification.payload["from_user_ids"] = from_user_ids
+            if from_user_ids:
+                notification.from_user_id = from_user_ids[0]
+            notification.message = message if count == 1 else plural_message % count
+            notification.save(update_fields=["payload", "from_user_id", "message", "updated_at"])
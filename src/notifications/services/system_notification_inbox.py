@@ -0,0 +1,121 @@
+from typing import Dict, Iterable
+
+from django.db import connection, models
+from django.db.models.functions import Coalesce, Greatest
+
+from notifications.models import SystemNotification, SystemNotificationInbox
+from users.models import User
+
+
+class SystemNotificationInboxService:
+
+    @staticmethod
+    def lock(user_ids: Iterable[int]) -> None:
+        """
+        Create the missing inbox rows and lock the rows of the users till the end of the transaction.
+
+        New notifications are inserted under the lock, so their ids are allocated after
+        a concurrent `read_all` of the user has committed, or they are committed before it takes the watermark.
+        """
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            return
+
+        table = SystemNotificationInbox._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (user_id, unread_count, notifications_count, last_read_notification_id)
+                SELECT user_id, 0, 0, 0 FROM unnest(%s::bigint[]) AS user_id ORDER BY user_id
+                ON CONFLICT (user_id) DO NOTHING
+                """,
+                [user_ids]
+            )
+            cursor.execute(
+                f"SELECT 1 FROM {table} WHERE user_id = ANY(%s::bigint[]) ORDER BY user_id FOR UPDATE",
+                [user_ids]
+            )
+
+    @staticmethod
+    def update(deltas: Dict[int, Dict[str, int]]) -> None:
+        """
+        Apply the counter deltas by user id, must be called in the transaction of the change.
+        Every counter is updated in one statement for all users,
+        rows are locked in the order of user ids, so concurrent changes do not deadlock.
+        """
+        deltas = {
+            user_id: user_deltas
+            for user_id, user_deltas in deltas.items()
+            if any(user_deltas.values())
+        }
+        if not deltas:
+            return
+
+        user_ids = sorted(deltas)
+        table = SystemNotificationInbox._meta.db_table
+        SystemNotificationInboxService.lock(user_ids)
+        with connection.cursor() as cursor:
+            fields = sorted({field for user_deltas in deltas.values() for field in user_deltas})
+            for field in fields:
+                SystemNotificationInbox._meta.get_field(field)  # Raises for an unknown counter.
+            cursor.execute(
+                f"""
+                UPDATE {table} AS i
+                SET {", ".join(f"{field} = GREATEST(i.{field} + d.{field}, 0)" for field in fields)}
+                FROM unnest(%s::bigint[]{", %s::int[]" * len(fields)}) AS d (user_id, {", ".join(fields)})
+                WHERE i.user_id = d.user_id
+                """,
+                [user_ids] + [
+                    [deltas[user_id].get(field, 0) for user_id in user_ids]
+                    for field in fields
+                ]
+            )
+
+    @staticmethod
+    def read_all(user_id: int) -> None:
+        """
+        Move the read watermark up to the last notification of the user and reset the unread count,
+        must be called in a transaction.
+
+        The watermark is taken after the inbox row is locked, in a statement of its own,
+        so it covers exactly the notifications committed before the lock,
+        notifications inserted later get higher ids (see `lock`).
+        """
+        SystemNotificationInboxService.lock([user_id])
+
+        last_notification_id = SystemNotification.objects.filter(
+            user_id=user_id
+        ).aggregate(
+            last_id=models.Max("id")
+        )["last_id"] or 0
+
+        SystemNotificationInbox.objects.filter(
+            user_id=user_id
+        ).update(
+            unread_count=0,
+            last_read_notification_id=Greatest(models.F("last_read_notification_id"), last_notification_id)
+        )
+
+    @staticmethod
+    def last_read_notification_id(user_id: int) -> models.Expression:
+        """
+        The read watermark of the user as an expression, evaluated once per query.
+        """
+        return Coalesce(
+            models.Subquery(
+                SystemNotificationInbox.objects.filter(
+                    user_id=user_id
+                ).values("last_read_notification_id")[:1]
+            ),
+            0,
+            output_field=models.PositiveBigIntegerField()
+        )
+
+    @staticmethod
+    def get_unread_count(user: User) -> int:
+        return SystemNotificationInbox.objects.filter(
+            user_id=user.pk
+        ).values_list(
+            "unread_count",
+            flat=True
+        ).first() or 0
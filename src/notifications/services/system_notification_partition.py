@@ -0,0 +1,191 @@
+import datetime
+import re
+from typing import Iterable, List
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from notifications.models import SystemNotification, SystemNotificationInbox
+from notifications.services.system_notification_inbox import SystemNotificationInboxService
+
+
+class SystemNotificationPartitionService:
+    """
+    Monthly range partitions of `SystemNotification` on `created_at`, bounds are in UTC.
+    A partition is named by the table and the month, e.g. `notifications_systemnotification_p202601`.
+    """
+
+    @staticmethod
+    def _add_months(month: datetime.date,
+                    months: int) -> datetime.date:
+        years, month_index = divmod(month.month - 1 + months, 12)
+        return datetime.date(month.year + years, month_index + 1, 1)
+
+    @staticmethod
+    def _get_current_month() -> datetime.date:
+        return timezone.now().astimezone(datetime.timezone.utc).date().replace(day=1)
+
+    @staticmethod
+    def _get_name(month: datetime.date) -> str:
+        return f"{SystemNotification._meta.db_table}_p{month:%Y%m}"
+
+    @staticmethod
+    def _parse_months(names: Iterable[str]) -> List[datetime.date]:
+        months = []
+        for name in names:
+            match = re.fullmatch(rf"{SystemNotification._meta.db_table}_p(\d{{4}})(\d{{2}})", name)
+            if match:
+                months.append(datetime.date(int(match[1]), int(match[2]), 1))
+        return sorted(months)
+
+    @staticmethod
+    def get_months() -> List[datetime.date]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = %s::regclass
+                """,
+                [SystemNotification._meta.db_table]
+            )
+            return SystemNotificationPartitionService._parse_months(name for name, in cursor.fetchall())
+
+    @staticmethod
+    def create(month: datetime.date) -> None:
+        next_month = SystemNotificationPartitionService._add_months(month, 1)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {connection.ops.quote_name(SystemNotificationPartitionService._get_name(month))}
+                PARTITION OF {SystemNotification._meta.db_table}
+                FOR VALUES FROM (%s) TO (%s)
+                """,
+                [
+                    datetime.datetime.combine(month, datetime.time(), datetime.timezone.utc),
+                    datetime.datetime.combine(next_month, datetime.time(), datetime.timezone.utc),
+                ]
+            )
+
+    @staticmethod
+    def create_ahead(months_ahead: int) -> List[datetime.date]:
+        """
+        Create the missing partitions from the current month to `months_ahead` months ahead,
+        returns the months of the created partitions.
+        """
+        current_month = SystemNotificationPartitionService._get_current_month()
+        existing = set(SystemNotificationPartitionService.get_months())
+
+        created = []
+        for i in range(0, months_ahead + 1):
+            month = SystemNotificationPartitionService._add_months(current_month, i)
+            if month not in existing:
+                SystemNotificationPartitionService.create(month)
+                created.append(month)
+        return created
+
+    @staticmethod
+    def drop_expired(retention_months: int,
+                     batch_size: int) -> List[datetime.date]:
+        """
+        Drop the partitions that ended more than `retention_months` months before the current month,
+        returns the months of the dropped partitions. Must not be called in a transaction.
+
+        A partition is detached concurrently, so notifications are read and written meanwhile.
+        The rows of the detached table are counted per user with one query, the counters are decreased
+        for `batch_size` users per transaction, and the table is dropped without deleting its rows.
+        Every step can be resumed, a partition left detached by an interrupted run is dropped by the next one.
+        """
+        cutoff = SystemNotificationPartitionService._add_months(
+            SystemNotificationPartitionService._get_current_month(),
+            -retention_months
+        )
+
+        table = SystemNotification._meta.db_table
+        for month in SystemNotificationPartitionService.get_months():
+            if month >= cutoff:
+                continue
+
+            name = connection.ops.quote_name(SystemNotificationPartitionService._get_name(month))
+            with connection.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {name} CONCURRENTLY")
+
+        with connection.cursor() as cursor:
+            # Detach interrupted after its first transaction.
+            cursor.execute(
+                """
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = %s::regclass AND i.inhdetachpending
+                """,
+                [table]
+            )
+            for name, in cursor.fetchall():
+                cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {connection.ops.quote_name(name)} FINALIZE")
+
+        dropped = []
+        for month in SystemNotificationPartitionService._get_detached_months():
+            name = connection.ops.quote_name(SystemNotificationPartitionService._get_name(month))
+            SystemNotificationPartitionService._deduct_detached(name, batch_size)
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE {name}")
+            dropped.append(month)
+        return dropped
+
+    @staticmethod
+    def _get_detached_months() -> List[datetime.date]:
+        table = SystemNotification._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.relname
+                FROM pg_class c
+                WHERE c.relkind = 'r'
+                    AND pg_table_is_visible(c.oid)
+                    AND c.relname LIKE %s
+                    AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)
+                """,
+                [f"{table}\\_p%"]
+            )
+            return SystemNotificationPartitionService._parse_months(name for name, in cursor.fetchall())
+
+    @staticmethod
+    def _deduct_detached(name: str,
+                         batch_size: int) -> None:
+        """
+        Decrease the counters by the rows of a detached partition, `batch_size` users per transaction.
+
+        The last deducted user id is kept in the comment of the table, it is set in the transaction of the batch,
+        so a resumed run does not deduct the same users twice.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT obj_description(%s::regclass, 'pg_class')", [name])
+            comment, = cursor.fetchone()
+            deducted_user_id = int(comment.removeprefix("deducted:")) if comment else 0
+
+            cursor.execute(
+                f"""
+                SELECT
+                    n.user_id,
+                    count(*),
+                    count(*) FILTER (WHERE NOT n.is_read AND n.id > COALESCE(i.last_read_notification_id, 0))
+                FROM {name} AS n
+                LEFT JOIN {SystemNotificationInbox._meta.db_table} AS i ON i.user_id = n.user_id
+                WHERE n.user_id > %s
+                GROUP BY n.user_id
+                ORDER BY n.user_id
+                """,
+                [deducted_user_id]
+            )
+            counts = cursor.fetchall()
+
+        for i in range(0, len(counts), batch_size):
+            batch = counts[i:i + batch_size]
+            with transaction.atomic(), connection.cursor() as cursor:
+                SystemNotificationInboxService.update({
+                    user_id: {"notifications_count": -count, "unread_count": -unread_count}
+                    for user_id, count, unread_count in batch
+                })
+                cursor.execute(f"COMMENT ON TABLE {name} IS %s", [f"deducted:{batch[-1][0]}"])
@@ -51,12 +51,12 @@ class SystemNotificationListAPITestCase(_BaseTestCase):
         resp = self.client.get(self.url)
         self.assertIsInstance(resp.data, dict)
         data: dict = resp.data
-        self.assertEqual(data["count"], SystemNotification.objects.count())
-        self.assertEqual(data["next"], 2)
+        self.assertEqual(data["count"], self.user_1.system_notifications.count())
+        self.assertEqual(data["next"], None)
         self.assertEqual(data["previous"], None)
-        self.assertEqual(len(data["results"]), 10)
+        self.assertEqual(len(data["results"]), 5)
 
-        for item, notification in zip(resp.data["results"], SystemNotification.objects.order_by("-created_at")):
+        for item, notification in zip(resp.data["results"], self.user_1.system_notifications.order_by("-created_at")):
             self.assertEqual(item.pop("id"), notification.id)
             self.assertEqual(item.pop("type_id"), notification.type_id)
             self.assertEqual(item.pop("event_id"), notification.event_id)
@@ -68,6 +68,13 @@ class SystemNotificationListAPITestCase(_BaseTestCase):
 
             self.assertEqual(item, {})
 
+    def test_only_own(self):
+        resp = self.client.get(self.url, data={"count": 100})
+        self.assertEqual(
+            {item["id"] for item in resp.data["results"]},
+            set(self.user_1.system_notifications.values_list("id", flat=True))
+        )
+
     def test_not_authenticated(self):
         self.client = self.client_class()
         resp = self.client.get(self.url)
@@ -80,12 +87,22 @@ class PostListFilterAPITestCase(_BaseTestCase):
 
     def test_by_type_id(self):
         resp = self.client.get(self.url, data={"type_id": SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value})
-        self.assertEqual(resp.data["count"], SystemNotification.objects.count())
+        self.assertEqual(resp.data["count"], self.user_1.system_notifications.count())
 
         system_notification_type = SystemNotificationType.objects.create(title="test-1")
         resp = self.client.get(self.url, data={"type_id": system_notification_type.pk})
         self.assertEqual(resp.data["count"], 0)
 
+    def test_by_is_read(self):
+        notification_ids = list(self.user_1.system_notifications.values_list("id", flat=True)[:2])
+        SystemNotification.objects.filter(id__in=notification_ids).update(is_read=True)
+
+        resp = self.client.get(self.url, data={"is_read": "true"})
+        self.assertEqual({item["id"] for item in resp.data["results"]}, set(notification_ids))
+
+        resp = self.client.get(self.url, data={"is_read": "false"})
+        self.assertEqual(resp.data["count"], self.user_1.system_notifications.filter(is_read=False).count())
+
 
 @tag("api-tests", "notifications")
 class SystemNotificationListOrderingFilterAPITestCase(_BaseTestCase):
@@ -93,11 +110,31 @@ class SystemNotificationListOrderingFilterAPITestCase(_BaseTestCase):
     def test_by_created_at_asc(self):
         resp = self.client.get(self.url, data={"ordering": "created_at"})
 
-        for item, notification in zip(resp.data["results"], SystemNotification.objects.order_by("created_at")):
+        for item, notification in zip(resp.data["results"], self.user_1.system_notifications.order_by("created_at")):
             self.assertEqual(item["id"], notification.pk)
 
     def test_by_created_at_desc(self):
         resp = self.client.get(self.url, data={"ordering": "-created_at"})
 
-        for item, notification in zip(resp.data["results"], SystemNotification.objects.order_by("-created_at")):
+        for item, notification in zip(resp.data["results"], self.user_1.system_notifications.order_by("-created_at")):
             self.assertEqual(item["id"], notification.pk)
+
+
+@tag("api-tests", "notifications")
+class SystemNotificationListKeysetPaginationAPITestCase(_BaseTestCase):
+
+    def test_walk(self):
+        ids = []
+        resp = self.client.get(self.url, data={"cursor": ""})
+        while True:
+            self.assertEqual(resp.status_code, 200)
+            self.assertNotIn("count", resp.data)
+            ids.extend(item["id"] for item in resp.data["results"])
+            if resp.data["next"] is None:
+                break
+            resp = self.client.get(self.url, data={"cursor": resp.data["next"]})
+
+        self.assertEqual(
+            ids,
+            list(self.user_1.system_notifications.order_by("-created_at", "-id").values_list("id", flat=True))
+        )
@@ -2,7 +2,8 @@ from django.test import tag
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent, SystemNotificationInbox
+from notifications.services import SystemNotificationService
 from users.models import User
 
 
@@ -58,7 +59,35 @@ class SystemNotificationReadAllAPITestCase(_BaseTestCase):
         self.assertEqual(resp.status_code, 202)
 
         self.assertEqual(SystemNotification.objects.count(), 15)
-        self.assertEqual(SystemNotification.objects.filter(is_read=True).count(), 5)
+
+        resp = self.client.get("/api/v1/notifications", data={"is_read": "true"})
+        self.assertEqual(resp.data["count"], 5)
+        resp = self.client.get("/api/v1/notifications", data={"is_read": "false"})
+        self.assertEqual(resp.data["count"], 0)
+
+    def test_watermark(self):
+        resp = self.client.post(self.url)
+        self.assertEqual(resp.status_code, 202)
+
+        self.assertEqual(SystemNotification.objects.filter(is_read=True).count(), 0)
+        self.assertEqual(
+            SystemNotificationInbox.objects.get(user_id=self.user_1.pk).last_read_notification_id,
+            self.user_1.system_notifications.order_by("-id").values_list("id", flat=True).first()
+        )
+
+        notification = SystemNotificationService.create(
+            user_id=self.user_1.pk,
+            type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+            event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+            message="New like on your post.",
+        )
+        resp = self.client.get("/api/v1/notifications", data={"is_read": "false"})
+        self.assertEqual([item["id"] for item in resp.data["results"]], [notification.pk])
+        self.assertEqual(resp.data["results"][0]["is_read"], False)
+
+        resp = self.client.get("/api/v1/notifications", data={"is_read": "true"})
+        self.assertEqual(resp.data["count"], 5)
+        self.assertTrue(all(item["is_read"] for item in resp.data["results"]))
 
     def test_only_current_user(self):
         self.assertEqual(SystemNotification.objects.count(), 15)
@@ -0,0 +1,107 @@
+from django.test import tag
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from notifications.services import SystemNotificationService
+from users.models import User
+
+
+class _BaseTestCase(APITestCase):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user_1 = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+        cls.user_2 = User.objects.create_user(email="test-2@gmail.com", username="test-2")
+        for user in [cls.user_1, cls.user_2]:
+            for i in range(0, 5):
+                SystemNotificationService.create(
+                    user_id=user.pk,
+                    type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+                    event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+                    message=f'New like on your post.',
+                    post_id=11,
+                    from_user_id=12,
+                )
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user_1, token=str(RefreshToken.for_user(self.user_1).access_token))
+
+        self.url = "/api/v1/notifications/unread-count"
+
+    def _get_unread_count(self) -> int:
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+        return resp.data["unread_count"]
+
+
+@tag("api-tests", "notifications")
+class SystemNotificationUnreadCountAPITestCase(_BaseTestCase):
+
+    def test_status_code(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+    def test_response_data(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.data, {"unread_count": 5})
+
+    def test_without_notifications(self):
+        user = User.objects.create_user(email="test-3@gmail.com", username="test-3")
+        self.client.force_authenticate(user=user, token=str(RefreshToken.for_user(user).access_token))
+
+        self.assertEqual(self._get_unread_count(), 0)
+
+    def test_read(self):
+        ids = list(self.user_1.system_notifications.values_list("id", flat=True)[0:3])
+
+        resp = self.client.post("/api/v1/notifications/read", data={"ids": ids})
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual(self._get_unread_count(), 2)
+
+        resp = self.client.post("/api/v1/notifications/read", data={"ids": ids})
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual(self._get_unread_count(), 2)
+
+    def test_read_other_user(self):
+        ids = list(self.user_2.system_notifications.values_list("id", flat=True)[0:3])
+
+        resp = self.client.post("/api/v1/notifications/read", data={"ids": ids})
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual(self._get_unread_count(), 5)
+
+    def test_read_all(self):
+        resp = self.client.post("/api/v1/notifications/read-all")
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual(self._get_unread_count(), 0)
+
+        self.client.force_authenticate(user=self.user_2, token=str(RefreshToken.for_user(self.user_2).access_token))
+        self.assertEqual(self._get_unread_count(), 5)
+
+    def test_matches_notifications(self):
+        SystemNotificationService.read_by_ids(
+            user=self.user_1,
+            ids=list(self.user_1.system_notifications.values_list("id", flat=True)[0:2])
+        )
+        self.assertEqual(
+            self._get_unread_count(),
+            SystemNotification.objects.filter(user_id=self.user_1.pk, is_read=False).count()
+        )
+
+    def test_num_queries(self):
+        with self.assertNumQueries(1):
+            self._get_unread_count()
+
+    def test_not_authenticated(self):
+        self.client = self.client_class()
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "Authentication credentials were not provided.")
@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from notifications import events
+from notifications.bus import EventBus, bus
+
+
+class EventBusIntegrationTestCase(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.bus = EventBus()
+
+    def test_registered_on_ready(self):
+        self.assertEqual(bus.events, {
+            event_class.action: event_class
+            for event_class in [
+                events.UserConfirmEmail,
+                events.UserForgotPassword,
+                events.BlogPostsLike,
+                events.BlogPostsLikeRemove,
+                events.BlogPostsNewComment,
+                events.BlogPostsNew,
+                events.BlogSubscriptionsNew,
+            ]
+        })
+        for subscribers in bus.subscribers.values():
+            self.assertEqual(len(subscribers), 1)
+
+    def test_get_event(self):
+        self.bus.subscribe(events.BlogPostsLike, Mock())
+
+        event = self.bus.get_event("BLOG_POSTS_LIKE", data={"post": {"id": 1}})
+        self.assertEqual(event, events.BlogPostsLike(data={"post": {"id": 1}}))
+        self.assertFalse(hasattr(event, "__dict__"))
+
+    def test_get_event_unknown_action(self):
+        self.assertRaises(NotImplementedError, self.bus.get_event, "BLOG_POSTS_LIKE", data={})
+
+    def test_multiple_subscribers(self):
+        calls = []
+        self.bus.subscribe(events.BlogPostsLike, lambda event: calls.append(("first", event)))
+        self.bus.subscribe(events.BlogPostsLike, lambda event: calls.append(("second", event)))
+        self.bus.subscribe(events.BlogPostsNew, lambda event: calls.append(("other", event)))
+
+        event = events.BlogPostsLike(data={})
+        self.bus.publish(event)
+        self.assertEqual(calls, [("first", event), ("second", event)])
+
+    def test_stats(self):
+        handler = Mock(side_effect=[None, ValueError])
+        self.bus.subscribe(events.BlogPostsLike, handler)
+
+        self.bus.publish(events.BlogPostsLike(data={}))
+        self.assertRaises(ValueError, self.bus.publish, events.BlogPostsLike(data={}))
+
+        stats = self.bus.stats["BLOG_POSTS_LIKE"]
+        self.assertEqual(stats.calls, 2)
+        self.assertEqual(stats.errors, 1)
+        self.assertGreater(stats.total_time, 0)
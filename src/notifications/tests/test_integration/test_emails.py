@@ -0,0 +1,178 @@
+import datetime
+from io import StringIO
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from common.tests.mixins import SMTPServerTestCaseMixin
+from notifications.events import REDACTED
+from notifications.models import OutboundEmail
+from notifications.senders import EmailSender
+from notifications.services import OutboundEmailService
+
+
+class NotificationsEmailsIntegrationTestCase(SMTPServerTestCaseMixin, TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.server = self._start_smtp_server()
+
+    def _send(self, count: int):
+        for i in range(0, count):
+            EmailSender(
+                subject=f"subject-{i}",
+                message=f"message-{i}",
+                recipient_list=[f"test-{i}@gmail.com"]
+            ).send()
+
+    def test_one_connection(self):
+        self._send(3)
+        self.assertEqual(self.server.messages, [])
+
+        self.assertEqual(OutboundEmailService.send_batch(10), 3)
+
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual([message["Subject"] for message in self.server.messages], ["subject-0", "subject-1", "subject-2"])
+        self.assertEqual(self.server.messages[0]["X-Recipients"], "test-0@gmail.com")
+        self.assertEqual(self.server.messages[0]["From"], settings.DEFAULT_FROM_EMAIL)
+        self.assertEqual(self.server.messages[0].get_payload().strip(), "message-0")
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    def test_batch_size(self):
+        self._send(3)
+
+        self.assertEqual(OutboundEmailService.send_batch(2), 2)
+        self.assertEqual(OutboundEmailService.send_batch(2), 1)
+        self.assertEqual(OutboundEmailService.send_batch(2), 0)
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(len(self.server.messages), 3)
+
+    def test_retry(self):
+        self.server.fail_next = 1
+        self._send(2)
+
+        before = timezone.now()
+        self.assertEqual(OutboundEmailService.send_batch(10), 2)
+
+        self.assertEqual([message["Subject"] for message in self.server.messages], ["subject-1"])
+        self.assertEqual(self.server.connections, 2)
+
+        email: OutboundEmail = OutboundEmail.objects.get()
+        self.assertEqual(email.subject, "subject-0")
+        self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("451", email.last_error)
+        self.assertGreaterEqual(
+            email.run_at,
+            before + datetime.timedelta(seconds=settings.NOTIFICATIONS_EMAIL_RETRY_DELAY)
+        )
+
+        self.assertEqual(OutboundEmailService.send_batch(10), 0)
+
+        OutboundEmail.objects.update(run_at=timezone.now())
+        self.assertEqual(OutboundEmailService.send_batch(10), 1)
+        self.assertEqual([message["Subject"] for message in self.server.messages], ["subject-1", "subject-0"])
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    @override_settings(NOTIFICATIONS_EMAIL_MAX_ATTEMPTS=2)
+    def test_dead(self):
+        self.server.fail_next = 2
+        self._send(1)
+
+        OutboundEmailService.send_batch(10)
+        OutboundEmail.objects.update(run_at=timezone.now())
+        OutboundEmailService.send_batch(10)
+
+        email: OutboundEmail = OutboundEmail.objects.get()
+        self.assertEqual(email.status, OutboundEmail.Status.DEAD)
+        self.assertEqual(email.attempts, 2)
+        self.assertEqual(email.body, REDACTED)
+        self.assertEqual(OutboundEmailService.send_batch(10), 0)
+
+    @override_settings(EMAIL_TIMEOUT=0.1)
+    def test_timeout(self):
+        self.server.delay = 0.5
+        self._send(2)
+
+        before = timezone.now()
+        self.assertEqual(OutboundEmailService.send_batch(10), 2)
+
+        # The relay timed out, the rest of the batch is postponed without an attempt.
+        self.assertEqual(self.server.connections, 1)
+        for email in OutboundEmail.objects.all():
+            self.assertEqual(email.attempts, 0)
+            self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+            self.assertIn("timed out", email.last_error)
+            self.assertGreaterEqual(
+                email.run_at,
+                before + datetime.timedelta(seconds=settings.NOTIFICATIONS_EMAIL_RETRY_DELAY)
+            )
+
+    @override_settings(NOTIFICATIONS_EMAIL_MAX_ATTEMPTS=1)
+    def test_relay_unavailable(self):
+        self.server.stop()
+        self._send(3)
+
+        for i in range(0, 3):
+            self.assertEqual(OutboundEmailService.send_batch(10), 3)
+            OutboundEmail.objects.update(run_at=timezone.now())
+
+        self.assertEqual(
+            list(OutboundEmail.objects.values_list("status", "attempts")),
+            [(OutboundEmail.Status.PENDING, 0)] * 3
+        )
+        self.assertIsNotNone(OutboundEmail.objects.first().last_error)
+
+    def test_claim_lease(self):
+        self._send(2)
+
+        before = timezone.now()
+        emails = OutboundEmailService._claim(10)
+        self.assertEqual(len(emails), 2)
+
+        # A worker that dies after the claim leaves the emails to the others after the lease.
+        self.assertEqual(OutboundEmailService.send_batch(10), 0)
+        for email in OutboundEmail.objects.all():
+            self.assertGreaterEqual(email.run_at, before + datetime.timedelta(seconds=settings.NOTIFICATIONS_EMAIL_LEASE))
+
+        OutboundEmail.objects.update(run_at=timezone.now())
+        self.assertEqual(OutboundEmailService.send_batch(10), 2)
+        self.assertEqual(len(self.server.messages), 2)
+
+    @override_settings(NOTIFICATIONS_EMAIL_LEASE=0.4)
+    def test_lease_renewed(self):
+        self.server.delay = 0.15
+        self._send(4)
+
+        lease = OutboundEmailService._lease
+        with patch.object(OutboundEmailService, "_lease", side_effect=lease) as lease_mock:
+            self.assertEqual(OutboundEmailService.send_batch(10), 4)
+
+        # The claim, then the unsent emails once half of every lease has passed.
+        self.assertGreaterEqual(lease_mock.call_count, 2)
+        self.assertLess(len(lease_mock.call_args_list[-1].args[0]), 4)
+        self.assertEqual(len(self.server.messages), 4)
+
+    def test_stats(self):
+        stats = OutboundEmailService.stats
+        sent, failed = stats.sent, stats.failed
+        self.server.fail_next = 1
+        self._send(3)
+
+        OutboundEmailService.send_batch(10)
+
+        self.assertEqual(stats.sent - sent, 2)
+        self.assertEqual(stats.failed - failed, 1)
+        self.assertGreater(stats.throughput, 0)
+
+    def test_command(self):
+        self._send(2)
+
+        out = StringIO()
+        call_command("run_notification_workers", once=True, stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Claimed jobs: 0. Sent emails: 2. Failed emails: 0.")
+        self.assertEqual(len(self.server.messages), 2)
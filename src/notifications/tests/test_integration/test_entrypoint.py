@@ -3,6 +3,7 @@ from unittest.mock import patch
 from django.test import TestCase
 
 from notifications import Handler
+from notifications.models import NotificationJob
 
 
 class NotificationsEntrypointIntegrationTestCase(TestCase):
@@ -10,10 +11,10 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
     def _call(self,
               action: str,
               **kwargs):
-        Handler.accept(action, **kwargs)
+        Handler.dispatch(action, **kwargs)
 
     def test_user_confirm_email(self):
-        with patch("notifications.entrypoints.user.UserEntrypoint.accept") as mock:
+        with patch("notifications.entrypoints.user.UserEntrypoint._user_confirm_email") as mock:
             self._call(
                 action="USER_CONFIRM_EMAIL",
                 data={
@@ -22,7 +23,6 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
                 }
             )
             mock.assert_called_once_with(
-                "USER_CONFIRM_EMAIL",
                 data={
                     "link": "sample-link",
                     "email": "sample@gmail.com"
@@ -30,16 +30,15 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
             )
 
     def test_user_forgot_password(self):
-        with patch("notifications.entrypoints.user.UserEntrypoint.accept") as mock:
+        with patch("notifications.entrypoints.user.UserEntrypoint._user_forgot_password") as mock:
             self._call(
-                action="USER_CONFIRM_EMAIL",
+                action="USER_FORGOT_PASSWORD",
                 data={
                     "link": "sample-link",
                     "email": "sample@gmail.com"
                 }
             )
             mock.assert_called_once_with(
-                "USER_CONFIRM_EMAIL",
                 data={
                     "link": "sample-link",
                     "email": "sample@gmail.com"
@@ -47,7 +46,7 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
             )
 
     def test_blog_posts_like(self):
-        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint.accept") as mock:
+        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint._blog_posts_like") as mock:
             self._call(
                 action="BLOG_POSTS_LIKE",
                 data={
@@ -61,7 +60,6 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
                 }
             )
             mock.assert_called_once_with(
-                "BLOG_POSTS_LIKE",
                 data={
                     "post": {
                         "id": 1,
@@ -74,7 +72,7 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
             )
 
     def test_blog_posts_like_remove(self):
-        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint.accept") as mock:
+        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint._blog_posts_like_remove") as mock:
             self._call(
                 action="BLOG_POSTS_LIKE_REMOVE",
                 data={
@@ -88,7 +86,6 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
                 }
             )
             mock.assert_called_once_with(
-                "BLOG_POSTS_LIKE_REMOVE",
                 data={
                     "post": {
                         "id": 1,
@@ -101,7 +98,7 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
             )
 
     def test_blog_posts_new_comment(self):
-        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint.accept") as mock:
+        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint._blog_posts_new_comment") as mock:
             self._call(
                 action="BLOG_POSTS_NEW_COMMENT",
                 data={
@@ -115,7 +112,6 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
                 }
             )
             mock.assert_called_once_with(
-                "BLOG_POSTS_NEW_COMMENT",
                 data={
                     "post": {
                         "id": 1,
@@ -128,7 +124,7 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
             )
 
     def test_blog_subscriptions_new(self):
-        with patch("notifications.entrypoints.blog_subscriptions.BlogSubscriptionsEntrypoint.accept") as mock:
+        with patch("notifications.entrypoints.blog_subscriptions.BlogSubscriptionsEntrypoint._blog_subscriptions_new") as mock:
             self._call(
                 action="BLOG_SUBSCRIPTIONS_NEW",
                 data={
@@ -142,7 +138,6 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
                 }
             )
             mock.assert_called_once_with(
-                "BLOG_SUBSCRIPTIONS_NEW",
                 data={
                     "to_user": {
                         "id": 1,
@@ -155,7 +150,7 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
             )
 
     def test_blog_posts_new(self):
-        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint.accept") as mock:
+        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint._blog_posts_new") as mock:
             self._call(
                 action="BLOG_POSTS_NEW",
                 data={
@@ -170,7 +165,6 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
                 }
             )
             mock.assert_called_once_with(
-                "BLOG_POSTS_NEW",
                 data={
                     "post": {
                         "id": 1,
@@ -185,3 +179,42 @@ class NotificationsEntrypointIntegrationTestCase(TestCase):
 
     def test_unknown_action(self):
         self.assertRaises(NotImplementedError, self._call, action="UNKNOWN_ACTION", data={})
+
+
+class NotificationsEntrypointAcceptIntegrationTestCase(TestCase):
+
+    def test_enqueue(self):
+        with patch("notifications.entrypoints.blog_posts.BlogPostsEntrypoint.handle") as mock:
+            Handler.accept(
+                action="BLOG_POSTS_LIKE",
+                data={
+                    "post": {
+                        "id": 1,
+                        "user_id": 1,
+                    },
+                    "from_user": {
+                        "id": 2
+                    }
+                }
+            )
+            mock.assert_not_called()
+
+        job: NotificationJob = NotificationJob.objects.get()
+        self.assertEqual(job.action, "BLOG_POSTS_LIKE")
+        self.assertEqual(job.kwargs, {
+            "data": {
+                "post": {
+                    "id": 1,
+                    "user_id": 1,
+                },
+                "from_user": {
+                    "id": 2
+                }
+            }
+        })
+        self.assertEqual(job.status, NotificationJob.Status.PENDING)
+        self.assertEqual(job.attempts, 0)
+
+    def test_unknown_action(self):
+        self.assertRaises(NotImplementedError, Handler.accept, action="UNKNOWN_ACTION", data={})
+        self.assertFalse(NotificationJob.objects.exists())
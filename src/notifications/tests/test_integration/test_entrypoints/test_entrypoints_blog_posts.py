@@ -1,8 +1,20 @@
+from io import StringIO
+
 from django.core import mail
-from django.test import TestCase
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 
+from blog.models import Subscription
+from notifications.api.serializers.system_notification import SystemNotificationSerializer
 from notifications.entrypoints import BlogPostsEntrypoint
-from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from notifications.services import SystemNotificationService
+from notifications.models import (
+    SystemNotification,
+    SystemNotificationType,
+    NotificationEvent,
+    NotificationJob,
+    SystemNotificationInbox
+)
 from users.models import User
 
 
@@ -23,6 +35,9 @@ class NotificationsBlogPostsEntrypointIntegrationTestCase(TestCase):
               **kwargs):
         BlogPostsEntrypoint().accept(action, **kwargs)
 
+    def _get_payload(self, notification: SystemNotification) -> dict:
+        return SystemNotificationSerializer(notification).data["payload"]
+
     def test_blog_posts_like(self):
         self._call(
             action="BLOG_POSTS_LIKE",
@@ -45,9 +60,11 @@ class NotificationsBlogPostsEntrypointIntegrationTestCase(TestCase):
         self.assertEqual(notification.type_id, SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value)
         self.assertEqual(notification.event_id, NotificationEvent.Handbook.BLOG_POSTS_LIKE.value)
         self.assertEqual(notification.message, "New like on your post.")
-        self.assertEqual(notification.payload, {
+        self.assertEqual(self._get_payload(notification), {
             "post_id": 1,
             "from_user_id": 2,
+            "from_user_ids": [2],
+            "count": 1,
         })
 
     def test_blog_posts_like_remove(self):
@@ -169,9 +186,11 @@ class NotificationsBlogPostsEntrypointIntegrationTestCase(TestCase):
         self.assertEqual(notification.type_id, SystemNotificationType.Handbook.BLOG_POSTS_COMMENTS.value)
         self.assertEqual(notification.event_id, NotificationEvent.Handbook.BLOG_POSTS_NEW_COMMENT.value)
         self.assertEqual(notification.message, "New comment on your post.")
-        self.assertEqual(notification.payload, {
+        self.assertEqual(self._get_payload(notification), {
             "post_id": 1,
             "from_user_id": 2,
+            "from_user_ids": [2],
+            "count": 1,
         })
 
     def test_blog_posts_new(self):
@@ -201,7 +220,7 @@ class NotificationsBlogPostsEntrypointIntegrationTestCase(TestCase):
         self.assertEqual(notification.type_id, SystemNotificationType.Handbook.BLOG_POSTS.value)
         self.assertEqual(notification.event_id, NotificationEvent.Handbook.BLOG_POSTS_NEW.value)
         self.assertEqual(notification.message, f"New post from {self.post_user.username}.")
-        self.assertEqual(notification.payload, {
+        self.assertEqual(self._get_payload(notification), {
             "post_id": 10,
             "from_user": {
                 "id": self.post_user.pk,
@@ -214,7 +233,288 @@ class NotificationsBlogPostsEntrypointIntegrationTestCase(TestCase):
         self.assertEqual(notification.type_id, SystemNotificationType.Handbook.BLOG_POSTS.value)
         self.assertEqual(notification.event_id, NotificationEvent.Handbook.BLOG_POSTS_NEW.value)
         self.assertEqual(notification.message, f"New post from {self.post_user.username}.")
-        self.assertEqual(notification.payload, {
+        self.assertEqual(self._get_payload(notification), {
+            "post_id": 10,
+            "from_user": {
+                "id": self.post_user.pk,
+                "username": self.post_user.username
+            }
+        })
+
+    def _call_like(self,
+                   action: str = "BLOG_POSTS_LIKE",
+                   post_id: int = 1,
+                   from_user_id: int = 2):
+        self._call(
+            action=action,
+            data={
+                "post": {
+                    "id": post_id,
+                    "user_id": self.post_user.pk,
+                },
+                "from_user": {
+                    "id": from_user_id
+                }
+            }
+        )
+
+    def test_blog_posts_like_coalesce(self):
+        for from_user_id in [2, 3, 4]:
+            self._call_like(from_user_id=from_user_id)
+
+        notification: SystemNotification = SystemNotification.objects.get()
+        self.assertEqual(notification.message, "3 new likes on your post.")
+        self.assertEqual(notification.group_key, "post:1")
+        self.assertEqual(self._get_payload(notification), {
+            "post_id": 1,
+            "from_user_id": 4,
+            "from_user_ids": [4, 3, 2],
+            "count": 3,
+        })
+
+    @override_settings(NOTIFICATIONS_COALESCE_ACTORS=2)
+    def test_blog_posts_like_coalesce_actors_limit(self):
+        for from_user_id in [2, 3, 4]:
+            self._call_like(from_user_id=from_user_id)
+
+        notification: SystemNotification = SystemNotification.objects.get()
+        self.assertEqual(notification.payload["count"], 3)
+        self.assertEqual(notification.payload["from_user_ids"], [4, 3])
+
+    def test_blog_posts_like_coalesce_other_post(self):
+        self._call_like(post_id=1)
+        self._call_like(post_id=2)
+
+        self.assertEqual(SystemNotification.objects.count(), 2)
+
+    def test_blog_posts_like_coalesce_already_read(self):
+        self._call_like(from_user_id=2)
+        SystemNotification.objects.update(is_read=True)
+        self._call_like(from_user_id=3)
+
+        self.assertEqual(SystemNotification.objects.count(), 2)
+        notification: SystemNotification = SystemNotification.objects.get(is_read=False)
+        self.assertEqual(notification.message, "New like on your post.")
+        self.assertEqual(notification.payload["from_user_ids"], [3])
+
+    def test_blog_posts_like_coalesce_read_all(self):
+        self._call_like(from_user_id=2)
+        SystemNotificationService.read_all(user=self.post_user)
+        self._call_like(from_user_id=3)
+
+        self.assertEqual(
+            list(SystemNotification.objects.order_by("id").values_list("is_read", "from_user_id")),
+            [(True, 2), (False, 3)]
+        )
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 1)
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=3)
+        self.assertEqual(
+            list(SystemNotification.objects.values_list("is_read", "from_user_id")),
+            [(True, 2)]
+        )
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 0)
+
+    def test_blog_posts_like_remove_actor_of_read(self):
+        self._call_like(from_user_id=2)
+        SystemNotificationService.read_all(user=self.post_user)
+        self._call_like(from_user_id=3)
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=2)
+        notification: SystemNotification = SystemNotification.objects.get(is_read=False)
+        self.assertEqual(notification.message, "New like on your post.")
+        self.assertEqual(notification.payload["count"], 1)
+        self.assertEqual(notification.payload["from_user_ids"], [3])
+        self.assertEqual(SystemNotification.objects.count(), 2)
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 1)
+
+    def test_blog_posts_new_comment_coalesce(self):
+        self._call_like(action="BLOG_POSTS_NEW_COMMENT", from_user_id=2)
+        self._call_like(action="BLOG_POSTS_NEW_COMMENT", from_user_id=2)
+        self._call_like(action="BLOG_POSTS_LIKE", from_user_id=2)
+
+        self.assertEqual(SystemNotification.objects.count(), 2)
+        notification: SystemNotification = SystemNotification.objects.get(
+            event_id=NotificationEvent.Handbook.BLOG_POSTS_NEW_COMMENT.value
+        )
+        self.assertEqual(notification.message, "2 new comments on your post.")
+        self.assertEqual(notification.payload["count"], 2)
+
+    def test_blog_posts_like_remove_coalesced(self):
+        for from_user_id in [2, 3, 4]:
+            self._call_like(from_user_id=from_user_id)
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=4)
+
+        notification: SystemNotification = SystemNotification.objects.get()
+        self.assertEqual(notification.message, "2 new likes on your post.")
+        self.assertEqual(self._get_payload(notification), {
+            "post_id": 1,
+            "from_user_id": 3,
+            "from_user_ids": [3, 2],
+            "count": 2,
+        })
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=2)
+        notification.refresh_from_db()
+        self.assertEqual(notification.message, "New like on your post.")
+        self.assertEqual(notification.payload["from_user_ids"], [3])
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=3)
+        self.assertFalse(SystemNotification.objects.exists())
+
+    def test_blog_posts_like_remove_repeated_actor(self):
+        for from_user_id in [2, 3, 2]:
+            self._call_like(from_user_id=from_user_id)
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=2)
+
+        notification: SystemNotification = SystemNotification.objects.get()
+        self.assertEqual(notification.message, "2 new likes on your post.")
+        self.assertEqual(notification.payload["count"], 2)
+        self.assertEqual(notification.payload["from_user_ids"], [3, 2])
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=2)
+        notification.refresh_from_db()
+        self.assertEqual(notification.message, "New like on your post.")
+        self.assertEqual(notification.payload["count"], 1)
+        self.assertEqual(notification.payload["from_user_ids"], [3])
+        self.assertEqual(notification.from_user_id, 3)
+
+    def _get_unread_count(self, user_id: int) -> int:
+        return SystemNotificationInbox.objects.filter(
+            user_id=user_id
+        ).values_list(
+            "unread_count",
+            flat=True
+        ).first() or 0
+
+    def test_blog_posts_like_unread_count(self):
+        self._call_like(post_id=1, from_user_id=2)
+        self._call_like(post_id=1, from_user_id=3)
+        self._call_like(post_id=2, from_user_id=2)
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 2)
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", post_id=1, from_user_id=3)
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 2)
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", post_id=1, from_user_id=2)
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 1)
+
+    @override_settings(NOTIFICATIONS_COALESCE=False)
+    def test_blog_posts_like_unread_count_without_coalesce(self):
+        self._call_like(from_user_id=2)
+        self._call_like(from_user_id=3)
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 2)
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=2)
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=2)
+        self.assertEqual(self._get_unread_count(self.post_user.pk), 1)
+
+    @override_settings(NOTIFICATIONS_COALESCE=False)
+    def test_blog_posts_like_without_coalesce(self):
+        self._call_like(from_user_id=2)
+        self._call_like(from_user_id=3)
+
+        self.assertEqual(SystemNotification.objects.count(), 2)
+        notification: SystemNotification = SystemNotification.objects.get(from_user_id=2)
+        self.assertEqual(notification.message, "New like on your post.")
+        self.assertIsNone(notification.group_key)
+        self.assertEqual(self._get_payload(notification), {
+            "post_id": 1,
+            "from_user_id": 2,
+        })
+
+        self._call_like(action="BLOG_POSTS_LIKE_REMOVE", from_user_id=2)
+        self.assertEqual(list(SystemNotification.objects.values_list("from_user_id", flat=True)), [3])
+
+    def test_backfill_columns(self):
+        notification = SystemNotification.objects.create(
+            user_id=self.post_user.pk,
+            type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+            event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+            message="New like on your post.",
+            payload={
+                "post_id": 1,
+                "from_user_id": 2,
+            },
+        )
+        other_notification = SystemNotification.objects.create(
+            user_id=self.post_user.pk,
+            type_id=SystemNotificationType.Handbook.BLOG_POSTS.value,
+            event_id=NotificationEvent.Handbook.BLOG_POSTS_NEW.value,
+            message="New post from test-2.",
+            payload={
+                "post_id": 3,
+                "from_user": {
+                    "id": 4,
+                    "username": "test-2"
+                }
+            },
+        )
+        payloads = [self._get_payload(notification), self._get_payload(other_notification)]
+
+        out = StringIO()
+        call_command("backfill_notification_columns", batch_size=1, stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Backfilled notifications: 2.")
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.post_id, 1)
+        self.assertEqual(notification.from_user_id, 2)
+        self.assertEqual(notification.payload, {})
+
+        other_notification.refresh_from_db()
+        self.assertEqual(other_notification.post_id, 3)
+        self.assertIsNone(other_notification.from_user_id)
+        self.assertEqual(other_notification.payload, {"from_user": {"id": 4, "username": "test-2"}})
+
+        self.assertEqual([self._get_payload(notification), self._get_payload(other_notification)], payloads)
+
+        out = StringIO()
+        call_command("backfill_notification_columns", stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Backfilled notifications: 0.")
+
+    def _create_subscribers(self, count: int):
+        users = [
+            User.objects.create_user(email=f"subscriber-{i}@gmail.com", username=f"subscriber-{i}")
+            for i in range(count)
+        ]
+        Subscription.objects.bulk_create([
+            Subscription(user_id=user.pk, to_user_id=self.post_user.pk)
+            for user in users
+        ])
+        return users
+
+    def _get_blog_posts_new_data(self) -> dict:
+        return {
+            "post": {
+                "id": 10,
+                "user": {
+                    "id": self.post_user.pk,
+                    "username": self.post_user.username
+                },
+            }
+        }
+
+    def test_blog_posts_new_subscribers(self):
+        users = self._create_subscribers(3)
+
+        self._call(action="BLOG_POSTS_NEW", data=self._get_blog_posts_new_data())
+
+        self.assertEqual(
+            set(SystemNotification.objects.values_list("user_id", flat=True)),
+            {user.pk for user in users}
+        )
+        self.assertFalse(NotificationJob.objects.exists())
+
+        notification: SystemNotification = SystemNotification.objects.get(user_id=users[0].pk)
+        self.assertEqual(notification.type_id, SystemNotificationType.Handbook.BLOG_POSTS.value)
+        self.assertEqual(notification.event_id, NotificationEvent.Handbook.BLOG_POSTS_NEW.value)
+        self.assertEqual(notification.message, f"New post from {self.post_user.username}.")
+        self.assertFalse(notification.is_read)
+        self.assertIsNotNone(notification.created_at)
+        self.assertIsNotNone(notification.updated_at)
+        self.assertEqual(self._get_payload(notification), {
             "post_id": 10,
             "from_user": {
                 "id": self.post_user.pk,
@@ -222,5 +522,46 @@ class NotificationsBlogPostsEntrypointIntegrationTestCase(TestCase):
             }
         })
 
+    @override_settings(NOTIFICATIONS_FAN_OUT_BATCH_SIZE=2)
+    def test_blog_posts_new_subscribers_batches(self):
+        users = sorted(self._create_subscribers(5), key=lambda user: user.pk)
+
+        self._call(action="BLOG_POSTS_NEW", data=self._get_blog_posts_new_data())
+
+        self.assertEqual(
+            list(SystemNotification.objects.order_by("user_id").values_list("user_id", flat=True)),
+            [users[0].pk, users[1].pk]
+        )
+        job: NotificationJob = NotificationJob.objects.get()
+        self.assertEqual(job.action, "BLOG_POSTS_NEW")
+        self.assertEqual(job.kwargs["data"]["after_user_id"], users[1].pk)
+
+        while NotificationJob.objects.exists():
+            job = NotificationJob.objects.get()
+            job.delete()
+            self._call(action=job.action, **job.kwargs)
+
+        self.assertEqual(
+            list(SystemNotification.objects.order_by("user_id").values_list("user_id", flat=True)),
+            [user.pk for user in users]
+        )
+        for user in users:
+            self.assertEqual(self._get_unread_count(user.pk), 1)
+
+    @override_settings(NOTIFICATIONS_FAN_OUT_BATCH_SIZE=2)
+    def test_blog_posts_new_to_user_ids_batches(self):
+        users = self._create_subscribers(3)
+
+        self._call(
+            action="BLOG_POSTS_NEW",
+            data={
+                **self._get_blog_posts_new_data(),
+                "to_user_ids": [user.pk for user in users]
+            }
+        )
+
+        self.assertEqual(SystemNotification.objects.count(), 3)
+        self.assertFalse(NotificationJob.objects.exists())
+
     def test_unknown_action(self):
         self.assertRaises(NotImplementedError, self._call, action="UNKNOWN_ACTION", data={})
@@ -2,7 +2,7 @@ from django.core import mail
 from django.test import TestCase
 
 from notifications.entrypoints import BlogPostsEntrypoint, BlogSubscriptionsEntrypoint
-from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent, SystemNotificationInbox
 from users.models import User
 
 
@@ -52,6 +52,7 @@ class NotificationsBlogSubscriptionsEntrypointIntegrationTestCase(TestCase):
                 "username": "sample"
             },
         })
+        self.assertEqual(SystemNotificationInbox.objects.get(user_id=self.to_user.pk).unread_count, 1)
 
     def test_blog_subscriptions_new_from_user_check(self):
         self._call(
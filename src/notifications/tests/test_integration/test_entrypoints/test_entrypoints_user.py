@@ -3,6 +3,8 @@ from django.core import mail
 from django.test import TestCase
 
 from notifications.entrypoints import UserEntrypoint
+from notifications.models import OutboundEmail
+from notifications.services import OutboundEmailService
 
 
 class NotificationsUserEntrypointIntegrationTestCase(TestCase):
@@ -12,6 +14,12 @@ class NotificationsUserEntrypointIntegrationTestCase(TestCase):
               **kwargs):
         UserEntrypoint().accept(action, **kwargs)
 
+    def _send(self):
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+        OutboundEmailService.send_batch(10)
+        self.assertFalse(OutboundEmail.objects.exists())
+
     def test_user_confirm_email(self):
         self._call(
             action="USER_CONFIRM_EMAIL",
@@ -20,6 +28,7 @@ class NotificationsUserEntrypointIntegrationTestCase(TestCase):
                 "email": "sample@gmail.com"
             }
         )
+        self._send()
 
         self.assertEqual(len(mail.outbox), 1)
 
@@ -40,6 +49,7 @@ class NotificationsUserEntrypointIntegrationTestCase(TestCase):
                 "email": "sample@gmail.com"
             }
         )
+        self._send()
 
         self.assertEqual(len(mail.outbox), 1)
 
@@ -0,0 +1,207 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from notifications.models import (
+    SystemNotification,
+    SystemNotificationType,
+    NotificationEvent,
+    SystemNotificationInbox
+)
+from notifications.services import SystemNotificationPartitionService, SystemNotificationService
+from users.models import User
+
+
+class NotificationsPartitionsIntegrationTestCase(TestCase):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+
+    def _run(self, **options) -> str:
+        out = StringIO()
+        call_command("maintain_notification_partitions", stdout=out, **options)
+        return out.getvalue().strip()
+
+    def _get_month(self, months: int) -> datetime.date:
+        return SystemNotificationPartitionService._add_months(timezone.now().date().replace(day=1), months)
+
+    def _create(self, created_at: datetime.datetime) -> SystemNotification:
+        notification = SystemNotificationService.create(
+            user_id=self.user.pk,
+            type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+            event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+            message="New like on your post.",
+        )
+        SystemNotification.objects.filter(id=notification.pk).update(created_at=created_at)
+        return notification
+
+    def _get_unread_count(self) -> int:
+        return SystemNotificationInbox.objects.get(user_id=self.user.pk).unread_count
+
+    def test_add_months(self):
+        self.assertEqual(
+            SystemNotificationPartitionService._add_months(datetime.date(2026, 11, 1), 2),
+            datetime.date(2027, 1, 1)
+        )
+        self.assertEqual(
+            SystemNotificationPartitionService._add_months(datetime.date(2026, 1, 1), -13),
+            datetime.date(2024, 12, 1)
+        )
+
+    def test_create_ahead(self):
+        self.assertEqual(self._run(months_ahead=5, retention_months=12), "Created partitions: 2. Dropped partitions: 0.")
+        self.assertEqual(
+            SystemNotificationPartitionService.get_months()[-6:],
+            [self._get_month(i) for i in range(0, 6)]
+        )
+
+        self.assertEqual(self._run(months_ahead=5, retention_months=12), "Created partitions: 0. Dropped partitions: 0.")
+
+    @override_settings(NOTIFICATIONS_PARTITIONS_AHEAD=5)
+    def test_setup_system(self):
+        call_command("setup_system", stdout=StringIO())
+
+        self.assertEqual(
+            SystemNotificationPartitionService.get_months()[-6:],
+            [self._get_month(i) for i in range(0, 6)]
+        )
+
+    def test_explicit_id(self):
+        notification = self._create(timezone.now())
+
+        with self.assertRaises(ValueError):
+            SystemNotification.objects.create(
+                id=notification.pk,
+                user_id=self.user.pk,
+                type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+                event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+                message="New like on your post.",
+            )
+
+    def test_insert_into_partition(self):
+        SystemNotificationPartitionService.create(self._get_month(5))
+        created_at = datetime.datetime.combine(self._get_month(5), datetime.time(), datetime.timezone.utc)
+
+        notification = self._create(created_at)
+        self.assertEqual(SystemNotification.objects.get(created_at=created_at).pk, notification.pk)
+
+
+class NotificationsPartitionsDropIntegrationTestCase(TransactionTestCase):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.user = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+        for months in [-14, -13, -12]:
+            SystemNotificationPartitionService.create(self._get_month(months))
+
+    def _run(self, **options) -> str:
+        out = StringIO()
+        call_command("maintain_notification_partitions", stdout=out, **options)
+        return out.getvalue().strip()
+
+    def _get_month(self, months: int) -> datetime.date:
+        return SystemNotificationPartitionService._add_months(timezone.now().date().replace(day=1), months)
+
+    def _create(self, months: int, user: User = None) -> SystemNotification:
+        notification = SystemNotificationService.create(
+            user_id=(user or self.user).pk,
+            type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+            event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+            message="New like on your post.",
+        )
+        created_at = timezone.now() if months == 0 else datetime.datetime.combine(
+            self._get_month(months),
+            datetime.time(),
+            datetime.timezone.utc
+        )
+        SystemNotification.objects.filter(id=notification.pk).update(created_at=created_at)
+        return notification
+
+    def _get_inbox(self, user: User = None) -> SystemNotificationInbox:
+        return SystemNotificationInbox.objects.get(user_id=(user or self.user).pk)
+
+    def _get_tables(self) -> set:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relname FROM pg_class WHERE relname LIKE 'notifications_systemnotification_p%%'")
+            return {name for name, in cursor.fetchall()}
+
+    @override_settings(NOTIFICATIONS_RETENTION_MONTHS=12)
+    def test_drop_expired(self):
+        expired = [self._create(-13) for _ in range(0, 3)]
+        SystemNotificationService.read_by_ids(user=self.user, ids=[expired[0].pk])
+        kept = self._create(-12)
+        self._create(0)
+        self.assertEqual(self._get_inbox().unread_count, 4)
+        self.assertEqual(self._get_inbox().notifications_count, 5)
+
+        self.assertEqual(self._run(months_ahead=0, batch_size=2), "Created partitions: 0. Dropped partitions: 2.")
+
+        months = SystemNotificationPartitionService.get_months()
+        self.assertNotIn(self._get_month(-14), months)
+        self.assertNotIn(self._get_month(-13), months)
+        self.assertIn(self._get_month(-12), months)
+        self.assertNotIn(SystemNotificationPartitionService._get_name(self._get_month(-13)), self._get_tables())
+
+        self.assertFalse(SystemNotification.objects.filter(id__in=[item.pk for item in expired]).exists())
+        self.assertTrue(SystemNotification.objects.filter(id=kept.pk).exists())
+        self.assertEqual(self._get_inbox().unread_count, 2)
+        self.assertEqual(self._get_inbox().notifications_count, 2)
+
+    @override_settings(NOTIFICATIONS_RETENTION_MONTHS=12)
+    def test_drop_detached(self):
+        self._create(-13)
+        self._create(-13)
+        self._create(0)
+
+        # A run interrupted after the detach.
+        name = SystemNotificationPartitionService._get_name(self._get_month(-13))
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE notifications_systemnotification DETACH PARTITION {name}")
+        self.assertEqual(self._get_inbox().unread_count, 3)
+
+        self.assertEqual(self._run(months_ahead=0, batch_size=1), "Created partitions: 0. Dropped partitions: 2.")
+
+        self.assertNotIn(name, self._get_tables())
+        self.assertEqual(self._get_inbox().unread_count, 1)
+        self.assertEqual(self._get_inbox().notifications_count, 1)
+
+    @override_settings(NOTIFICATIONS_RETENTION_MONTHS=12)
+    def test_drop_resumed(self):
+        other_user = User.objects.create_user(email="test-2@gmail.com", username="test-2")
+        for user in [self.user, other_user]:
+            self._create(-13, user=user)
+            self._create(-13, user=user)
+            self._create(0, user=user)
+
+        # A run interrupted after the counters of the first user were decreased.
+        name = SystemNotificationPartitionService._get_name(self._get_month(-13))
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE notifications_systemnotification DETACH PARTITION {name}")
+            cursor.execute(f"COMMENT ON TABLE {name} IS 'deducted:{self.user.pk}'")
+        SystemNotificationInbox.objects.filter(user_id=self.user.pk).update(unread_count=1, notifications_count=1)
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self._run(months_ahead=0, batch_size=1), "Created partitions: 0. Dropped partitions: 2.")
+        self.assertFalse(any(query["sql"].startswith("DELETE") for query in context.captured_queries))
+
+        self.assertNotIn(name, self._get_tables())
+        for user in [self.user, other_user]:
+            self.assertEqual(self._get_inbox(user).unread_count, 1)
+            self.assertEqual(self._get_inbox(user).notifications_count, 1)
@@ -0,0 +1,87 @@
+import threading
+
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+
+from notifications.models import (
+    SystemNotification,
+    SystemNotificationType,
+    NotificationEvent,
+    SystemNotificationInbox
+)
+from notifications.services import SystemNotificationService, SystemNotificationInboxService
+from users.models import User
+
+
+class NotificationsReadAllIntegrationTestCase(TransactionTestCase):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.user_1 = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+        self.user_2 = User.objects.create_user(email="test-2@gmail.com", username="test-2")
+
+    def _create(self, user: User) -> SystemNotification:
+        return SystemNotificationService.create(
+            user_id=user.pk,
+            type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+            event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+            message="New like on your post.",
+        )
+
+    def _get_unread(self, user: User) -> int:
+        return SystemNotification.objects.filter(SystemNotificationService.unread(user.pk)).count()
+
+    def test_own_watermark(self):
+        notification = self._create(self.user_1)
+        self._create(self.user_2)
+
+        SystemNotificationService.read_all(user=self.user_1)
+
+        self.assertEqual(
+            SystemNotificationInbox.objects.get(user_id=self.user_1.pk).last_read_notification_id,
+            notification.pk
+        )
+        self.assertEqual(self._get_unread(self.user_2), 1)
+
+    def test_concurrent_create(self):
+        self._create(self.user_1)
+
+        created = threading.Event()
+        release = threading.Event()
+
+        def create():
+            try:
+                with transaction.atomic():
+                    self._create(self.user_1)
+                    created.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        def read_all():
+            try:
+                SystemNotificationService.read_all(user=self.user_1)
+            finally:
+                connection.close()
+
+        create_thread = threading.Thread(target=create)
+        create_thread.start()
+        self.assertTrue(created.wait(10))
+
+        read_all_thread = threading.Thread(target=read_all)
+        read_all_thread.start()
+        read_all_thread.join(0.5)
+        # The inbox row is locked by the uncommitted notification.
+        self.assertTrue(read_all_thread.is_alive())
+
+        release.set()
+        create_thread.join(10)
+        read_all_thread.join(10)
+
+        self.assertEqual(self._get_unread(self.user_1), 0)
+        self.assertEqual(SystemNotificationInboxService.get_unread_count(self.user_1), 0)
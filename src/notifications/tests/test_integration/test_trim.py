@@ -0,0 +1,79 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from notifications.models import (
+    SystemNotification,
+    SystemNotificationType,
+    NotificationEvent,
+    SystemNotificationInbox
+)
+from notifications.services import SystemNotificationService
+from users.models import User
+
+
+class NotificationsTrimIntegrationTestCase(TestCase):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user_1 = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+        cls.user_2 = User.objects.create_user(email="test-2@gmail.com", username="test-2")
+        for user, count in [(cls.user_1, 10), (cls.user_2, 3)]:
+            for i in range(0, count):
+                SystemNotificationService.create(
+                    user_id=user.pk,
+                    type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+                    event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+                    message="New like on your post.",
+                )
+
+    def _run(self, **options) -> str:
+        out = StringIO()
+        call_command("trim_notification_inboxes", stdout=out, **options)
+        return out.getvalue().strip()
+
+    def _get_inbox(self, user: User) -> SystemNotificationInbox:
+        return SystemNotificationInbox.objects.get(user_id=user.pk)
+
+    def test_trim(self):
+        newest_ids = list(self.user_1.system_notifications.order_by("-created_at", "-id").values_list("id", flat=True)[:4])
+
+        self.assertEqual(self._run(cap=4, batch_size=3), "Trimmed notifications: 6.")
+
+        self.assertEqual(
+            list(self.user_1.system_notifications.order_by("-created_at", "-id").values_list("id", flat=True)),
+            newest_ids
+        )
+        self.assertEqual(self.user_2.system_notifications.count(), 3)
+
+        self.assertEqual(self._get_inbox(self.user_1).notifications_count, 4)
+        self.assertEqual(self._get_inbox(self.user_1).unread_count, 4)
+        self.assertEqual(self._get_inbox(self.user_2).notifications_count, 3)
+
+        self.assertEqual(self._run(cap=4, batch_size=3), "Trimmed notifications: 0.")
+
+    def test_trim_read(self):
+        oldest_ids = list(self.user_1.system_notifications.order_by("created_at", "id").values_list("id", flat=True)[:3])
+        SystemNotificationService.read_by_ids(user=self.user_1, ids=oldest_ids[:2])
+        self.assertEqual(self._get_inbox(self.user_1).unread_count, 8)
+
+        self.assertEqual(self._run(cap=7, batch_size=100), "Trimmed notifications: 3.")
+
+        self.assertFalse(SystemNotification.objects.filter(id__in=oldest_ids).exists())
+        self.assertEqual(self._get_inbox(self.user_1).unread_count, 7)
+        self.assertEqual(self._get_inbox(self.user_1).notifications_count, 7)
+
+    def test_trim_below_watermark(self):
+        SystemNotificationService.read_all(user=self.user_1)
+
+        self.assertEqual(self._run(cap=5, batch_size=100), "Trimmed notifications: 5.")
+
+        self.assertEqual(self._get_inbox(self.user_1).unread_count, 0)
+        self.assertEqual(self._get_inbox(self.user_1).notifications_count, 5)
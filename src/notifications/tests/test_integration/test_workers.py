@@ -0,0 +1,176 @@
+import datetime
+import threading
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from notifications import Handler
+from notifications.management.commands.run_notification_workers import _format_job_stats, _loop
+from notifications.models import NotificationJob, SystemNotification
+from users.models import User
+
+
+class NotificationsWorkersIntegrationTestCase(TestCase):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.post_user = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+
+    def _accept_like(self, post_id: int = 1):
+        Handler.accept(
+            action="BLOG_POSTS_LIKE",
+            data={
+                "post": {
+                    "id": post_id,
+                    "user_id": self.post_user.pk,
+                },
+                "from_user": {
+                    "id": 2
+                }
+            }
+        )
+
+    def _run(self) -> str:
+        out = StringIO()
+        call_command("run_notification_workers", once=True, batch_size=2, stdout=out)
+        return out.getvalue().strip()
+
+    def test_run(self):
+        for i in range(0, 3):
+            self._accept_like(post_id=i)
+
+        self.assertEqual(self._run(), "Claimed jobs: 3. Sent emails: 0. Failed emails: 0.")
+        self.assertFalse(NotificationJob.objects.exists())
+        self.assertEqual(SystemNotification.objects.filter(user_id=self.post_user.pk).count(), 3)
+
+    def test_not_due(self):
+        self._accept_like()
+        NotificationJob.objects.update(run_at=timezone.now() + datetime.timedelta(minutes=1))
+
+        self.assertEqual(self._run(), "Claimed jobs: 0. Sent emails: 0. Failed emails: 0.")
+        self.assertEqual(NotificationJob.objects.count(), 1)
+
+    @override_settings(NOTIFICATIONS_JOB_RETRY_DELAY=10)
+    def test_retry(self):
+        self._accept_like()
+
+        with patch("notifications.entrypoints.blog_posts.SystemNotificationService.coalesce") as mock:
+            mock.side_effect = ValueError("sample error")
+            self._run()
+
+        job: NotificationJob = NotificationJob.objects.get()
+        self.assertEqual(job.status, NotificationJob.Status.PENDING)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn("sample error", job.last_error)
+        self.assertGreater(job.run_at, timezone.now() + datetime.timedelta(seconds=5))
+
+        NotificationJob.objects.update(run_at=timezone.now())
+        self._run()
+
+        self.assertFalse(NotificationJob.objects.exists())
+        self.assertEqual(SystemNotification.objects.count(), 1)
+
+    @override_settings(NOTIFICATIONS_JOB_RETRY_DELAY=10, NOTIFICATIONS_JOB_MAX_RETRY_DELAY=15)
+    def test_backoff(self):
+        self._accept_like()
+
+        delays = []
+        with patch("notifications.entrypoints.blog_posts.SystemNotificationService.coalesce") as mock:
+            mock.side_effect = ValueError("sample error")
+            for i in range(0, 3):
+                now = timezone.now()
+                self._run()
+                job: NotificationJob = NotificationJob.objects.get()
+                delays.append(round((job.run_at - now).total_seconds()))
+                NotificationJob.objects.update(run_at=now)
+
+        self.assertEqual(delays, [10, 15, 15])
+
+    @override_settings(NOTIFICATIONS_JOB_MAX_ATTEMPTS=2)
+    def test_dead(self):
+        self._accept_like()
+
+        with patch("notifications.entrypoints.blog_posts.SystemNotificationService.coalesce") as mock:
+            mock.side_effect = ValueError("sample error")
+            self._run()
+            NotificationJob.objects.update(run_at=timezone.now())
+            self._run()
+
+        job: NotificationJob = NotificationJob.objects.get()
+        self.assertEqual(job.status, NotificationJob.Status.DEAD)
+        self.assertEqual(job.attempts, 2)
+
+        NotificationJob.objects.update(run_at=timezone.now())
+        self.assertEqual(self._run(), "Claimed jobs: 0. Sent emails: 0. Failed emails: 0.")
+
+    @override_settings(NOTIFICATIONS_JOB_MAX_ATTEMPTS=1)
+    def test_dead_redacted(self):
+        Handler.accept(
+            action="USER_CONFIRM_EMAIL",
+            data={
+                "link": "http://localhost/confirm-email?uid=MQ&token=secret",
+                "email": self.post_user.email
+            }
+        )
+
+        with patch("notifications.entrypoints.user.EmailSender.send") as mock:
+            mock.side_effect = ValueError("sample error")
+            self._run()
+
+        job: NotificationJob = NotificationJob.objects.get()
+        self.assertEqual(job.status, NotificationJob.Status.DEAD)
+        self.assertEqual(
+            job.kwargs,
+            {"data": {"link": "[redacted]", "email": self.post_user.email}}
+        )
+
+    def test_rollback_failed_job(self):
+        Handler.accept(
+            action="BLOG_POSTS_NEW",
+            data={
+                "post": {
+                    "id": 10,
+                    "user": {
+                        "id": self.post_user.pk,
+                        "username": self.post_user.username
+                    },
+                },
+                "to_user_ids": [self.post_user.pk, 0]
+            }
+        )
+        self._accept_like()
+
+        self._run()
+
+        job: NotificationJob = NotificationJob.objects.get()
+        self.assertEqual(job.action, "BLOG_POSTS_NEW")
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(list(SystemNotification.objects.values_list("event_id", flat=True)), [1])
+
+    def test_job_stats(self):
+        self._accept_like()
+        self._run()
+
+        self.assertRegex(_format_job_stats(), r"Event BLOG_POSTS_LIKE: calls: \d+\. Errors: \d+\. Time: [\d.]+s\.")
+
+    @override_settings(NOTIFICATIONS_STATS_INTERVAL=0)
+    def test_report_stats(self):
+        stop = threading.Event()
+        report = Mock()
+
+        def run_batch(batch_size):
+            stop.set()
+            return 1
+
+        _loop(stop, run_batch, batch_size=1, poll_interval=0, report=report)
+        # Once by the interval, once on exit.
+        self.assertEqual(report.call_count, 2)
@@ -0,0 +1,65 @@
+from django.test import TestCase, override_settings, tag
+
+from common.tests.mixins import QueryPlanTestCaseMixin
+from notifications.entrypoints import BlogPostsEntrypoint
+from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent
+from notifications.services import SystemNotificationService
+from users.models import User
+
+
+@tag("query-plan-tests", "notifications")
+class SystemNotificationDeleteQueryPlanTestCase(TestCase, QueryPlanTestCaseMixin):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+        SystemNotification.objects.bulk_create([
+            SystemNotification(
+                user_id=cls.user.pk,
+                type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+                event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+                message="New like on your post.",
+                is_read=i % 4 != 0,
+                post_id=i % 50,
+                from_user_id=i,
+            )
+            for i in range(0, 1000)
+        ])
+
+    @override_settings(NOTIFICATIONS_COALESCE=False)
+    def test_like_remove(self):
+        plans = self._get_plans(
+            lambda: BlogPostsEntrypoint().accept(
+                "BLOG_POSTS_LIKE_REMOVE",
+                data={
+                    "post": {
+                        "id": 4,
+                        "user_id": self.user.pk,
+                    },
+                    "from_user": {
+                        "id": 4
+                    }
+                }
+            ),
+            table=SystemNotification._meta.db_table
+        )
+        self.assertTrue(plans)
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "notifications_unread_post_idx")
+
+    def test_trim(self):
+        plans = self._get_plans(
+            lambda: SystemNotificationService.trim(user_id=self.user.pk, cap=900, batch_size=50),
+            table=SystemNotification._meta.db_table
+        )
+        self.assertTrue(plans)
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "notifications_user_idx")
@@ -0,0 +1,88 @@
+from django.test import tag
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common.tests.mixins import QueryPlanTestCaseMixin
+from notifications.models import SystemNotification, SystemNotificationType, NotificationEvent, SystemNotificationInbox
+from users.models import User
+
+
+@tag("query-plan-tests", "notifications")
+class SystemNotificationListQueryPlanTestCase(APITestCase, QueryPlanTestCaseMixin):
+    fixtures = [
+        "notifications/fixtures/notificationevent.json",
+        "notifications/fixtures/systemnotificationtype.json",
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        users = User.objects.bulk_create([
+            User(email=f"test-{i}@gmail.com", username=f"test-{i}")
+            for i in range(0, 20)
+        ])
+        SystemNotification.objects.bulk_create([
+            SystemNotification(
+                user_id=user.pk,
+                type_id=SystemNotificationType.Handbook.BLOG_POSTS_LIKE.value,
+                event_id=NotificationEvent.Handbook.BLOG_POSTS_LIKE.value,
+                message="New like on your post.",
+                is_read=i % 4 != 0,
+                payload={
+                    "post_id": i,
+                    "from_user_id": user.pk,
+                },
+            )
+            for user in users
+            for i in range(0, 50)
+        ])
+        cls.user = users[0]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user, token=str(RefreshToken.for_user(self.user).access_token))
+
+        self.url = "/api/v1/notifications"
+
+    def _get(self, **data):
+        plans = self._get_plans(lambda: self.assertEqual(self.client.get(self.url, data=data).status_code, 200),
+                                table=SystemNotification._meta.db_table)
+        self.assertTrue(plans)
+        return plans
+
+    def test_default_ordering(self):
+        for plan in self._get():
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "notifications_user_idx")
+
+    def test_keyset(self):
+        for plan in self._get(cursor=""):
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "notifications_user_idx")
+
+    def test_unread(self):
+        for plan in self._get(is_read="false"):
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "notifications_user_unread_idx")
+
+    def _get_relations(self, plan: dict):
+        return {node["Relation Name"] for node in self._get_nodes(plan) if "Relation Name" in node}
+
+    def test_partitions_ordered(self):
+        for plan in self._get():
+            self.assertNotIn("Sort", {node["Node Type"] for node in self._get_nodes(plan)})
+
+    def test_keyset_partitions_pruned(self):
+        resp = self.client.get(self.url, data={"cursor": ""})
+        current_partition = f"{SystemNotification._meta.db_table}_p{timezone.now():%Y%m}"
+
+        plans = self._get(cursor=resp.data["next"])
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+            self.assertEqual(
+                self._get_relations(plan) - {SystemNotificationInbox._meta.db_table},
+                {current_partition}
+            )
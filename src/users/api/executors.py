@@ -0,0 +1,24 @@
+import functools
+from typing import Optional
+
+from django.conf import settings
+
+from common.utils import BoundedExecutor
+
+
+@functools.cache
+def _get_executor(max_workers: int, max_queue_size: int) -> BoundedExecutor:
+    return BoundedExecutor(
+        max_workers=max_workers,
+        max_queue_size=max_queue_size,
+        thread_name_prefix="auth"
+    )
+
+
+def get_auth_executor() -> Optional[BoundedExecutor]:
+    """
+    Executor of the views hashing passwords, see `USERS_AUTH_EXECUTOR_WORKERS`.
+    """
+    if not settings.USERS_AUTH_EXECUTOR_WORKERS:
+        return None
+    return _get_executor(settings.USERS_AUTH_EXECUTOR_WORKERS, settings.USERS_AUTH_EXECUTOR_QUEUE_SIZE)
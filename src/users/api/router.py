@@ -50,6 +50,11 @@ urlpatterns.extend([
 
     path("account/password", viewsets.PasswordViewSet.as_view({
         "post": "update",
+    })),
+
+    # Users
+    path("users/autocomplete", viewsets.UserViewSet.as_view({
+        "get": "autocomplete",
     }))
 
 ])
@@ -1,7 +1,15 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Value
+from django.db.models.functions import Lower
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework_simplejwt import serializers as simple_jwt_serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings as simple_jwt_settings
 
 from users.models import User
 from users.services.auth import AuthService
+from users.tokens.jwt import UserRefreshToken
 from . import validators
 
 
@@ -21,15 +29,10 @@ class RegistrationSerializer(serializers.Serializer):
             validators.PasswordEqualValidator()
         ]
 
-    def validate_username(self, value):
-        if User.objects.filter(username=User.normalize_username(value)).exists():
-            raise serializers.ValidationError("Username already exists.")
-        return value
-
-    def validate_email(self, value):
-        if User.objects.filter(email=User.objects.normalize_email(value)).exists():
-            raise serializers.ValidationError("Email already exists.")
-        return value
+    unique_errors = {
+        "username": "Username already exists.",
+        "email": "Email already exists.",
+    }
 
     def validate(self, attrs):
         if attrs["password"] != attrs["password2"]:
@@ -38,16 +41,35 @@ class RegistrationSerializer(serializers.Serializer):
             })
         return attrs
 
+    def _raise_unique_errors(self, validated_data: dict, error: IntegrityError):
+        # Only one violation is reported by the database, the taken fields are looked up to report all of them.
+        errors = {
+            field: [message]
+            for field, message in self.unique_errors.items()
+            if User.objects.alias(
+                value_lower=Lower(field)
+            ).filter(
+                value_lower=Lower(Value(validated_data[field]))
+            ).exists()
+        }
+        if not errors:
+            raise error
+        raise serializers.ValidationError(errors) from error
+
     def create(self, validated_data):
-        user = User.objects.create_user(
-            username=validated_data["username"],
-            password=validated_data["password"],
-            first_name=validated_data["first_name"],
-            last_name=validated_data["last_name"],
-            email=validated_data["email"]
-        )
-
-        AuthService.request_confirm_email(user)
+        # The uniqueness is checked by the case-insensitive unique constraints on insert.
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=validated_data["username"],
+                    password=validated_data["password"],
+                    first_name=validated_data["first_name"],
+                    last_name=validated_data["last_name"],
+                    email=validated_data["email"]
+                )
+                AuthService.request_confirm_email(user)
+        except IntegrityError as ex:
+            self._raise_unique_errors(validated_data, ex)
         return user
 
 
@@ -60,7 +82,7 @@ class ResendConfirmEmailSerializer(serializers.Serializer):
     email = serializers.EmailField(required=True)
 
     def validate(self, attrs):
-        user = User.objects.filter(email=User.objects.normalize_email(attrs["email"])).first()
+        user = AuthService.get_user_by_email(attrs["email"])
         if not user:
             raise serializers.ValidationError({
                 "email": "User not found."
@@ -68,3 +90,22 @@ class ResendConfirmEmailSerializer(serializers.Serializer):
 
         attrs["user"] = user
         return attrs
+
+
+class LoginSerializer(simple_jwt_serializers.TokenObtainPairSerializer):
+    token_class = UserRefreshToken
+
+
+class RefreshSerializer(simple_jwt_serializers.TokenRefreshSerializer):
+    token_class = UserRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        is_active = User.objects.filter(
+            pk=refresh[simple_jwt_settings.USER_ID_CLAIM]
+        ).values_list("is_active", flat=True).first()
+        if is_active is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return super().validate(attrs)
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+from users.models import User
+
+
+class UserAutocompleteQuerySerializer(serializers.Serializer):
+    search = serializers.CharField(required=True, max_length=150)
+
+
+class UserAutocompleteSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = (
+            "id",
+            "username"
+        )
@@ -1,3 +1,4 @@
 from .account import AccountViewSet
 from .auth import AuthViewSet
 from .password import PasswordViewSet
+from .user import UserViewSet
@@ -1,6 +1,7 @@
 from rest_framework import viewsets, serializers, permissions
 
 from users.api.serializers.account import AccountSerializer, AccountUpdateSerializer
+from users.models import User
 
 
 class AccountViewSet(viewsets.ModelViewSet):
@@ -18,4 +19,5 @@ class AccountViewSet(viewsets.ModelViewSet):
             return self.serializer_class
 
     def get_object(self):
-        return self.request.user
+        # The authenticated user holds the `AUTH_USER_FIELDS` snapshot only.
+        return User.objects.get(pk=self.request.user.pk)
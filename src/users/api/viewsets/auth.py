@@ -5,26 +5,34 @@ from rest_framework.response import Response
 from rest_framework_simplejwt import serializers as simple_jwt_serializers
 from rest_framework_simplejwt import views as simple_jwt_viewsets
 
+from common.api.mixins import ExecutorViewMixin
+from users.api.executors import get_auth_executor
 from users.api.serializers.auth import (
     RegistrationSerializer,
     ConfirmEmailSerializer,
-    ResendConfirmEmailSerializer
+    ResendConfirmEmailSerializer,
+    LoginSerializer,
+    RefreshSerializer
 )
 from users.services.auth import AuthService
 
 
-class AuthViewSet(viewsets.ViewSetMixin, simple_jwt_viewsets.TokenViewBase):
+class AuthViewSet(ExecutorViewMixin, viewsets.ViewSetMixin, simple_jwt_viewsets.TokenViewBase):
     serializer_class = serializers.Serializer
     permission_classes = []
     authentication_classes = []
 
+    @classmethod
+    def get_executor(cls):
+        return get_auth_executor()
+
     def get_serializer_class(self) -> Type[serializers.Serializer]:
         if self.action == "registration":
             return RegistrationSerializer
         elif self.action == "login":
-            return simple_jwt_serializers.TokenObtainPairSerializer
+            return LoginSerializer
         elif self.action == "refresh":
-            return simple_jwt_serializers.TokenRefreshSerializer
+            return RefreshSerializer
         elif self.action == "refresh":
             return simple_jwt_serializers.TokenBlacklistSerializer
         elif self.action == "confirm_email":
@@ -1,6 +1,8 @@
 from rest_framework import viewsets, serializers, status, permissions
 from rest_framework.response import Response
 
+from common.api.mixins import ExecutorViewMixin
+from users.api.executors import get_auth_executor
 from users.api.serializers.password import (
     PasswordUpdateSerializer,
     PasswordForgotSerializer,
@@ -9,12 +11,16 @@ from users.api.serializers.password import (
 from users.services.auth import AuthService
 
 
-class PasswordViewSet(viewsets.GenericViewSet):
+class PasswordViewSet(ExecutorViewMixin, viewsets.GenericViewSet):
     serializer_class = serializers.Serializer
     permission_classes = [
         permissions.IsAuthenticated
     ]
 
+    @classmethod
+    def get_executor(cls):
+        return get_auth_executor()
+
     def get_permissions(self):
         if self.action == "update":
             self.permission_classes = [
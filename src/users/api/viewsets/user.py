@@ -0,0 +1,29 @@
+from rest_framework import viewsets, serializers, permissions
+from rest_framework.response import Response
+
+from users.api.serializers.user import UserAutocompleteQuerySerializer, UserAutocompleteSerializer
+from users.services.search import UserSearchService
+
+
+class UserViewSet(viewsets.GenericViewSet):
+    serializer_class = serializers.Serializer
+    permission_classes = [
+        permissions.IsAuthenticated
+    ]
+
+    def get_serializer_class(self):
+        if self.action == "autocomplete":
+            return UserAutocompleteSerializer
+        else:
+            return self.serializer_class
+
+    def autocomplete(self, request, *args, **kwargs):
+        query_serializer = UserAutocompleteQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        users = UserSearchService.autocomplete(
+            value=query_serializer.validated_data["search"]
+        )
+
+        serializer = self.get_serializer(users, many=True)
+        return Response(serializer.data)
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        # Snapshots of `AuthUserService` are dropped on the changes of the users.
+        # `QuerySet.update` does not send the signals, it must call `AuthUserService.invalidate` explicitly.
+        from users import signals  # noqa: F401
@@ -0,0 +1,60 @@
+import os
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from users.services.user_import import UserImportService
+
+
+class Command(BaseCommand):
+    help = "Create users from a CSV or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="File with a row per user: username, email, password, first_name, last_name, is_email_confirmed."
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            default=None,
+            help="Format of the file, by default taken from the file extension."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.USERS_IMPORT_BATCH_SIZE,
+            help="Number of rows loaded in one transaction."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of processes hashing the passwords, 0 hashes them in the command process."
+        )
+        parser.add_argument(
+            "--send-confirm-emails",
+            action="store_true",
+            help="Request the email confirmation of the imported users with unconfirmed emails."
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if file_format in ("json", "jsonl"):
+            file_format = "ndjson"
+        if file_format not in ("csv", "ndjson"):
+            raise CommandError("Unknown file format, use --format.")
+
+        with open(path, newline="", encoding="utf-8") as file:
+            stats = UserImportService.import_rows(
+                UserImportService.read_rows(file, file_format),
+                batch_size=options["batch_size"],
+                workers=options["workers"],
+                send_confirm_emails=options["send_confirm_emails"],
+                on_error=self.stderr.write
+            )
+
+        self.stdout.write(
+            f"Imported users: {stats.imported}. Skipped users: {stats.skipped}. Invalid rows: {stats.invalid}."
+        )
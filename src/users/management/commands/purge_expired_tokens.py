@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from users.services.token import TokenService
+
+
+class Command(BaseCommand):
+    help = "Delete the expired outstanding and blacklisted tokens"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.USERS_TOKEN_PURGE_BATCH_SIZE,
+            help="Number of outstanding tokens deleted in one transaction."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        purged = 0
+        while True:
+            deleted = TokenService.purge_expired(batch_size)
+            purged += deleted
+            if deleted < batch_size:
+                break
+
+        self.stdout.write(f"Purged tokens: {purged}.")
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_user_is_email_confirmed_alter_user_email'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['username'], name='users_user_username_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
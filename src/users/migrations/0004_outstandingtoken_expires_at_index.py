@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Serves the purge of the expired tokens by `purge_expired_tokens`.
+    """
+
+    dependencies = [
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+        ('users', '0003_username_trgm_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS users_outstandingtoken_expires_at_idx "
+                "ON token_blacklist_outstandingtoken (expires_at)",
+            reverse_sql="DROP INDEX IF EXISTS users_outstandingtoken_expires_at_idx",
+        ),
+    ]
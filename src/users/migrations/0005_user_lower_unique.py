@@ -0,0 +1,74 @@
+# Generated by Django 5.0.3 on 2026-10-18 10:08
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# Duplicates listed in the error of the preflight.
+DUPLICATES_REPORTED = 20
+
+
+def check_duplicates(apps, schema_editor):
+    """
+    The unique indexes cannot be built while users differing only in the case of the username or the email exist,
+    they are reported here instead of failing the index build. Resolve them and run the migration again.
+    """
+    User = apps.get_model("users", "User")
+    errors = []
+    with schema_editor.connection.cursor() as cursor:
+        for field in ("username", "email"):
+            cursor.execute(
+                f"""
+                SELECT lower({field}), array_agg(id ORDER BY id)
+                FROM {User._meta.db_table}
+                GROUP BY lower({field})
+                HAVING count(*) > 1
+                ORDER BY lower({field})
+                """
+            )
+            duplicates = cursor.fetchall()
+            errors.extend(
+                f"{field} {value!r}: users {', '.join(map(str, user_ids))}"
+                for value, user_ids in duplicates[:DUPLICATES_REPORTED]
+            )
+            if len(duplicates) > DUPLICATES_REPORTED:
+                errors.append(f"{field}: {len(duplicates) - DUPLICATES_REPORTED} more")
+
+    if errors:
+        raise RuntimeError("Case-insensitive duplicates of the users:\n" + "\n".join(errors))
+
+
+def _create_unique_index(name: str, field: str) -> migrations.SeparateDatabaseAndState:
+    # Postgres builds an expression constraint as a unique index, so it is built concurrently, without blocking
+    # the writes to the table. A failed build leaves an invalid index, it is dropped on the next run.
+    return migrations.SeparateDatabaseAndState(
+        database_operations=[
+            migrations.RunSQL(
+                sql=[
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {name}",
+                    f"CREATE UNIQUE INDEX CONCURRENTLY {name} ON users_user (lower({field}))",
+                ],
+                reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS {name}",
+            ),
+        ],
+        state_operations=[
+            migrations.AddConstraint(
+                model_name='user',
+                constraint=models.UniqueConstraint(django.db.models.functions.text.Lower(field), name=name),
+            ),
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0004_outstandingtoken_expires_at_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicates, migrations.RunPython.noop),
+        _create_unique_index('users_user_username_lower_uniq', 'username'),
+        _create_unique_index('users_user_email_lower_uniq', 'email'),
+    ]
@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.functions import Collate, Lower
 
 
 class User(AbstractUser):
@@ -26,3 +28,27 @@ class User(AbstractUser):
         verbose_name="URL of the personal website",
         null=True,
     )
+
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                Lower("username"),
+                name="users_user_username_lower_uniq"
+            ),
+            models.UniqueConstraint(
+                Lower("email"),
+                name="users_user_email_lower_uniq"
+            ),
+        ]
+        indexes = [
+            # Case-insensitive username prefix search and its ordering, see `UserSearchService`.
+            models.Index(
+                Collate(Lower("username"), "C"),
+                name="users_user_username_prefix_idx"
+            ),
+            GinIndex(
+                fields=["username"],
+                opclasses=["gin_trgm_ops"],
+                name="users_user_username_trgm_idx"
+            ),
+        ]
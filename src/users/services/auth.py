@@ -1,4 +1,8 @@
+from typing import List, Optional
+
 from django.conf import settings
+from django.db.models import Value
+from django.db.models.functions import Lower
 from rest_framework import exceptions
 
 from common import exceptions as custom_exceptions
@@ -10,19 +14,43 @@ from users.tokens import auth as auth_tokens
 class AuthService:
 
     @staticmethod
-    def request_confirm_email(user: User):
-        uid = auth_tokens.UidGenerator().make(user)
-        token = auth_tokens.ConfirmEmailTokenGenerator().make_token(user)
+    def get_user_by_email(email: str) -> Optional[User]:
+        """
+        Case-insensitive lookup, served by the unique index on `lower(email)`.
+        """
+        return User.objects.alias(
+            email_lower=Lower("email")
+        ).filter(
+            email_lower=Lower(Value(email))
+        ).first()
 
+    @staticmethod
+    def request_confirm_email(user: User):
         NotificationsHandler.accept(
             action="USER_CONFIRM_EMAIL",
-            data={
-                "link": f"{settings.PUBLIC_HOST}/confirm-email?uid={uid}&token={token}",
-                "email": user.email
-            }
+            data=AuthService._get_confirm_email_data(user)
         )
         return user
 
+    @staticmethod
+    def request_confirm_emails(users: List[User]):
+        """
+        `request_confirm_email` for many users, the notification jobs are written with one INSERT.
+        """
+        NotificationsHandler.accept_many(
+            action="USER_CONFIRM_EMAIL",
+            kwargs_list=[{"data": AuthService._get_confirm_email_data(user)} for user in users]
+        )
+
+    @staticmethod
+    def _get_confirm_email_data(user: User) -> dict:
+        uid = auth_tokens.UidGenerator().make(user)
+        token = auth_tokens.ConfirmEmailTokenGenerator().make_token(user)
+        return {
+            "link": f"{settings.PUBLIC_HOST}/confirm-email?uid={uid}&token={token}",
+            "email": user.email
+        }
+
     @staticmethod
     def resend_request_confirm_email(user: User):
         if user.is_email_confirmed:
@@ -51,7 +79,7 @@ class AuthService:
 
     @staticmethod
     def process_forgot_password(data: dict):
-        user = User.objects.filter(email=data["email"]).first()
+        user = AuthService.get_user_by_email(data["email"])
         if not user:
             return
 
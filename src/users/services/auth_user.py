@@ -0,0 +1,57 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import DEFERRED
+
+from common.utils import LRUCache
+from users.models import User
+
+# Fields of a user kept in a snapshot, the authentication and the permissions use only them.
+AUTH_USER_FIELDS = (
+    "username",
+    "is_active",
+    "is_email_confirmed",
+)
+
+
+class AuthUserService:
+    """
+    Snapshots of the authenticated users, kept in a per-process cache.
+
+    A snapshot holds the `AUTH_USER_FIELDS` only, it is loaded from the database on a cache miss.
+    Snapshots are dropped on the saves and deletes of the user (see `users.signals`),
+    the other processes see a change after `USERS_AUTH_CACHE_TTL` seconds at most.
+    """
+    cache: LRUCache[dict] = LRUCache(
+        max_size=settings.USERS_AUTH_CACHE_SIZE,
+        ttl=settings.USERS_AUTH_CACHE_TTL
+    )
+
+    @staticmethod
+    def get_user(user_id: int) -> Optional[User]:
+        """
+        The user hydrated from the snapshot, the other fields are deferred and loaded on access.
+        """
+        snapshot = AuthUserService.cache.get(user_id)
+        if snapshot is None:
+            snapshot = User.objects.filter(pk=user_id).values(*AUTH_USER_FIELDS).first()
+            if snapshot is None:
+                return None
+            AuthUserService.cache.set(user_id, snapshot)
+
+        values = {"id": user_id, **snapshot}
+        return User.from_db(
+            DEFAULT_DB_ALIAS,
+            list(values),
+            [values.get(field.attname, DEFERRED) for field in User._meta.concrete_fields]
+        )
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        """
+        Drop the snapshot, the next request loads it from the database.
+        It is dropped again on the commit, a request in between could load the values before the change.
+        """
+        AuthUserService.cache.delete(user_id)
+        transaction.on_commit(lambda: AuthUserService.cache.delete(user_id))
@@ -0,0 +1,65 @@
+from typing import List
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import models
+from django.db.models.functions import Collate, Lower
+
+from users.models import User
+
+
+class UserSearchService:
+
+    @staticmethod
+    def get_prefix_key(field: str = "username") -> models.Func:
+        """
+        Case-insensitive prefix key of a username, served by the `users_user_username_prefix_idx` index.
+        The "C" collation makes the index usable for both `LIKE 'value%'` and the ordering.
+        """
+        return Collate(Lower(field), "C")
+
+    @staticmethod
+    def search(queryset: models.QuerySet,
+               value: str,
+               field: str = "username") -> models.QuerySet:
+        """
+        Filter by a case-insensitive username prefix or a fuzzy match and annotate `similarity`.
+
+        Both conditions are served by indexes on `users_user.username`:
+        the prefix by the `users_user_username_prefix_idx` index,
+        the fuzzy match by the `gin_trgm_ops` index.
+        """
+        return queryset.alias(
+            username_key=UserSearchService.get_prefix_key(field)
+        ).filter(
+            models.Q(username_key__startswith=value.lower()) |
+            models.Q(**{f"{field}__trigram_word_similar": value})
+        ).annotate(
+            similarity=TrigramWordSimilarity(value, field)
+        )
+
+    @staticmethod
+    def autocomplete(value: str) -> List[User]:
+        """
+        Prefix matches in the index order, the remaining slots are filled with the best fuzzy matches.
+        Both queries are limited, so short prefixes matching a large part of the table stay cheap.
+        """
+        limit = settings.USERS_AUTOCOMPLETE_LIMIT
+        queryset = User.objects.filter(is_active=True).alias(
+            username_key=UserSearchService.get_prefix_key()
+        ).only("id", "username")
+
+        users = list(
+            queryset.filter(username_key__startswith=value.lower()).order_by("username_key")[:limit]
+        )
+        if len(users) < limit:
+            users.extend(
+                queryset.filter(
+                    username__trigram_word_similar=value
+                ).exclude(
+                    username_key__startswith=value.lower()
+                ).annotate(
+                    similarity=TrigramWordSimilarity(value, "username")
+                ).order_by("-similarity", "username")[:limit - len(users)]
+            )
+        return users
@@ -0,0 +1,147 @@
+import logging
+import threading
+import time
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from common.utils import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class TokenService:
+    _revocation_filter: Optional[BloomFilter] = None
+    _revocation_filter_built_at = 0.0
+    _revocation_filter_building = False
+    # Tokens blacklisted while the filter is built, they are added to the new filter.
+    _revocation_filter_added: Optional[List[str]] = None
+    _revocation_filter_lock = threading.Lock()
+
+    @staticmethod
+    def purge_expired(batch_size: int) -> int:
+        """
+        Delete up to `batch_size` of the expired outstanding tokens with their blacklist entries,
+        returns the number of deleted outstanding tokens.
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH expired AS (
+                    SELECT id
+                    FROM {OutstandingToken._meta.db_table}
+                    WHERE expires_at <= %(now)s
+                    ORDER BY expires_at
+                    LIMIT %(batch_size)s
+                ), blacklisted AS (
+                    DELETE FROM {BlacklistedToken._meta.db_table}
+                    WHERE token_id IN (SELECT id FROM expired)
+                )
+                DELETE FROM {OutstandingToken._meta.db_table}
+                WHERE id IN (SELECT id FROM expired)
+                """,
+                {
+                    "now": timezone.now(),
+                    "batch_size": batch_size,
+                }
+            )
+            return cursor.rowcount
+
+    @staticmethod
+    def might_be_revoked(jti: str) -> bool:
+        """
+        Check the token against the per-process Bloom filter of the blacklisted tokens.
+        False means the token was not blacklisted when the filter was built, True is returned
+        until the first filter is built.
+
+        The filter is rebuilt every `USERS_REVOCATION_FILTER_TTL` seconds by a background thread
+        (see `USERS_REVOCATION_FILTER_BACKGROUND`), the old filter is used until the new one is ready.
+        """
+        with TokenService._revocation_filter_lock:
+            revocation_filter = TokenService._revocation_filter
+            rebuild = not TokenService._revocation_filter_building and (
+                revocation_filter is None
+                or time.monotonic() - TokenService._revocation_filter_built_at >= settings.USERS_REVOCATION_FILTER_TTL
+            )
+            if rebuild:
+                TokenService._revocation_filter_building = True
+
+        if rebuild:
+            if settings.USERS_REVOCATION_FILTER_BACKGROUND:
+                threading.Thread(
+                    target=TokenService._rebuild_revocation_filter_in_background,
+                    name="revocation-filter",
+                    daemon=True
+                ).start()
+            else:
+                TokenService.rebuild_revocation_filter()
+                revocation_filter = TokenService._revocation_filter
+
+        return revocation_filter is None or jti in revocation_filter
+
+    @staticmethod
+    def rebuild_revocation_filter() -> None:
+        """
+        Build the filter from the database and replace the current one.
+        """
+        with TokenService._revocation_filter_lock:
+            TokenService._revocation_filter_building = True
+            TokenService._revocation_filter_added = []
+        try:
+            revocation_filter = TokenService._build_revocation_filter()
+        finally:
+            with TokenService._revocation_filter_lock:
+                added, TokenService._revocation_filter_added = TokenService._revocation_filter_added, None
+                TokenService._revocation_filter_building = False
+                # A failed build is retried after the TTL, not on every request.
+                TokenService._revocation_filter_built_at = time.monotonic()
+
+        # Tokens blacklisted by this process while the filter was built could be missed by the query.
+        with TokenService._revocation_filter_lock:
+            for jti in added or ():
+                revocation_filter.add(jti)
+            TokenService._revocation_filter = revocation_filter
+
+    @staticmethod
+    def add_revoked(jti: str) -> None:
+        with TokenService._revocation_filter_lock:
+            if TokenService._revocation_filter is not None:
+                TokenService._revocation_filter.add(jti)
+            if TokenService._revocation_filter_added is not None:
+                TokenService._revocation_filter_added.append(jti)
+
+    @staticmethod
+    def reset_revocation_filter() -> None:
+        with TokenService._revocation_filter_lock:
+            TokenService._revocation_filter = None
+            TokenService._revocation_filter_built_at = 0.0
+
+    @staticmethod
+    def _rebuild_revocation_filter_in_background() -> None:
+        try:
+            TokenService.rebuild_revocation_filter()
+        except Exception:
+            logger.exception("Failed to rebuild the revocation filter")
+        finally:
+            # The thread has its own database connection.
+            connection.close()
+
+    @staticmethod
+    def _build_revocation_filter() -> BloomFilter:
+        # Expired tokens are rejected anyway, so they are left out.
+        jtis = BlacklistedToken.objects.filter(
+            token__expires_at__gt=timezone.now()
+        ).values_list(
+            "token__jti",
+            flat=True
+        )
+        revocation_filter = BloomFilter(
+            capacity=max(jtis.count() * 2, settings.USERS_REVOCATION_FILTER_MIN_CAPACITY),
+            error_rate=settings.USERS_REVOCATION_FILTER_ERROR_RATE
+        )
+        for jti in jtis.iterator(chunk_size=10000):
+            revocation_filter.add(jti)
+        return revocation_filter
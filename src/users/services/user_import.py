@@ -0,0 +1,200 @@
+import csv
+import io
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import IO, Callable, Iterable, Iterator, List, Optional
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from users.models import User
+from users.services.auth import AuthService
+
+IMPORT_FIELDS = ("username", "email", "password", "first_name", "last_name", "is_email_confirmed")
+
+
+@dataclass(slots=True)
+class UserImportStats:
+    imported: int = 0
+    skipped: int = 0
+    invalid: int = 0
+
+
+class UserImportService:
+
+    @staticmethod
+    def read_rows(file: IO[str], file_format: str) -> Iterator[dict]:
+        """
+        Stream the rows of a CSV file with a header line (`csv`) or of a file with a JSON object per line (`ndjson`).
+        """
+        if file_format == "csv":
+            yield from csv.DictReader(file)
+            return
+
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield row if isinstance(row, dict) else {}
+
+    @staticmethod
+    def import_rows(rows: Iterable[dict],
+                    batch_size: int,
+                    workers: int,
+                    send_confirm_emails: bool = False,
+                    on_error: Optional[Callable[[str], None]] = None) -> UserImportStats:
+        """
+        Create the users of `rows` in batches of `batch_size`.
+        The errors of the invalid rows are passed to `on_error` as they occur, they are not kept.
+
+        Passwords are hashed by `workers` processes (in this process if 0), every batch is loaded
+        with one COPY and one INSERT. Rows conflicting with an existing user, or with a row before them,
+        on the username or the email (case-insensitive) are skipped.
+        """
+        stats = UserImportStats()
+        executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+        try:
+            rows = enumerate(rows, start=1)
+            while batch := list(itertools.islice(rows, batch_size)):
+                users = []
+                for number, row in batch:
+                    try:
+                        users.append(UserImportService._clean(row))
+                    except ValidationError as ex:
+                        stats.invalid += 1
+                        if on_error:
+                            on_error(f"Row {number}: " + "; ".join(
+                                f"{name}: {' '.join(messages)}" for name, messages in ex.message_dict.items()
+                            ))
+
+                if not users:
+                    continue
+
+                passwords = [user.pop("password") for user in users]
+                hashed = executor.map(
+                    _hash_password,
+                    passwords,
+                    chunksize=max(len(passwords) // (workers * 4), 1)
+                ) if executor else map(_hash_password, passwords)
+                for user, password in zip(users, hashed):
+                    user["password"] = password
+
+                with transaction.atomic():
+                    created = UserImportService._load(users)
+                    if send_confirm_emails:
+                        UserImportService._request_confirm_emails(created)
+
+                stats.imported += len(created)
+                stats.skipped += len(users) - len(created)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+        return stats
+
+    @staticmethod
+    def _clean(row: dict) -> dict:
+        """
+        Validate and normalize a row the way `UserManager.create_user` does.
+        """
+        row = {key: value for key, value in row.items() if key in IMPORT_FIELDS and value is not None}
+        user = User(
+            username=User.normalize_username(str(row.get("username", ""))),
+            email=User.objects.normalize_email(str(row.get("email", ""))),
+            first_name=str(row.get("first_name", "")),
+            last_name=str(row.get("last_name", "")),
+            is_email_confirmed=row.get("is_email_confirmed") in (True, "1", "true", "True"),
+        )
+        user.clean_fields(exclude=["password", "address", "personal_website_url"])
+
+        return {
+            "username": user.username,
+            "email": user.email,
+            "password": str(row["password"]) if row.get("password") else None,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_email_confirmed": user.is_email_confirmed,
+        }
+
+    @staticmethod
+    def _load(users: List[dict]) -> List[User]:
+        """
+        COPY the rows to a temporary table and move them to the users table,
+        returns the created users with `id`, `email` and `is_email_confirmed` loaded.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for user in users:
+            writer.writerow([
+                user["username"],
+                user["email"],
+                user["password"],
+                user["first_name"],
+                user["last_name"],
+                "t" if user["is_email_confirmed"] else "f",
+            ])
+        buffer.seek(0)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                CREATE TEMPORARY TABLE users_import (
+                    position serial,
+                    username varchar(150),
+                    email varchar(254),
+                    password varchar(128),
+                    first_name varchar(150),
+                    last_name varchar(150),
+                    is_email_confirmed boolean
+                )
+                """
+            )
+            cursor.copy_expert(
+                "COPY users_import (username, email, password, first_name, last_name, is_email_confirmed) "
+                "FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (first_name, last_name))",
+                buffer
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {User._meta.db_table} (
+                    username, email, password, first_name, last_name, is_email_confirmed,
+                    is_superuser, is_staff, is_active, date_joined
+                )
+                SELECT
+                    username, email, password, first_name, last_name, is_email_confirmed,
+                    FALSE, FALSE, TRUE, %(now)s
+                FROM users_import
+                ORDER BY position
+                ON CONFLICT DO NOTHING
+                RETURNING id, email, is_email_confirmed
+                """,
+                {
+                    "now": timezone.now(),
+                }
+            )
+            created = [
+                User(id=user_id, email=email, is_email_confirmed=is_email_confirmed)
+                for user_id, email, is_email_confirmed in cursor.fetchall()
+            ]
+            cursor.execute("DROP TABLE users_import")
+            return created
+
+    @staticmethod
+    def _request_confirm_emails(users: List[User]):
+        # The notification jobs of the batch are written with one INSERT, in the transaction of the batch.
+        users = [user for user in users if not user.is_email_confirmed]
+        if users:
+            AuthService.request_confirm_emails(users)
+
+
+def _hash_password(password: Optional[str]) -> str:
+    # Module level, so the pool workers can unpickle it. Rows without a password get an unusable one.
+    return make_password(password)
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.models import User
+from users.services.auth_user import AUTH_USER_FIELDS, AuthUserService
+
+# Fields of a user that change the result of the authentication.
+AUTH_FIELDS = frozenset({*AUTH_USER_FIELDS, "password"})
+
+
+@receiver(post_save, sender=User)
+def invalidate_auth_user_on_save(sender, instance: User, update_fields=None, **kwargs):
+    if update_fields is None or AUTH_FIELDS & set(update_fields):
+        AuthUserService.invalidate(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_auth_user_on_delete(sender, instance: User, **kwargs):
+    AuthUserService.invalidate(instance.pk)
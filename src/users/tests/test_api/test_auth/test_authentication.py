@@ -0,0 +1,129 @@
+from django.test import tag
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.models import User
+from users.services.auth_user import AUTH_USER_FIELDS, AuthUserService
+
+
+class _BaseTestCase(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = User.objects.create_user(
+            username="test",
+            email="example@gmail.com",
+            password="test-password",
+            first_name="John",
+            last_name="Doe",
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        AuthUserService.cache.clear()
+        self.addCleanup(AuthUserService.cache.clear)
+
+        self.client = self.client_class()
+        self._authenticate(RefreshToken.for_user(self.user))
+
+        self.url = "/api/v1/account"
+
+    def _authenticate(self, refresh_token: RefreshToken):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh_token.access_token}")
+
+    def _get_snapshot(self) -> dict:
+        return {field: getattr(self.user, field) for field in AUTH_USER_FIELDS}
+
+
+@tag("api-tests", "auth")
+class AuthCachedUserAuthenticationAPITestCase(_BaseTestCase):
+
+    def test_no_user_query(self):
+        # The snapshot is loaded on the first request, then the only query loads the account.
+        with self.assertNumQueries(2):
+            resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(AuthUserService.cache.get(self.user.pk), self._get_snapshot())
+
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["email"], self.user.email)
+
+    def test_user_not_found(self):
+        refresh_token = RefreshToken.for_user(self.user)
+        refresh_token["user_id"] = 0
+        self._authenticate(refresh_token)
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "User not found")
+
+    def test_user_is_not_active(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "User is inactive")
+
+    def test_invalidate(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        AuthUserService.invalidate(self.user.pk)
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "User is inactive")
+
+    def test_invalidate_on_save(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+        self.user.is_active = False
+        self.user.save()
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "User is inactive")
+
+    def test_invalidate_on_delete(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+        User.objects.get(pk=self.user.pk).delete()
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "User not found")
+
+    def test_not_invalidated_on_account_update(self):
+        # None of the updated fields is a claim.
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+        resp = self.client.put(self.url, data={
+            "first_name": "New John",
+            "last_name": "New doe",
+            "email": "new-example@gmail.com",
+            "personal_website_url": None,
+            "address": None
+        })
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(AuthUserService.cache.get(self.user.pk), self._get_snapshot())
+
+    def test_invalidate_on_password_update(self):
+        AuthUserService.cache.set(self.user.pk, self._get_snapshot())
+
+        resp = self.client.post("/api/v1/account/password", data={
+            "old_password": "test-password",
+            "password": "new-Test-password-1",
+            "password2": "new-Test-password-1"
+        })
+        self.assertEqual(resp.status_code, 200)
+        self.assertIsNone(AuthUserService.cache.get(self.user.pk))
+        self.assertTrue(User.objects.get(pk=self.user.pk).check_password("new-Test-password-1"))
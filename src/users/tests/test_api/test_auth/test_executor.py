@@ -0,0 +1,116 @@
+import threading
+
+from django.test import override_settings, tag
+from rest_framework.test import APITransactionTestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.api.executors import get_auth_executor
+from users.api.viewsets.auth import AuthViewSet
+from users.api.viewsets.password import PasswordViewSet
+from users.models import User
+
+
+@override_settings(USERS_AUTH_EXECUTOR_WORKERS=1, USERS_AUTH_EXECUTOR_QUEUE_SIZE=0)
+class _BaseTestCase(APITransactionTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.user = User.objects.create_user(
+            username="test",
+            email="example@gmail.com",
+            password="test-password"
+        )
+
+        for view_class in (AuthViewSet, PasswordViewSet):
+            view_class._executor_busy_logged_at = None
+            self.addCleanup(setattr, view_class, "_executor_busy_logged_at", None)
+
+    def _occupy_executor(self):
+        # The only thread of the executor waits, the queue has no room for the request.
+        release = threading.Event()
+        future = get_auth_executor().submit(release.wait)
+
+        def _release():
+            release.set()
+            future.result()
+
+        self.addCleanup(_release)
+
+    def _assert_busy(self, resp):
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(resp.json(), {"detail": "Service is busy, try again later."})
+
+
+@tag("api-tests", "auth")
+class AuthExecutorAPITestCase(_BaseTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.url = "/api/v1/auth/login"
+        self.data = {
+            "username": "test",
+            "password": "test-password"
+        }
+
+    def test_login(self):
+        executor = get_auth_executor()
+        completed = executor.stats.completed
+
+        resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 200)
+        self.assertIsNotNone(resp.data["access"])
+
+        self.assertEqual(executor.stats.completed - completed, 1)
+
+    def test_busy(self):
+        self._occupy_executor()
+
+        resp = self.client.post(self.url, data=self.data)
+        self._assert_busy(resp)
+
+    def test_busy_logged(self):
+        self._occupy_executor()
+
+        with self.assertLogs("common.api.mixins", level="WARNING") as logs:
+            self._assert_busy(self.client.post(self.url, data=self.data))
+            # Logged once per interval.
+            self._assert_busy(self.client.post(self.url, data=self.data))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("AuthViewSet: executor is busy", logs.output[0])
+        self.assertRegex(logs.output[0], r"rejected: [1-9]")
+
+
+@tag("api-tests", "account", "password")
+class PasswordExecutorAPITestCase(_BaseTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        # Authenticated in the thread of the executor, by the header.
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+
+        self.url = "/api/v1/account/password"
+        self.data = {
+            "old_password": "test-password",
+            "password": "new-test-passworD1!",
+            "password2": "new-test-passworD1!",
+        }
+
+    def test_update(self):
+        executor = get_auth_executor()
+        completed = executor.stats.completed
+
+        resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 200)
+
+        self.assertEqual(executor.stats.completed - completed, 1)
+        self.assertTrue(User.objects.get(pk=self.user.pk).check_password("new-test-passworD1!"))
+
+    def test_busy(self):
+        self._occupy_executor()
+
+        resp = self.client.post(self.url, data=self.data)
+        self._assert_busy(resp)
+        self.assertTrue(User.objects.get(pk=self.user.pk).check_password("test-password"))
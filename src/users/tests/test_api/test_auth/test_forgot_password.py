@@ -52,6 +52,13 @@ class AuthForgotPasswordAPITestCase(_BaseTestCase):
 
         self.notification_forgot_password_mock.assert_called_once()
 
+    def test_email_case_insensitive(self):
+        self.data["email"] = self.user.email.upper()
+        resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 200)
+
+        self.notification_forgot_password_mock.assert_called_once()
+
     def test_no_user(self):
         self.data["email"] = "not-exists-user@gmail.com"
         resp = self.client.post(self.url, data=self.data)
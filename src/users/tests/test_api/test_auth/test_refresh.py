@@ -1,13 +1,17 @@
 import datetime
+from unittest.mock import patch
 
 from django.conf import settings
+from django.db import connection
 from django.test import tag
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.settings import api_settings as simple_jwt_settings
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
 
 from users.models import User
+from users.services.token import TokenService
 
 
 class _BaseTestCase(APITestCase):
@@ -29,6 +33,9 @@ class _BaseTestCase(APITestCase):
 
         self.client = self.client_class()
 
+        TokenService.reset_revocation_filter()
+        self.addCleanup(TokenService.reset_revocation_filter)
+
         self.url = "/api/v1/auth/refresh"
         self.data = {
             "refresh": str(self.refresh_token),
@@ -104,7 +111,21 @@ class AuthRefreshAPITestCase(_BaseTestCase):
         )
         self.data["refresh"] = str(RefreshToken.for_user(user))
         resp = self.client.post(self.url, data=self.data)
-        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "User is inactive")
+
+    def test_user_not_found(self):
+        user = User.objects.create_user(
+            username="test-2",
+            email="example-2@gmail.com",
+            password="sample-2"
+        )
+        self.data["refresh"] = str(RefreshToken.for_user(user))
+        user.delete()
+
+        resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "User not found")
 
     def test_cannot_use_again(self):
         resp = self.client.post(self.url, data=self.data)
@@ -114,6 +135,25 @@ class AuthRefreshAPITestCase(_BaseTestCase):
         self.assertEqual(resp.status_code, 401)
         self.assertEqual(str(resp.data["detail"]), "Token is blacklisted")
 
+    def test_cannot_use_again_not_in_revocation_filter(self):
+        resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 200)
+
+        # The token was blacklisted after the filter of another process was built.
+        with patch("users.tokens.jwt.TokenService.might_be_revoked", return_value=False):
+            resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "Token is blacklisted")
+
+    def test_revocation_filter_skips_blacklist_lookup(self):
+        TokenService.might_be_revoked("")
+
+        with CaptureQueriesContext(connection) as context:
+            resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 200)
+        for query in context.captured_queries:
+            self.assertNotIn('FROM "token_blacklist_blacklistedtoken" INNER JOIN', query["sql"])
+
 
 @tag("api-tests", "auth")
 class AuthRefreshValidationAPITestCase(_BaseTestCase):
@@ -80,6 +80,33 @@ class AuthRegistrationAPITestCase(_BaseTestCase):
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(str(resp.data["email"][0]), "Email already exists.")
 
+    def test_username_already_exists_case_insensitive(self):
+        resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 201)
+
+        resp = self.client.post(self.url, data={
+            **self.data,
+            "username": self.data["username"].upper(),
+            "email": "other@gmail.com"
+        })
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(str(resp.data["username"][0]), "Username already exists.")
+        self.assertNotIn("email", resp.data)
+
+    def test_email_already_exists_case_insensitive(self):
+        resp = self.client.post(self.url, data=self.data)
+        self.assertEqual(resp.status_code, 201)
+
+        resp = self.client.post(self.url, data={
+            **self.data,
+            "username": "other",
+            "email": self.data["email"].upper()
+        })
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(str(resp.data["email"][0]), "Email already exists.")
+        self.assertNotIn("username", resp.data)
+        self.assertEqual(User.objects.count(), 1)
+
     def test_mock_request_confirm_email(self):
         resp = self.client.post(self.url, data=self.data)
         self.assertEqual(resp.status_code, 201)
@@ -0,0 +1,101 @@
+from django.test import tag, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.models import User
+
+
+class _BaseTestCase(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = User.objects.create_user(email="test@gmail.com", username="test")
+        for i, username in enumerate(["johnny", "john", "john_smith", "jonathan", "alice", "bob"]):
+            User.objects.create_user(email=f"test-{i}@gmail.com", username=username)
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user, token=str(RefreshToken.for_user(self.user).access_token))
+
+        self.url = "/api/v1/users/autocomplete"
+
+
+@tag("api-tests", "users")
+class UserAutocompleteAPITestCase(_BaseTestCase):
+
+    def test_status_code(self):
+        resp = self.client.get(self.url, data={"search": "john"})
+        self.assertEqual(resp.status_code, 200)
+
+    def test_response_data(self):
+        resp = self.client.get(self.url, data={"search": "john"})
+        self.assertIsInstance(resp.data, list)
+
+        for item in resp.data:
+            user = User.objects.get(pk=item.pop("id"))
+            self.assertEqual(item.pop("username"), user.username)
+
+            self.assertEqual(item, {})
+
+    def test_ranked(self):
+        resp = self.client.get(self.url, data={"search": "john"})
+        usernames = [item["username"] for item in resp.data]
+        self.assertEqual(usernames[0], "john")
+        self.assertEqual(set(usernames), {"john", "johnny", "john_smith"})
+
+    def test_prefix(self):
+        resp = self.client.get(self.url, data={"search": "j"})
+        self.assertEqual(
+            {item["username"] for item in resp.data},
+            {"johnny", "john", "john_smith", "jonathan"}
+        )
+
+    def test_prefix_case_insensitive(self):
+        User.objects.create_user(email="test-a@gmail.com", username="Alicia")
+
+        resp = self.client.get(self.url, data={"search": "ALI"})
+        self.assertEqual([item["username"] for item in resp.data], ["alice", "Alicia"])
+
+    @override_settings(USERS_AUTOCOMPLETE_LIMIT=3)
+    def test_prefix_before_fuzzy(self):
+        resp = self.client.get(self.url, data={"search": "john"})
+        self.assertEqual([item["username"] for item in resp.data], ["john", "john_smith", "johnny"])
+
+        resp = self.client.get(self.url, data={"search": "jon"})
+        self.assertEqual([item["username"] for item in resp.data][0], "jonathan")
+
+    def test_fuzzy(self):
+        resp = self.client.get(self.url, data={"search": "smith"})
+        self.assertEqual([item["username"] for item in resp.data], ["john_smith"])
+
+        resp = self.client.get(self.url, data={"search": "jonathon"})
+        self.assertEqual([item["username"] for item in resp.data], ["jonathan"])
+
+    def test_not_found(self):
+        resp = self.client.get(self.url, data={"search": "mallory"})
+        self.assertEqual(resp.data, [])
+
+    @override_settings(USERS_AUTOCOMPLETE_LIMIT=2)
+    def test_limit(self):
+        resp = self.client.get(self.url, data={"search": "j"})
+        self.assertEqual(len(resp.data), 2)
+
+    def test_inactive(self):
+        User.objects.filter(username="john").update(is_active=False)
+
+        resp = self.client.get(self.url, data={"search": "john"})
+        self.assertNotIn("john", [item["username"] for item in resp.data])
+
+    def test_without_search(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(str(resp.data["search"][0]), "This field is required.")
+
+    def test_not_authenticated(self):
+        self.client = self.client_class()
+        resp = self.client.get(self.url, data={"search": "john"})
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(str(resp.data["detail"]), "Authentication credentials were not provided.")
@@ -0,0 +1,181 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from notifications.models import NotificationJob
+from users.models import User
+from users.services.user_import import UserImportService
+
+
+class UsersImportIntegrationTestCase(TestCase):
+
+    def _write(self, content: str, suffix: str) -> str:
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def _write_csv(self, lines: list) -> str:
+        return self._write("\n".join(lines) + "\n", ".csv")
+
+    def _write_ndjson(self, rows: list) -> str:
+        return self._write("\n".join(json.dumps(row) for row in rows) + "\n", ".ndjson")
+
+    def _run(self, path: str, **options) -> tuple:
+        out, err = StringIO(), StringIO()
+        options.setdefault("workers", 0)
+        call_command("import_users", path, stdout=out, stderr=err, **options)
+        return out.getvalue().strip(), err.getvalue().strip()
+
+    def test_csv(self):
+        path = self._write_csv([
+            "username,email,password,first_name,last_name,is_email_confirmed",
+            "user-1,user-1@GMAIL.COM,passworD123!,John,Doe,1",
+            "user-2,user-2@gmail.com,,,,",
+        ])
+
+        out, err = self._run(path)
+        self.assertEqual(out, "Imported users: 2. Skipped users: 0. Invalid rows: 0.")
+        self.assertEqual(err, "")
+
+        user_1 = User.objects.get(username="user-1")
+        self.assertEqual(user_1.email, "user-1@gmail.com")
+        self.assertTrue(user_1.check_password("passworD123!"))
+        self.assertEqual(user_1.first_name, "John")
+        self.assertEqual(user_1.last_name, "Doe")
+        self.assertTrue(user_1.is_email_confirmed)
+        self.assertTrue(user_1.is_active)
+        self.assertFalse(user_1.is_staff)
+        self.assertFalse(user_1.is_superuser)
+        self.assertIsNotNone(user_1.date_joined)
+
+        user_2 = User.objects.get(username="user-2")
+        self.assertFalse(user_2.has_usable_password())
+        self.assertEqual(user_2.first_name, "")
+        self.assertEqual(user_2.last_name, "")
+        self.assertFalse(user_2.is_email_confirmed)
+
+    def test_ndjson_process_pool(self):
+        path = self._write_ndjson([
+            {"username": "user-1", "email": "user-1@gmail.com", "password": "passworD123!"},
+            {"username": "user-2", "email": "user-2@gmail.com", "password": "passworD456!", "is_email_confirmed": True},
+        ])
+
+        out, err = self._run(path, workers=2)
+        self.assertEqual(out, "Imported users: 2. Skipped users: 0. Invalid rows: 0.")
+
+        self.assertTrue(User.objects.get(username="user-1").check_password("passworD123!"))
+        user_2 = User.objects.get(username="user-2")
+        self.assertTrue(user_2.check_password("passworD456!"))
+        self.assertTrue(user_2.is_email_confirmed)
+
+    def test_skip_conflicts(self):
+        User.objects.create_user(username="Test", email="test@gmail.com")
+        path = self._write_csv([
+            "username,email",
+            "TEST,other-1@gmail.com",
+            "other-2,Test@Gmail.com",
+            "user-1,user-1@gmail.com",
+            "User-1,user-2@gmail.com",
+            "user-3,USER-1@gmail.com",
+        ])
+
+        out, err = self._run(path)
+        self.assertEqual(out, "Imported users: 1. Skipped users: 4. Invalid rows: 0.")
+        self.assertEqual(
+            set(User.objects.values_list("username", flat=True)),
+            {"Test", "user-1"}
+        )
+
+    def test_invalid_rows(self):
+        path = self._write_ndjson([
+            {"username": "user-1"},
+            {"username": "user-2", "email": "invalid"},
+            {"username": "user 3", "email": "user-3@gmail.com"},
+            {"username": "user-4", "email": "user-4@gmail.com"},
+        ])
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("[]\n")
+
+        out, err = self._run(path)
+        self.assertEqual(out, "Imported users: 1. Skipped users: 0. Invalid rows: 4.")
+        self.assertEqual(
+            err.splitlines(),
+            [
+                "Row 1: email: This field cannot be blank.",
+                "Row 2: email: Enter a valid email address.",
+                "Row 3: username: Enter a valid username. This value may contain only letters, "
+                "numbers, and @/./+/-/_ characters.",
+                "Row 5: username: This field cannot be blank.; email: This field cannot be blank.",
+            ]
+        )
+        self.assertTrue(User.objects.filter(username="user-4").exists())
+
+    def test_batches(self):
+        path = self._write_csv(["username,email"] + [f"user-{i},user-{i}@gmail.com" for i in range(0, 5)])
+
+        out, err = self._run(path, batch_size=2)
+        self.assertEqual(out, "Imported users: 5. Skipped users: 0. Invalid rows: 0.")
+        self.assertEqual(User.objects.count(), 5)
+
+    def test_send_confirm_emails(self):
+        path = self._write_csv([
+            "username,email,is_email_confirmed",
+            "user-1,user-1@gmail.com,0",
+            "user-2,user-2@gmail.com,1",
+            "user-3,user-3@gmail.com,0",
+        ])
+
+        self._run(path, batch_size=2, send_confirm_emails=True)
+
+        jobs = NotificationJob.objects.filter(action="USER_CONFIRM_EMAIL")
+        self.assertEqual(
+            sorted(job.kwargs["data"]["email"] for job in jobs),
+            ["user-1@gmail.com", "user-3@gmail.com"]
+        )
+
+    def test_send_confirm_emails_insert_per_batch(self):
+        path = self._write_csv(["username,email"] + [f"user-{i},user-{i}@gmail.com" for i in range(0, 4)])
+
+        with CaptureQueriesContext(connection) as context:
+            self._run(path, batch_size=2, send_confirm_emails=True)
+
+        inserts = [
+            query for query in context.captured_queries
+            if query["sql"].startswith(f'INSERT INTO "{NotificationJob._meta.db_table}"')
+        ]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(NotificationJob.objects.filter(action="USER_CONFIRM_EMAIL").count(), 4)
+
+    def test_errors_reported_as_they_occur(self):
+        errors = []
+
+        def rows():
+            yield {"username": "user-1"}
+            # The error of the first batch is reported before the next batch is read.
+            self.assertEqual(len(errors), 1)
+            yield {"username": "user-2", "email": "user-2@gmail.com"}
+
+        stats = UserImportService.import_rows(rows(), batch_size=1, workers=0, on_error=errors.append)
+        self.assertEqual(stats.invalid, 1)
+        self.assertEqual(errors, ["Row 1: email: This field cannot be blank."])
+
+    def test_no_confirm_emails_by_default(self):
+        path = self._write_csv(["username,email", "user-1,user-1@gmail.com"])
+
+        self._run(path)
+        self.assertFalse(NotificationJob.objects.exists())
+
+    def test_unknown_format(self):
+        path = self._write("", ".txt")
+
+        with self.assertRaises(CommandError):
+            self._run(path)
+        self._run(path, format="csv")
@@ -0,0 +1,39 @@
+import datetime
+
+from django.test import TestCase, tag
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from common.tests.mixins import QueryPlanTestCaseMixin
+from users.models import User
+from users.services.token import TokenService
+
+
+@tag("query-plan-tests", "auth")
+class TokenPurgeQueryPlanTestCase(TestCase, QueryPlanTestCaseMixin):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        user = User.objects.create_user(email="test-1@gmail.com", username="test-1")
+        now = timezone.now()
+        OutstandingToken.objects.bulk_create([
+            OutstandingToken(
+                user=user,
+                jti=f"jti-{i}",
+                token=f"token-{i}",
+                expires_at=now + datetime.timedelta(minutes=i - 100)
+            )
+            for i in range(0, 1000)
+        ])
+
+    def test_purge_expired(self):
+        plans = self._get_plans(
+            lambda: TokenService.purge_expired(batch_size=50),
+            table=OutstandingToken._meta.db_table
+        )
+        self.assertTrue(plans)
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "users_outstandingtoken_expires_at_idx")
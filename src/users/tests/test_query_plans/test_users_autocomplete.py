@@ -0,0 +1,49 @@
+from django.test import tag
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common.tests.mixins import QueryPlanTestCaseMixin
+from users.models import User
+
+
+@tag("query-plan-tests", "users")
+class UserAutocompleteQueryPlanTestCase(APITestCase, QueryPlanTestCaseMixin):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        users = User.objects.bulk_create([
+            User(email=f"test-{i}@gmail.com", username=f"user-{i}")
+            for i in range(0, 1000)
+        ])
+        cls.user = users[0]
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.client.force_authenticate(user=self.user, token=str(RefreshToken.for_user(self.user).access_token))
+
+        self.url = "/api/v1/users/autocomplete"
+
+    def test_prefix(self):
+        plans = self._get_plans(
+            lambda: self.assertEqual(self.client.get(self.url, data={"search": "User-4"}).status_code, 200),
+            table=User._meta.db_table
+        )
+        self.assertEqual(len(plans), 1)
+        self.assertNoSeqScan(plans[0])
+        self.assertIndexUsed(plans[0], "users_user_username_prefix_idx")
+        # The prefix matches are read in the index order up to the limit.
+        self.assertNotIn("Sort", {node["Node Type"] for node in self._get_nodes(plans[0])})
+
+    def test_fuzzy(self):
+        plans = self._get_plans(
+            lambda: self.assertEqual(self.client.get(self.url, data={"search": "usr-42"}).status_code, 200),
+            table=User._meta.db_table
+        )
+        self.assertEqual(len(plans), 2)
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+        self.assertIndexUsed(plans[0], "users_user_username_prefix_idx")
+        self.assertIndexUsed(plans[1], "users_user_username_trgm_idx")
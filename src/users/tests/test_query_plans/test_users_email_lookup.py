@@ -0,0 +1,29 @@
+from django.test import tag
+from rest_framework.test import APITestCase
+
+from common.tests.mixins import QueryPlanTestCaseMixin
+from users.models import User
+from users.services.auth import AuthService
+
+
+@tag("query-plan-tests", "users")
+class UserEmailLookupQueryPlanTestCase(APITestCase, QueryPlanTestCaseMixin):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        User.objects.bulk_create([
+            User(email=f"test-{i}@gmail.com", username=f"user-{i}")
+            for i in range(0, 1000)
+        ])
+
+    def test_get_user_by_email(self):
+        plans = self._get_plans(
+            lambda: self.assertIsNotNone(AuthService.get_user_by_email("TEST-42@gmail.com")),
+            table=User._meta.db_table
+        )
+        self.assertTrue(plans)
+        for plan in plans:
+            self.assertNoSeqScan(plan)
+            self.assertIndexUsed(plan, "users_user_email_lower_uniq")
@@ -0,0 +1,177 @@
+import datetime
+import threading
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings, tag
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from users.models import User
+from users.services.token import TokenService
+
+
+class _BaseTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = User.objects.create_user(
+            username="test",
+            email="example@gmail.com",
+            password="test-password"
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        TokenService.reset_revocation_filter()
+        self.addCleanup(TokenService.reset_revocation_filter)
+
+    def _create_tokens(self, prefix: str, count: int, expires_at: datetime.datetime, blacklisted: bool):
+        tokens = OutstandingToken.objects.bulk_create([
+            OutstandingToken(
+                user=self.user,
+                jti=f"{prefix}-{i}",
+                token=f"{prefix}-{i}",
+                expires_at=expires_at
+            )
+            for i in range(0, count)
+        ])
+        if blacklisted:
+            BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token) for token in tokens])
+        return tokens
+
+
+@tag("unit-tests", "auth")
+class TokenServicePurgeExpiredTestCase(_BaseTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        now = timezone.now()
+        self._create_tokens("expired", 3, now - datetime.timedelta(days=1), blacklisted=False)
+        self._create_tokens("expired-blacklisted", 2, now - datetime.timedelta(days=1), blacklisted=True)
+        self._create_tokens("active", 2, now + datetime.timedelta(days=1), blacklisted=False)
+        self._create_tokens("active-blacklisted", 2, now + datetime.timedelta(days=1), blacklisted=True)
+
+    def test_purge(self):
+        self.assertEqual(TokenService.purge_expired(batch_size=100), 5)
+
+        self.assertEqual(
+            set(OutstandingToken.objects.values_list("jti", flat=True)),
+            {"active-0", "active-1", "active-blacklisted-0", "active-blacklisted-1"}
+        )
+        self.assertEqual(
+            set(BlacklistedToken.objects.values_list("token__jti", flat=True)),
+            {"active-blacklisted-0", "active-blacklisted-1"}
+        )
+
+    def test_batch_size(self):
+        self.assertEqual(TokenService.purge_expired(batch_size=2), 2)
+        self.assertEqual(OutstandingToken.objects.count(), 7)
+
+    def test_command(self):
+        out = StringIO()
+        call_command("purge_expired_tokens", batch_size=2, stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Purged tokens: 5.")
+        self.assertEqual(OutstandingToken.objects.count(), 4)
+        self.assertEqual(BlacklistedToken.objects.count(), 2)
+
+
+@tag("unit-tests", "auth")
+class TokenServiceRevocationFilterTestCase(_BaseTestCase):
+
+    def test_blacklisted(self):
+        now = timezone.now()
+        self._create_tokens("active-blacklisted", 2, now + datetime.timedelta(days=1), blacklisted=True)
+        self._create_tokens("active", 2, now + datetime.timedelta(days=1), blacklisted=False)
+
+        self.assertTrue(TokenService.might_be_revoked("active-blacklisted-0"))
+        self.assertTrue(TokenService.might_be_revoked("active-blacklisted-1"))
+        self.assertFalse(TokenService.might_be_revoked("active-0"))
+
+    def test_built_once(self):
+        TokenService.might_be_revoked("sample")
+
+        with self.assertNumQueries(0):
+            self.assertFalse(TokenService.might_be_revoked("sample"))
+
+    def test_add_revoked(self):
+        self.assertFalse(TokenService.might_be_revoked("sample"))
+
+        TokenService.add_revoked("sample")
+        self.assertTrue(TokenService.might_be_revoked("sample"))
+
+    @override_settings(USERS_REVOCATION_FILTER_TTL=0)
+    def test_rebuild(self):
+        self.assertFalse(TokenService.might_be_revoked("active-blacklisted-0"))
+
+        self._create_tokens("active-blacklisted", 1, timezone.now() + datetime.timedelta(days=1), blacklisted=True)
+        self.assertTrue(TokenService.might_be_revoked("active-blacklisted-0"))
+
+    def test_added_while_building(self):
+        build = TokenService._build_revocation_filter
+
+        def build_and_revoke():
+            revocation_filter = build()
+            TokenService.add_revoked("sample")
+            return revocation_filter
+
+        with patch.object(TokenService, "_build_revocation_filter", side_effect=build_and_revoke):
+            TokenService.rebuild_revocation_filter()
+        self.assertTrue(TokenService.might_be_revoked("sample"))
+
+
+@tag("unit-tests", "auth")
+@override_settings(USERS_REVOCATION_FILTER_BACKGROUND=True)
+class TokenServiceRevocationFilterBackgroundTestCase(TransactionTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        TokenService.reset_revocation_filter()
+        self.addCleanup(TokenService.reset_revocation_filter)
+
+        self.user = User.objects.create_user(
+            username="test",
+            email="example@gmail.com",
+            password="test-password"
+        )
+
+    def _blacklist(self, jti: str):
+        token = OutstandingToken.objects.create(
+            user=self.user,
+            jti=jti,
+            token=jti,
+            expires_at=timezone.now() + datetime.timedelta(days=1)
+        )
+        BlacklistedToken.objects.create(token=token)
+
+    def _wait_rebuild(self):
+        for thread in threading.enumerate():
+            if thread.name == "revocation-filter":
+                thread.join(timeout=10)
+
+    def test_first_build(self):
+        self._blacklist("blacklisted")
+
+        # Every token is checked in the table until the filter is built.
+        with self.assertNumQueries(0):
+            self.assertTrue(TokenService.might_be_revoked("sample"))
+        self._wait_rebuild()
+
+        self.assertFalse(TokenService.might_be_revoked("sample"))
+        self.assertTrue(TokenService.might_be_revoked("blacklisted"))
+
+    def test_old_filter_served(self):
+        TokenService.rebuild_revocation_filter()
+        self._blacklist("blacklisted")
+
+        with override_settings(USERS_REVOCATION_FILTER_TTL=0), self.assertNumQueries(0):
+            self.assertFalse(TokenService.might_be_revoked("blacklisted"))
+        self._wait_rebuild()
+
+        self.assertTrue(TokenService.might_be_revoked("blacklisted"))
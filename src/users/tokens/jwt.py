@@ -0,0 +1,29 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.services.token import TokenService
+
+
+class UserRefreshToken(RefreshToken):
+    """
+    Refresh token with a cheaper blacklist check.
+
+    The blacklist table is queried only for the tokens matched by the revocation filter of `TokenService`.
+    A token blacklisted after the filter was built is caught by `blacklist`, which is called on every refresh
+    with `ROTATE_REFRESH_TOKENS` and `BLACKLIST_AFTER_ROTATION`, otherwise the table is always queried.
+    """
+
+    def check_blacklist(self) -> None:
+        if not (api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION):
+            return super().check_blacklist()
+        if TokenService.might_be_revoked(self.payload[api_settings.JTI_CLAIM]):
+            return super().check_blacklist()
+
+    def blacklist(self):
+        blacklisted_token, created = super().blacklist()
+        TokenService.add_revoked(self.payload[api_settings.JTI_CLAIM])
+        if not created:
+            raise TokenError(_("Token is blacklisted"))
+        return blacklisted_token, created